@@ -2,6 +2,7 @@ import json
 
 import requests
 
+from utility.http_session import DEFAULT_RETRIES, request
 from utility.log import Log
 
 LOG = Log(__name__)
@@ -31,9 +32,16 @@ class InternalServerError(Exception):
 
 
 class Api:
-    """Interface for request API methods"""
+    """Interface for request API methods
+
+    The requests are sent over the connection pooled session shared by all
+    the API objects of an endpoint.
+    """
+
+    def __init__(self, url, api, retries=DEFAULT_RETRIES):
+        # Number of retries on connection failures
+        self.retries = retries
 
-    def __init__(self, url, api):
         # Disable insecure request warning in response
         requests.packages.urllib3.disable_warnings(
             requests.packages.urllib3.exceptions.InsecureRequestWarning
@@ -92,7 +100,7 @@ class Api:
             params["auth"] = auth
             LOG.info(f"Request AUTH - {auth}")
 
-        response = requests.get(**params)
+        response = request("get", retries=self.retries, **params)
         if check_sc:
             return self._response(response)
 
@@ -128,7 +136,7 @@ class Api:
             params["auth"] = auth
             LOG.info(f"Request AUTH - {auth}")
 
-        response = requests.post(**params)
+        response = request("post", retries=self.retries, **params)
         if check_sc:
             return self._response(response)
 
@@ -167,7 +175,7 @@ class Api:
             params["auth"] = auth
             LOG.info(f"Request AUTH - {auth}")
 
-        response = requests.delete(**params)
+        response = request("delete", retries=self.retries, **params)
         if check_sc:
             return self._response(response)
 
@@ -203,7 +211,7 @@ class Api:
             params["auth"] = auth
             LOG.info(f"Request AUTH - {auth}")
 
-        response = requests.patch(**params)
+        response = request("patch", retries=self.retries, **params)
         if check_sc:
             return self._response(response)
 
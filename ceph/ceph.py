@@ -1,12 +1,16 @@
 """This module implements the required foundation data structures for testing."""
 
+import codecs
 import datetime
+import io
 import json
 import pickle
 import random
 import re
+import select
 import socket
-from distutils.version import LooseVersion
+import threading
+from contextlib import contextmanager
 from time import sleep, time
 
 import paramiko
@@ -14,13 +18,21 @@ import requests
 import yaml
 
 from ceph.parallel import parallel
+from ceph.waiter import Backoff, watch_stream
 from cli.ceph.ceph import Ceph as CephCli
 from utility import lvm_utils
+from utility.lazy_import import lazy_import
 from utility.log import Log
 from utility.utils import custom_ceph_config
 
 logger = Log(__name__)
 
+# Prefix of the facts printed by the node setup script in connect
+FACT_MARKER = "CEPHCI_FACT"
+
+# distutils is provided by setuptools in the recent Python versions
+distutils_version = lazy_import("distutils.version")
+
 
 class SocketTimeoutException(Exception):
     pass
@@ -85,7 +97,7 @@ class Ceph(object):
             LooseVersion: rhcs version of given cluster
 
         """
-        return LooseVersion(
+        return distutils_version.LooseVersion(
             str(
                 self.__rhcs_version
                 if self.__rhcs_version
@@ -705,25 +717,29 @@ class Ceph(object):
                 else self.get_ceph_object("mon")
             )
 
-        timeout = datetime.timedelta(seconds=timeout)
-        starttime = datetime.datetime.now()
-        pending_states = ["peering", "activating", "creating"]
-        valid_states = ["active+clean"]
-
-        out = str()
-        while datetime.datetime.now() - starttime <= timeout:
-            cmd = "ceph -s"
+        def ceph_cmd(args):
+            cmd = f"ceph {args}"
             if cluster_name is not None:
                 cmd += f" --cluster {cluster_name}"
             if pacific:
                 cmd = f"cephadm shell -- {cmd}"
+            return cmd
 
-            out, _ = client.exec_command(cmd=cmd, sudo=True)
+        starttime = time()
+        pending_states = ["peering", "activating", "creating"]
+        valid_states = ["active+clean"]
+
+        # Follow the PG map updates instead of polling the status
+        watch_stream(client, ceph_cmd("-w --watch-debug"), pgmap_clean, timeout)
+
+        out = str()
+        remaining = max(timeout - (time() - starttime), 0)
+        for _ in Backoff(timeout=remaining, initial=1, maximum=5):
+            out, _ = client.exec_command(cmd=ceph_cmd("-s"), sudo=True)
 
             if not any(state in out for state in pending_states):
                 if all(state in out for state in valid_states):
                     break
-            sleep(5)
         logger.info(out)
         if not all(state in out for state in valid_states):
             logger.error("Valid States are not found in the health check")
@@ -1156,8 +1172,160 @@ def check_timeout(end_time, timeout):
         raise TimeoutException("Command exceed the allocated execution time.")
 
 
+class StreamReader(object):
+    """Incrementally reads one stream (stdout or stderr) of a paramiko channel.
+
+    The received bytes are decoded with an incremental UTF-8 decoder, hence
+    multi-byte characters split across two reads are decoded correctly. The
+    decoded text is either collected as a list of chunks that is joined once,
+    written to a spool file or handed line by line to a callback. In the last
+    two modes the output is never held in memory.
+
+    The receive window starts small and grows while the reads keep filling it,
+    so large outputs are read with few calls.
+
+    When the callback returns True, the reader is marked as stopped and no more
+    data is read, this allows watching a never-ending stream till an event.
+    """
+
+    min_window = 4096
+    max_window = 1048576
+
+    def __init__(self, channel, stderr=False, log=True, callback=None, spool=None):
+        """Initialize the reader.
+
+        Args:
+          channel: the paramiko.Channel object to be used for reading.
+          stderr: read from the stderr stream. Default is False.
+          log: log the output. Default is True.
+          callback: method called with every line of output.
+          spool: file object to which the output is written.
+        """
+        self.stopped = False
+        self.stderr = stderr
+        self.log = log
+        self.callback = callback
+        self.spool = spool
+        self.window = self.min_window
+
+        self._recv = channel.recv_stderr if stderr else channel.recv
+        self._ready = channel.recv_stderr_ready if stderr else channel.recv_ready
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._chunks = []
+        self._line = ""
+
+    @property
+    def output(self):
+        """Return the collected output, empty when streaming."""
+        return "".join(self._chunks)
+
+    def read(self, end_time, timeout, until_eof=False):
+        """Reads the data available in the stream.
+
+        Args:
+          end_time: maximum allocated time for reading from the channel.
+          timeout: Flag to check if timeout must be enforced.
+          until_eof: block till the remote end closes the stream.
+
+        Raises:
+          TimeoutException: if reading from the channel exceeds the allocated time.
+        """
+        while (until_eof or self._ready()) and not self.stopped:
+            _data = self._recv(self.window)
+            if not _data:
+                break
+
+            if len(_data) == self.window:
+                self.window = min(self.window * 2, self.max_window)
+
+            self._consume(self._decoder.decode(_data))
+            check_timeout(end_time, timeout)
+
+    def close(self):
+        """Flush the decoder and the pending partial line."""
+        self._consume(self._decoder.decode(b"", final=True))
+        if self._line:
+            self._emit_line(self._line)
+            self._line = ""
+
+    def _consume(self, text):
+        if not text:
+            return
+
+        if self.spool:
+            self.spool.write(text)
+        elif not self.callback:
+            self._chunks.append(text)
+
+        if not (self.log or self.callback):
+            return
+
+        lines = (self._line + text).split("\n")
+        self._line = lines.pop()
+        for _ln in lines:
+            self._emit_line(_ln)
+
+    def _emit_line(self, line):
+        line = line.rstrip("\r")
+        if self.log:
+            _log = logger.error if self.stderr else logger.debug
+            _log(line)
+
+        if self.callback and self.callback(line) is True:
+            self.stopped = True
+
+
+class ChannelStdout(io.RawIOBase):
+    """Binary stdout of a channel, draining stderr while waiting for data.
+
+    The stderr data shares the flow control window of the channel, left unread
+    it stalls the remote command and in turn the reader waiting on stdout.
+    """
+
+    def __init__(self, channel, end_time, timeout, interval=0.1):
+        """Initialize the stdout of the channel.
+
+        Args:
+          channel: the paramiko.Channel object to be used for reading.
+          end_time: maximum allocated time for reading from the channel.
+          timeout: Flag to check if timeout must be enforced.
+          interval: upper bound in seconds between the stderr reads.
+        """
+        super(ChannelStdout, self).__init__()
+        self.channel = channel
+        self.end_time = end_time
+        self.timeout = timeout
+        self.interval = interval
+        self.stderr = StreamReader(channel, stderr=True, log=False)
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        while not (self.channel.recv_ready() or self.channel.eof_received):
+            self.stderr.read(self.end_time, self.timeout)
+            wait_for_channel(self.channel, self.end_time, self.timeout, self.interval)
+
+        self.stderr.read(self.end_time, self.timeout)
+        data = self.channel.recv(len(buffer))
+        buffer[: len(data)] = data
+        return len(data)
+
+    def drain(self):
+        """Discard the rest of stdout, even when the handler closed the file."""
+        buffer = bytearray(65536)
+        while self.readinto(buffer):
+            pass
+
+    def read_stderr(self):
+        """Read stderr till the end of stream and return it."""
+        self.stderr.read(self.end_time, self.timeout, until_eof=True)
+        self.stderr.close()
+        return self.stderr.output
+
+
 def read_stream(channel, end_time, timeout, stderr=False, log=True):
-    """Reads the data from the given channel.
+    """Reads the data from the given channel till the end of stream.
 
     Args:
       channel: the paramiko.Channel object to be used for reading.
@@ -1172,21 +1340,137 @@ def read_stream(channel, end_time, timeout, stderr=False, log=True):
     Raises:
       TimeoutException: if reading from the channel exceeds the allocated time.
     """
-    _output = ""
-    _stream = channel.recv_stderr if stderr else channel.recv
-    _data = _stream(2048)
+    reader = StreamReader(channel, stderr=stderr, log=log)
+    reader.read(end_time, timeout, until_eof=True)
+    reader.close()
+
+    return reader.output
+
+
+def wait_for_channel(channel, end_time, timeout, interval=1):
+    """Blocks until the channel has data to read, reached EOF or has exited.
+
+    Unlike a fixed sleep, the wait returns as soon as the remote side produces
+    output or closes the streams, so short commands complete in milliseconds.
+
+    Args:
+      channel: the paramiko.Channel object to wait on.
+      end_time: maximum allocated time for the command.
+      timeout: Flag to check if timeout must be enforced.
+      interval: upper bound in seconds for a single wait.
+    """
+    if timeout:
+        remaining = (end_time - datetime.datetime.now()).total_seconds()
+        interval = max(min(interval, remaining), 0)
 
-    while _data:
-        _output += _data.decode("utf-8")
-        if log:
-            for _ln in _data.splitlines():
-                _log = logger.error if stderr else logger.debug
-                _log(_ln.decode("utf-8"))
+    if channel.eof_received:
+        # The pipe behind fileno stays readable after EOF, wait on the exit
+        # status instead of spinning on select.
+        channel.status_event.wait(interval)
+        return
 
-        check_timeout(end_time, timeout)
-        _data = _stream(2048)
+    select.select([channel], [], [], interval)
 
-    return _output
+
+class CommandStats(object):
+    """Latency counters of the commands executed over a connection.
+
+    Commands are grouped by their leading words (sudo is ignored), so that
+    ``ceph osd dump -f json`` and ``ceph osd tree`` are reported under
+    ``ceph osd dump`` and ``ceph osd tree`` respectively.
+    """
+
+    key_length = 3
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._stats = {}
+
+    def key(self, cmd):
+        """Return the grouping key of the given command."""
+        words = [w for w in cmd.split() if w != "sudo"]
+        return " ".join(words[: self.key_length])
+
+    def record(self, cmd, duration):
+        """Record the execution time (in seconds) of the given command."""
+        key = self.key(cmd)
+        with self._lock:
+            count, total, low, high = self._stats.get(key, (0, 0.0, duration, 0.0))
+            self._stats[key] = (
+                count + 1,
+                total + duration,
+                min(low, duration),
+                max(high, duration),
+            )
+
+    def summary(self):
+        """Return the recorded counters as a dictionary keyed by command."""
+        with self._lock:
+            return {
+                key: {
+                    "count": count,
+                    "total": round(total, 3),
+                    "min": round(low, 3),
+                    "max": round(high, 3),
+                    "avg": round(total / count, 3),
+                }
+                for key, (count, total, low, high) in self._stats.items()
+            }
+
+    def reset(self):
+        """Clear all the recorded counters."""
+        with self._lock:
+            self._stats.clear()
+
+
+def parse_node_facts(output):
+    """
+    Return the facts printed by the node setup script.
+
+    The facts are printed as "<FACT_MARKER> key=value" lines, the other lines
+    of the output, like uptime, date or the login banners, are ignored.
+
+    Args:
+        output (str): output of the node setup script
+
+    Returns:
+        dict of the fact values keyed by the fact name
+    """
+    facts = dict()
+    for line in output.splitlines():
+        marker, _, fact = line.strip().partition(" ")
+        if marker == FACT_MARKER and "=" in fact:
+            key, value = fact.split("=", 1)
+            facts[key] = value.strip()
+
+    return facts
+
+
+def pgmap_clean(line):
+    """
+    Return True when the PG map update line reports all the PGs active+clean.
+
+    The PG map updates are printed by "ceph -w --watch-debug" like
+    "pgmap v42: 33 pgs: 32 active+clean, 1 peering; 449 KiB data, ...".
+
+    Args:
+        line (str): line of the cluster log
+
+    Returns:
+        bool
+    """
+    match = re.search(r"pgmap v\d+: (\d+) pgs: ([^;]*);", line)
+    if not match:
+        return False
+
+    clean = 0
+    for entry in match.group(2).split(","):
+        count, _, state = entry.strip().partition(" ")
+        if state != "active+clean":
+            return False
+        clean += int(count)
+
+    return clean == int(match.group(1))
 
 
 class RolesContainer(object):
@@ -1263,6 +1547,14 @@ class NodeVolume(object):
 
 
 class SSHConnectionManager(object):
+    """Manages a reusable SSH transport with a bounded pool of sessions.
+
+    A single transport is kept per connection and re-established on outages.
+    Commands are executed on channels multiplexed over that transport, the
+    number of concurrently open channels being limited by max_sessions to stay
+    within the MaxSessions limit of the remote sshd.
+    """
+
     def __init__(
         self,
         ip_address,
@@ -1271,6 +1563,8 @@ class SSHConnectionManager(object):
         look_for_keys=False,
         private_key_file_path="",
         outage_timeout=600,
+        max_sessions=8,
+        keepalive=15,
     ):
         self.ip_address = ip_address
         self.username = username
@@ -1286,6 +1580,10 @@ class SSHConnectionManager(object):
         self.__transport = None
         self.__outage_start_time = None
         self.outage_timeout = datetime.timedelta(seconds=outage_timeout)
+        self.max_sessions = max_sessions
+        self.keepalive = keepalive
+        self.__sessions = threading.BoundedSemaphore(max_sessions)
+        self.stats = CommandStats()
 
     @property
     def client(self):
@@ -1295,6 +1593,7 @@ class SSHConnectionManager(object):
         if not (self.__transport and self.__transport.is_active()):
             self.__connect()
             self.__transport = self.__client.get_transport()
+            self.__transport.set_keepalive(self.keepalive)
 
         return self.__client
 
@@ -1331,12 +1630,44 @@ class SSHConnectionManager(object):
         self.__transport = self.client.get_transport()
         return self.__transport
 
+    @contextmanager
+    def session(self, timeout=None):
+        """Open a channel on the shared transport within the session limit.
+
+        The call blocks when max_sessions channels are already in use and the
+        channel is closed when the context exits.
+
+        Args:
+          timeout: seconds to wait for the channel to be opened.
+
+        Yields:
+          paramiko.Channel
+        """
+        with self.__sessions:
+            channel = self.transport.open_session(timeout=timeout)
+            try:
+                yield channel
+            finally:
+                channel.close()
+
     def __getstate__(self):
         pickle_dict = self.__dict__.copy()
         del pickle_dict["_SSHConnectionManager__transport"]
         del pickle_dict["_SSHConnectionManager__client"]
+        del pickle_dict["_SSHConnectionManager__sessions"]
+        del pickle_dict["stats"]
         return pickle_dict
 
+    def __setstate__(self, pickle_dict):
+        self.__dict__.update(pickle_dict)
+        self.__client = paramiko.SSHClient()
+        self.__client.set_missing_host_key_policy(paramiko.MissingHostKeyPolicy())
+        self.__transport = None
+        self.max_sessions = pickle_dict.get("max_sessions", 8)
+        self.keepalive = pickle_dict.get("keepalive", 15)
+        self.__sessions = threading.BoundedSemaphore(self.max_sessions)
+        self.stats = CommandStats()
+
 
 class CephNode(object):
     class LvmConfig(object):
@@ -1369,6 +1700,7 @@ class CephNode(object):
         self.vmname = kw["hostname"]
         self.ceph_nodename = kw["ceph_nodename"]
         self.vmshortname = self.vmname.split(".")[0]
+        self.max_sessions = kw.get("max_sessions", 8)
 
         if kw.get("ceph_vmnode"):
             self.vm_node = kw["ceph_vmnode"]
@@ -1404,6 +1736,7 @@ class CephNode(object):
             self.root_passwd,
             look_for_keys=self.look_for_key,
             private_key_file_path=self.private_key_path,
+            max_sessions=self.max_sessions,
         )
         self.connection = SSHConnectionManager(
             self.ip_address,
@@ -1411,6 +1744,7 @@ class CephNode(object):
             self.password,
             look_for_keys=self.look_for_key,
             private_key_file_path=self.private_key_path,
+            max_sessions=self.max_sessions,
         )
         self.rssh = self.root_connection.get_client
         self.rssh_transport = self.root_connection.get_transport
@@ -1469,6 +1803,10 @@ class CephNode(object):
         eg: self.connect()
         - setup tcp keepalive to max retries for active connection
         - set up hostname and shortname as attributes for tests to query
+
+        The node setup is performed using one script per user (root and the
+        test user), the facts printed by the user script are parsed using
+        parse_node_facts to set hostname, shortname, internal_ip and pkg_type.
         """
         logger.info(
             "Connecting {host_name} / {ip_address}".format(
@@ -1476,40 +1814,51 @@ class CephNode(object):
             )
         )
 
-        self.rssh().exec_command("dmesg")
-        self.rssh_transport().set_keepalive(15)
-        _, stdout, stderr = self.rssh().exec_command(
-            f"echo '{self.username}:{self.password}' | chpasswd"
-        )
+        # The credentials are fed on stdin using the non logging root channel
+        stdin, stdout, _ = self.rssh().exec_command("chpasswd")
+        stdin.write(f"{self.username}:{self.password}\nroot:{self.root_passwd}\n")
+        stdin.channel.shutdown_write()
         logger.info(stdout.readlines())
-        _, stdout, stderr = self.rssh().exec_command(
-            f"echo 'root:{self.root_passwd}' | chpasswd"
+
+        root_script = " ; ".join(
+            [
+                "dmesg > /dev/null",
+                "echo 120 > /proc/sys/net/ipv4/tcp_keepalive_time",
+                "echo 60 > /proc/sys/net/ipv4/tcp_keepalive_intvl",
+                "echo 20 > /proc/sys/net/ipv4/tcp_keepalive_probes",
+            ]
         )
-        logger.info(stdout.readlines())
-        self.rssh().exec_command("echo 120 > /proc/sys/net/ipv4/tcp_keepalive_time")
-        self.rssh().exec_command("echo 60 > /proc/sys/net/ipv4/tcp_keepalive_intvl")
-        self.rssh().exec_command("echo 20 > /proc/sys/net/ipv4/tcp_keepalive_probes")
-        self.exec_command(cmd="ls / ; uptime ; date")
-        self.ssh_transport().set_keepalive(15)
-        if self.vm_node.node_type == "baremetal":
-            out, err = self.exec_command(cmd="hostname -s")
-        else:
-            out, err = self.exec_command(cmd="hostname")
-        self.hostname = out.strip()
+        out, err = self.exec_command(sudo=True, cmd=root_script, check_ec=False)
+        logger.info(out or err)
+
+        hostname = (
+            "hostname -s" if self.vm_node.node_type == "baremetal" else "hostname"
+        )
+        user_script = " ; ".join(
+            [
+                "ls / > /dev/null ; uptime ; date",
+                f'echo "{FACT_MARKER} hostname=$({hostname})"',
+                f"echo \"{FACT_MARKER} internal_ip=$(/sbin/ifconfig eth0 | grep 'inet ' | awk '{{ print $2}}')\"",
+                "echo 'TMOUT=600' >> ~/.bashrc",
+                f"[ -f /etc/redhat-release ] && echo '{FACT_MARKER} pkg_type=rpm' "
+                f"|| echo '{FACT_MARKER} pkg_type=deb'",
+            ]
+        )
+        out, err = self.exec_command(cmd=user_script)
+        facts = parse_node_facts(out)
+        if not facts.get("hostname"):
+            raise CommandFailed(
+                f"Node setup facts are missing on {self.ip_address}\n"
+                f"out: {out}\nerr: {err}"
+            )
 
-        shortname = self.hostname.split(".")
-        self.shortname = shortname[0]
+        self.hostname = facts["hostname"]
+        self.shortname = self.hostname.split(".")[0]
+        self.internal_ip = facts.get("internal_ip", "")
+        self.pkg_type = facts.get("pkg_type", "deb")
         logger.info(
             "hostname and shortname set to %s and %s", self.hostname, self.shortname
         )
-        self.set_internal_ip()
-        self.exec_command(cmd="echo 'TMOUT=600' >> ~/.bashrc")
-        self.exec_command(cmd="[ -f /etc/redhat-release ]", check_ec=False)
-
-        if self.exit_status == 0:
-            self.pkg_type = "rpm"
-        else:
-            self.pkg_type = "deb"
 
         logger.info("finished connect")
         self.run_once = True
@@ -1555,7 +1904,7 @@ class CephNode(object):
         cmd = kw["cmd"]
         _end_time = None
         _verbose = kw.get("verbose", False)
-        ssh = self.rssh if kw.get("sudo") else self.ssh
+        connection = self.root_connection if kw.get("sudo") else self.connection
         long_running = kw.get("long_running", False)
         if "timeout" in kw:
             timeout = None if kw["timeout"] == "notimeout" else kw["timeout"]
@@ -1563,70 +1912,89 @@ class CephNode(object):
             # Set defaults if long_running then 1h else 5m
             timeout = 3600 if kw.get("long_running", False) in kw else 300
 
-        try:
-            channel = ssh().get_transport().open_session(timeout=timeout)
-            channel.settimeout(timeout)
-
-            logger.info(f"Execute {cmd} on {self.ip_address}")
-            _exec_start_time = datetime.datetime.now()
-            channel.exec_command(cmd)
+        # Check the streams for data and log in debug mode only if it
+        # is a long running command else don't log.
+        # Fixme: logging must happen in debug irrespective of type.
+        _verbose = True if long_running else _verbose
 
-            if timeout:
-                _end_time = datetime.datetime.now() + datetime.timedelta(
-                    seconds=timeout
-                )
+        _spool = kw.get("spool")
+        _spool_file = (
+            open(_spool, "w", encoding="utf-8") if isinstance(_spool, str) else _spool
+        )
 
-            _out = ""
-            _err = ""
-            while not channel.exit_status_ready():
-                # Prevent high resource consumption
-                sleep(1)
-
-                # Check the streams for data and log in debug mode only if it
-                # is a long running command else don't log.
-                # Fixme: logging must happen in debug irrespective of type.
-                _verbose = True if long_running else _verbose
-                if channel.recv_ready():
-                    _out += read_stream(channel, _end_time, timeout, log=_verbose)
-
-                if channel.recv_stderr_ready():
-                    _err += read_stream(
-                        channel, _end_time, timeout, stderr=True, log=_verbose
-                    )
+        try:
+            with connection.session(timeout=timeout) as channel:
+                channel.settimeout(timeout)
 
-                check_timeout(_end_time, timeout)
+                logger.info(f"Execute {cmd} on {self.ip_address}")
+                _exec_start_time = datetime.datetime.now()
+                channel.exec_command(cmd)
 
-            _time = (datetime.datetime.now() - _exec_start_time).total_seconds()
-            logger.info(
-                f"Execution of {cmd} on {self.ip_address} took {_time} seconds."
-            )
+                if timeout:
+                    _end_time = datetime.datetime.now() + datetime.timedelta(
+                        seconds=timeout
+                    )
 
-            # Check for data residues in the channel streams. This is required for the following reasons
-            #   - exit_ready and first line is blank causing data to be None
-            #   - race condition between data read and exit ready
-            try:
-                _new_timeout = datetime.datetime.now() + datetime.timedelta(seconds=10)
-                _out += read_stream(channel, _new_timeout, timeout=True)
-                _err += read_stream(channel, _new_timeout, timeout=True, stderr=True)
-            except CommandFailed:
-                logger.debug("Encountered a timeout during read post execution.")
-            except BaseException as be:
-                logger.debug(
-                    f"Encountered an unknown exception during last read.\n {be}"
+                _out = StreamReader(
+                    channel,
+                    log=_verbose,
+                    callback=kw.get("output_callback"),
+                    spool=_spool_file,
+                )
+                _err = StreamReader(channel, stderr=True, log=_verbose)
+                while not channel.exit_status_ready():
+                    # Wait for the channel to be readable instead of polling
+                    wait_for_channel(channel, _end_time, timeout)
+                    _out.read(_end_time, timeout)
+                    _err.read(_end_time, timeout)
+                    if _out.stopped:
+                        break
+                    check_timeout(_end_time, timeout)
+
+                _time = (datetime.datetime.now() - _exec_start_time).total_seconds()
+                connection.stats.record(cmd, _time)
+                logger.info(
+                    f"Execution of {cmd} on {self.ip_address} took {_time} seconds."
                 )
 
-            _exit = channel.recv_exit_status()
-            return _out, _err, _exit, _time
+                if _out.stopped:
+                    # The command is abandoned, closing the channel terminates it.
+                    logger.info(f"Stopped reading {cmd} on request of the callback.")
+                    return _out.output, _err.output, -1, _time
+
+                # Check for data residues in the channel streams. This is required for the following reasons
+                #   - exit_ready and first line is blank causing data to be None
+                #   - race condition between data read and exit ready
+                try:
+                    _new_timeout = datetime.datetime.now() + datetime.timedelta(
+                        seconds=10
+                    )
+                    _out.log = _err.log = True
+                    _out.read(_new_timeout, timeout=True, until_eof=True)
+                    _err.read(_new_timeout, timeout=True, until_eof=True)
+                except TimeoutException:
+                    logger.debug("Encountered a timeout during read post execution.")
+                except BaseException as be:
+                    logger.debug(
+                        f"Encountered an unknown exception during last read.\n {be}"
+                    )
+
+                _out.close()
+                _err.close()
+                _exit = channel.recv_exit_status()
+                return _out.output, _err.output, _exit, _time
         except socket.timeout as terr:
             logger.error(f"{cmd} failed to execute within {timeout} seconds.")
             raise SocketTimeoutException(terr)
         except TimeoutException as tex:
-            channel.close()
             logger.error(f"{cmd} failed to execute within {timeout}s.")
             raise CommandFailed(tex)
         except BaseException as be:  # noqa
             logger.exception(be)
             raise CommandFailed(be)
+        finally:
+            if isinstance(_spool, str):
+                _spool_file.close()
 
     def exec_command(self, **kw):
         """Execute the given command on the remote host.
@@ -1638,6 +2006,11 @@ class CephNode(object):
           timeout: Max time to wait for command to complete. Default is 600 seconds.
           pretty_print: Bool flag to indicate if the output should be pretty printed.
           verbose: Bool flag to indicate if the command output should be printed.
+          output_callback: Method called with each line of stdout as it arrives,
+                           stdout is not retained in memory. When it returns
+                           True, the command is stopped with exit code -1.
+          spool: File path or file object to which stdout is written as it arrives,
+                 stdout is not retained in memory.
 
         Returns:
           Exit code when long_running is used
@@ -1652,11 +2025,9 @@ class CephNode(object):
             self.exec_cmd(cmd='uptime')
           or
             self.exec_cmd(cmd='background_cmd', check_ec=False)
+          or
+            self.exec_cmd(cmd='ceph pg dump -f json', spool='/tmp/pg_dump.json')
         """
-        if self.run_once:
-            self.ssh_transport().set_keepalive(15)
-            self.rssh_transport().set_keepalive(15)
-
         cmd = kw["cmd"]
         _out, _err, _exit, _time = self.long_running(**kw)
         self.exit_status = _exit
@@ -1706,6 +2077,18 @@ class CephNode(object):
 
         return remote_file
 
+    @property
+    def command_stats(self):
+        """Latency counters of the commands executed on the node.
+
+        Returns:
+          dict: per-connection ("user", "root") command statistics.
+        """
+        return {
+            "user": self.connection.stats.summary(),
+            "root": self.root_connection.stats.summary(),
+        }
+
     def _keep_alive(self):
         while True:
             self.exec_command(cmd="uptime", check_ec=False)
@@ -1731,12 +2114,14 @@ class CephNode(object):
 
     def __setstate__(self, pickle_dict):
         self.__dict__.update(pickle_dict)
+        self.max_sessions = pickle_dict.get("max_sessions", 8)
         self.root_connection = SSHConnectionManager(
             self.ip_address,
             "root",
             self.root_passwd,
             look_for_keys=self.look_for_key,
             private_key_file_path=self.private_key_path,
+            max_sessions=self.max_sessions,
         )
         self.connection = SSHConnectionManager(
             self.ip_address,
@@ -1744,6 +2129,7 @@ class CephNode(object):
             self.password,
             look_for_keys=self.look_for_key,
             private_key_file_path=self.private_key_path,
+            max_sessions=self.max_sessions,
         )
         self.rssh = self.root_connection.get_client
         self.ssh = self.connection.get_client
@@ -2223,6 +2609,42 @@ class CephNode(object):
         client = self.rssh if sudo else self.ssh
         client().open_sftp().get(src, dst)
 
+    def stream_command(self, cmd, handler, sudo=False, timeout=3600):
+        """Execute the command and hand its binary stdout over as it arrives.
+
+        The output is neither decoded nor retained in memory, which suits
+        streaming archives like ``tar -czf - <path>`` back to the runner. The
+        stderr is read while the handler waits on stdout, hence a command
+        writing a lot to stderr can't stall the transfer.
+
+        Args:
+            cmd (str): command to be executed
+            handler (callable): called with the readable stdout file object
+            sudo (bool): Use root access
+            timeout (int): maximum time allowed for the command
+
+        Returns:
+            Tuple having the handler result and the exit code
+        """
+        connection = self.root_connection if sudo else self.connection
+        start = time()
+        end_time = datetime.datetime.now() + datetime.timedelta(seconds=timeout)
+        with connection.session(timeout=timeout) as channel:
+            channel.settimeout(timeout)
+            channel.exec_command(cmd)
+            stdout = ChannelStdout(channel, end_time, timeout)
+            result = handler(io.BufferedReader(stdout, buffer_size=65536))
+
+            # Drain the rest of the streams for the exit status to be delivered
+            stdout.drain()
+            _err = stdout.read_stderr()
+            _exit = channel.recv_exit_status()
+
+        connection.stats.record(cmd, time() - start)
+        if _err:
+            logger.debug(f"{cmd} on {self.ip_address} reported {_err}")
+        return result, _exit
+
     def create_dirs(self, dir_path, sudo=False):
         """Create directory on node
         Args:
@@ -8,8 +8,9 @@ Over here, we create a glue between the CLI and CephCI to allow the QE to write
 scenarios for verifying and validating cephadm.
 """
 
-from typing import Dict
+from typing import Dict, List
 
+from ceph.parallel import parallel
 from cli.utilities.configure import setup_ibm_licence
 from utility.log import Log
 
@@ -19,6 +20,10 @@ from .shell import ShellMixin
 
 logger = Log(__name__)
 
+# Location and port of the package mirror served from the installer node
+MIRROR_DIR = "/var/cache/cephci-mirror"
+MIRROR_PORT = 8099
+
 
 class CephAdmin(BootstrapMixin, ShellMixin, RegistryLoginMixin):
     """
@@ -48,6 +53,8 @@ class CephAdmin(BootstrapMixin, ShellMixin, RegistryLoginMixin):
         self.cluster = cluster
         self.config = config
         self.installer = self.cluster.get_ceph_object("installer")
+        # Process ID of the package mirror HTTP server on the installer node
+        self.mirror_pid = None
 
     def read_cephadm_gen_pub_key(self, ssh_key_path=None):
         """
@@ -112,23 +119,15 @@ class CephAdmin(BootstrapMixin, ShellMixin, RegistryLoginMixin):
                         sn=node.shortname,
                     )
                 )
-                node.exec_command(
-                    sudo=True,
-                    cmd="curl -o /etc/yum.repos.d/rh_hotfix_repo.repo {repo}".format(
-                        repo=hotfix_repo,
-                    ),
-                )
-                node.exec_command(sudo=True, cmd="yum update metadata", check_ec=False)
+            cmd = "curl -o /etc/yum.repos.d/rh_hotfix_repo.repo {repo}".format(
+                repo=hotfix_repo,
+            )
+            cmd += " && (yum update metadata || true)"
         elif repo:
             base_url = repo
             cmd = f"yum-config-manager --add-repo {base_url}"
-            for node in self.cluster.get_nodes():
-                node.exec_command(sudo=True, cmd=cmd)
-
         elif base_url.endswith(".repo"):
             cmd = f"yum-config-manager --add-repo {base_url}"
-            for node in self.cluster.get_nodes():
-                node.exec_command(sudo=True, cmd=cmd)
         else:
             if not base_url.endswith("/"):
                 base_url += "/"
@@ -137,8 +136,10 @@ class CephAdmin(BootstrapMixin, ShellMixin, RegistryLoginMixin):
             else:
                 base_url += "compose/Tools/x86_64/os/"
             cmd = f"yum-config-manager --add-repo {base_url}"
+
+        with parallel() as p:
             for node in self.cluster.get_nodes():
-                node.exec_command(sudo=True, cmd=cmd)
+                p.spawn(node.exec_command, sudo=True, cmd=cmd)
 
     def set_cdn_tool_repo(self, release=None):
         """
@@ -180,11 +181,13 @@ class CephAdmin(BootstrapMixin, ShellMixin, RegistryLoginMixin):
         else:
             repo = rh_cdn_repos[_release][os_major_version]
 
-        for node in self.cluster.get_nodes(ignore="client"):
-            cmd = f"subscription-manager repos --enable={repo}"
-            if ibm_build:
-                cmd = f"yum-config-manager --add-repo {repo}"
-            node.exec_command(sudo=True, cmd=cmd)
+        cmd = f"subscription-manager repos --enable={repo}"
+        if ibm_build:
+            cmd = f"yum-config-manager --add-repo {repo}"
+
+        with parallel() as p:
+            for node in self.cluster.get_nodes(ignore="client"):
+                p.spawn(node.exec_command, sudo=True, cmd=cmd)
 
     def setup_upstream_repository(self, repo_url=None):
         """Download upstream repository to inidividual nodes.
@@ -230,6 +233,11 @@ class CephAdmin(BootstrapMixin, ShellMixin, RegistryLoginMixin):
     def install(self, **kwargs: Dict) -> None:
         """Install the cephadm package in all node(s).
 
+        The package is installed on all the nodes concurrently. With the mirror
+        option, the RPM and the dependencies missing on the installer node are
+        downloaded once on the installer node and served to the other nodes from
+        there instead of each node fetching them from the repository.
+
         Args:
           kwargs (Dict): Key/value pairs that needs to be provided to the installer
 
@@ -239,30 +247,101 @@ class CephAdmin(BootstrapMixin, ShellMixin, RegistryLoginMixin):
             Supported keys:
               upgrade: boolean # to upgrade cephadm RPM package
               gpgcheck: boolean
+              mirror: boolean # serve the RPM from the installer node, defaults to
+                              # the package_mirror configuration
 
 
         :Note: At present, they are prefixed with -- hence use long options
 
         """
-        cmd = "yum install cephadm -y"
+        cmd = "yum install cephadm -y --nogpgcheck"
+        mirror = kwargs.get("mirror", self.config.get("package_mirror", False))
+
+        try:
+            if mirror:
+                rpms = self.start_package_mirror(["cephadm"])
+                cmd = f"yum install -y --nogpgcheck {' '.join(rpms)}"
+
+            with parallel() as p:
+                for node in self.cluster.get_nodes(ignore="client"):
+                    p.spawn(
+                        self._install_cephadm, node, cmd, kwargs.get("upgrade", False)
+                    )
+        finally:
+            if mirror:
+                self.stop_package_mirror()
 
-        if kwargs.get("nogpgcheck", True):
-            cmd += " --nogpghceck"
+    def _install_cephadm(self, node, cmd: str, upgrade: bool = False) -> None:
+        """Install the cephadm package on the given node."""
+        if self.config.get("ibm_build"):
+            setup_ibm_licence(node, build_type=None)
+        node.exec_command(sudo=True, cmd=cmd, long_running=True)
 
-        for node in self.cluster.get_nodes(ignore="client"):
-            if self.config.get("ibm_build"):
-                setup_ibm_licence(node, build_type=None)
-            node.exec_command(
-                sudo=True,
-                cmd="yum install cephadm -y --nogpgcheck",
-                long_running=True,
-            )
+        if upgrade:
+            node.exec_command(sudo=True, cmd="yum update metadata")
+            node.exec_command(sudo=True, cmd="yum update -y cephadm")
+
+        node.exec_command(cmd="rpm -qa | grep cephadm")
+
+    def start_package_mirror(self, packages: List[str]) -> List[str]:
+        """Download the packages on the installer node and serve them over HTTP.
+
+        The dependencies not installed on the installer node are downloaded
+        along with the packages. The nodes reach the mirror using the internal
+        IP address of the installer, the floating IP may not be routable.
 
-            if kwargs.get("upgrade", False):
-                node.exec_command(sudo=True, cmd="yum update metadata")
-                node.exec_command(sudo=True, cmd="yum update -y cephadm")
+        Args:
+            packages (List): names of the packages to be mirrored
+
+        Returns:
+            URLs of the mirrored RPM files
+        """
+        installer = self.installer
+        installer.exec_command(
+            sudo=True,
+            cmd=f"rm -rf {MIRROR_DIR} && mkdir -p {MIRROR_DIR} && "
+            f"dnf download --resolve --destdir {MIRROR_DIR} {' '.join(packages)}",
+            long_running=True,
+            check_ec=True,
+        )
+        out, _ = installer.exec_command(sudo=True, cmd=f"ls {MIRROR_DIR}")
+        rpms = [rpm for rpm in out.split() if rpm.endswith(".rpm")]
+
+        installer.exec_command(
+            sudo=True,
+            cmd=f"firewall-cmd --zone=public --add-port={MIRROR_PORT}/tcp",
+            check_ec=False,
+        )
+        out, _ = installer.exec_command(
+            sudo=True,
+            cmd=f"cd {MIRROR_DIR} && nohup python3 -m http.server {MIRROR_PORT} "
+            "< /dev/null > /dev/null 2>&1 & echo $!",
+        )
+        self.mirror_pid = out.strip()
+        installer.exec_command(
+            sudo=True,
+            cmd=f"timeout 60 bash -c 'until curl -sf http://localhost:{MIRROR_PORT}/ "
+            "> /dev/null; do sleep 1; done'",
+        )
+
+        address = installer.node.internal_ip or installer.node.ip_address
+        url = f"http://{address}:{MIRROR_PORT}"
+        logger.info(f"Serving {rpms} from {url}")
+        return [f"{url}/{rpm}" for rpm in rpms]
+
+    def stop_package_mirror(self) -> None:
+        """Stop serving the package mirror from the installer node."""
+        if self.mirror_pid:
+            self.installer.exec_command(
+                sudo=True, cmd=f"kill {self.mirror_pid}", check_ec=False
+            )
+            self.mirror_pid = None
 
-            node.exec_command(cmd="rpm -qa | grep cephadm")
+        self.installer.exec_command(
+            sudo=True,
+            cmd=f"firewall-cmd --zone=public --remove-port={MIRROR_PORT}/tcp",
+            check_ec=False,
+        )
 
     def get_cluster_state(self, commands):
         """
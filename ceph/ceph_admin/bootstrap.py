@@ -6,6 +6,7 @@ from distutils.version import LooseVersion
 from typing import Dict
 
 from ceph.ceph_admin.cephadm_ansible import CephadmAnsible
+from ceph.parallel import parallel
 from ceph.utils import get_node_by_id, get_public_network, setup_repos
 from utility.log import Log
 from utility.utils import fetch_build_artifacts, get_cephci_config
@@ -193,6 +194,8 @@ class BootstrapMixin:
                     release: <ga | z1 | z1-async1>
                     mon-ip: <node-name>
         """
+        # A shell session container of a previous cluster has stale config
+        self.stop_shell_session()
         self.cluster.setup_ssh_keys()
         args = config.get("args")
         custom_repo = args.pop("custom_repo", "")
@@ -235,15 +238,17 @@ class BootstrapMixin:
         else:
             repos = ["Tools"]
             _platform = "-".join(rhbuild.split("-")[1:])
-            for node in self.cluster.get_nodes():
-                setup_repos(
-                    ceph=node,
-                    base_url=base_url,
-                    platform=_platform,
-                    repos=repos,
-                    cloud_type=cloud_type,
-                    ibm_build=ibm_build,
-                )
+            with parallel() as p:
+                for node in self.cluster.get_nodes():
+                    p.spawn(
+                        setup_repos,
+                        ceph=node,
+                        base_url=base_url,
+                        platform=_platform,
+                        repos=repos,
+                        cloud_type=cloud_type,
+                        ibm_build=ibm_build,
+                    )
 
         ansible_run = config.get("cephadm-ansible", None)
         if ansible_run:
@@ -4,13 +4,13 @@ Module that interacts with the orchestrator CLI.
 Provide the interfaces to ceph orch and in turn manage the orchestration engine.
 """
 
-from datetime import datetime, timedelta
+from datetime import datetime
 from json import loads
-from time import sleep
 
 from dateutil import parser
 
 from ceph.ceph import ResourceNotFoundError
+from ceph.waiter import Backoff
 from utility.log import Log
 
 from .ceph import CephCLI
@@ -93,17 +93,14 @@ class Orch(
         Args:
             service_name (Str): service name
             timeout (Int): timeout in seconds
-            interval (Int): interval in seconds
+            interval (Int): maximum interval between the checks in seconds
             exist (Bool): exists or not
 
         Returns:
             Boolean
 
         """
-        end_time = datetime.now() + timedelta(seconds=timeout)
-
-        while end_time > datetime.now():
-            sleep(interval)
+        for _ in Backoff(timeout=timeout, initial=1, maximum=interval):
             out, err = self.ls({"base_cmd_args": {"format": "json"}})
             out = loads(out)
             service = [
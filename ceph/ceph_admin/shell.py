@@ -1,8 +1,12 @@
 """Interface to cephadm shell CLI."""
 
+import atexit
 from copy import deepcopy
-from typing import Dict, List
+from typing import Callable, Dict, List
+from uuid import uuid4
 
+from ceph.ceph import CommandFailed
+from ceph.waiter import WaitUntil
 from utility.log import Log
 
 from .common import config_dict_to_string
@@ -11,10 +15,175 @@ from .typing_ import CephAdmProtocol
 LOG = Log(__name__)
 BASE_CMD = ["cephadm", "shell"]
 
+# Supported values of the shell_mode configuration
+CONTAINER_MODE = "container"
+SESSION_MODE = "session"
+
+# podman exec exit code when the container is missing or not running
+PODMAN_EXEC_ERROR = 125
+
+# Active shell sessions keyed by the installer IP address
+SHELL_SESSIONS = {}
+
+# Callbacks notified of the executed shell commands keyed by the installer IP address
+SHELL_OBSERVERS = {}
+
+
+class ShellSession:
+    """Long-lived cephadm shell container on the installer node.
+
+    A single ``cephadm shell`` container is started in the background and the
+    commands are executed in it using ``podman exec``, avoiding the container
+    creation cost that ``cephadm shell -- <cmd>`` has on every call.
+    """
+
+    def __init__(self, installer, start_timeout: int = 120, shell_args: str = ""):
+        """
+        Initialize the shell session.
+
+        Args:
+            installer (CephInstaller): node on which the container runs
+            start_timeout (Int): maximum time to wait for the container to run
+            shell_args (Str): extra cephadm shell arguments like --name osd.1
+        """
+        self.installer = installer
+        self.start_timeout = start_timeout
+        self.shell_args = shell_args
+        self.container = None
+
+    def start(self) -> str:
+        """
+        Start the shell container and return its identifier.
+
+        Raises:
+            CommandFailed: when the container is not running within start_timeout
+        """
+        token = uuid4().hex
+        shell_cmd = " ".join(
+            filter(None, ["cephadm shell", self.shell_args, f"-e CEPHCI_SHELL={token}"])
+        )
+        self.installer.exec_command(
+            sudo=True,
+            cmd=f"nohup {shell_cmd} -- sleep infinity < /dev/null > /dev/null 2>&1 &",
+        )
+
+        find_cmd = (
+            "podman ps -q | xargs -r podman inspect --format "
+            "'{{.Id}} {{range .Config.Env}}{{.}} {{end}}' "
+            f"| grep CEPHCI_SHELL={token} | cut -d ' ' -f 1"
+        )
+        for _ in WaitUntil(timeout=self.start_timeout, interval=2):
+            out, _ = self.installer.exec_command(sudo=True, cmd=find_cmd)
+            if out.strip():
+                self.container = out.strip()
+                LOG.info(f"cephadm shell session {self.container[:12]} is running")
+                return self.container
+
+        raise CommandFailed("cephadm shell session container failed to start")
+
+    def stop(self) -> None:
+        """Remove the shell container."""
+        if self.container:
+            self.installer.exec_command(
+                sudo=True, cmd=f"podman rm -f {self.container}", check_ec=False
+            )
+            self.container = None
+
+    def is_alive(self) -> bool:
+        """Return True when the shell container is running."""
+        if not self.container:
+            return False
+
+        out, _ = self.installer.exec_command(
+            sudo=True,
+            cmd=f"podman inspect --format '{{{{.State.Running}}}}' {self.container}",
+            check_ec=False,
+        )
+        return out.strip() == "true"
+
+    def exec_command(self, cmd: str, **kw):
+        """
+        Execute the command in the shell container.
+
+        The container is (re)spawned when it is not running, a failure of
+        podman exec due to a missing container is retried once after respawn.
+
+        Args:
+            cmd (Str): command to be executed
+            kw (Dict): arguments supported by CephNode.exec_command
+
+        Returns:
+            out (Str), err (Str), rc (Int), time (Float)
+        """
+        if not self.container:
+            self.start()
+
+        kw.update({"sudo": True, "check_ec": False, "verbose": False})
+        out, err, rc, _time = self.installer.exec_command(
+            cmd=f"podman exec {self.container} {cmd}", **kw
+        )
+
+        if rc == PODMAN_EXEC_ERROR and not self.is_alive():
+            LOG.warning("cephadm shell session is not running, respawning it.")
+            self.start()
+            out, err, rc, _time = self.installer.exec_command(
+                cmd=f"podman exec {self.container} {cmd}", **kw
+            )
+
+        return out, err, rc, _time
+
+
+@atexit.register
+def stop_shell_sessions() -> None:
+    """Remove the shell session containers left running by this run."""
+    for session in SHELL_SESSIONS.values():
+        try:
+            session.stop()
+        except Exception as err:  # noqa
+            LOG.debug(f"Failed to remove the cephadm shell session: {err}")
+    SHELL_SESSIONS.clear()
+
 
 class ShellMixin:
     """Interface to shell CLI."""
 
+    @property
+    def shell_mode(self: CephAdmProtocol) -> str:
+        """Execution mode of shell, either container (default) or session."""
+        return self.config.get("shell_mode", CONTAINER_MODE)
+
+    @property
+    def shell_session(self: CephAdmProtocol) -> ShellSession:
+        """Return the shell session of the installer node."""
+        key = self.installer.node.ip_address
+        if key not in SHELL_SESSIONS:
+            SHELL_SESSIONS[key] = ShellSession(self.installer)
+
+        return SHELL_SESSIONS[key]
+
+    def stop_shell_session(self: CephAdmProtocol) -> None:
+        """Remove the shell session container of the installer node, if any."""
+        session = SHELL_SESSIONS.pop(self.installer.node.ip_address, None)
+        if session:
+            session.stop()
+
+    def add_shell_observer(self: CephAdmProtocol, callback: Callable) -> None:
+        """
+        Register a callback invoked with every command executed using shell.
+
+        Args:
+            callback (Callable): function accepting the executed command string
+        """
+        observers = SHELL_OBSERVERS.setdefault(self.installer.node.ip_address, [])
+        if callback not in observers:
+            observers.append(callback)
+
+    def _notify_shell_observers(self: CephAdmProtocol, args: List[str]) -> None:
+        """Invoke the registered shell observers with the executed command."""
+        cmd = " ".join(args)
+        for callback in SHELL_OBSERVERS.get(self.installer.node.ip_address, []):
+            callback(cmd)
+
     def shell(
         self: CephAdmProtocol,
         args: List[str],
@@ -28,6 +197,11 @@ class ShellMixin:
         """
         Ceph orchestrator shell interface to run ceph commands.
 
+        When the shell_mode configuration is set to session, the commands are
+        executed in a long-lived shell container instead of creating one per call.
+        Commands with base_cmd_args always use a new container. The registered
+        shell observers are notified once the command is executed.
+
         Args:
             args (List): list arguments
             base_cmd_args (Dict)): cephadm base command options
@@ -42,6 +216,40 @@ class ShellMixin:
             rc (Int) exit status code if long_running command
 
         """
+        try:
+            return self._shell(
+                args,
+                base_cmd_args=base_cmd_args,
+                check_status=check_status,
+                timeout=timeout,
+                long_running=long_running,
+                print_output=print_output,
+                pretty_print=pretty_print,
+            )
+        finally:
+            self._notify_shell_observers(args)
+
+    def _shell(
+        self: CephAdmProtocol,
+        args: List[str],
+        base_cmd_args: Dict = None,
+        check_status: bool = True,
+        timeout: int = 600,
+        long_running: bool = False,
+        print_output: bool = True,
+        pretty_print: bool = False,
+    ):
+        """Execute the command in a new container or the shell session."""
+        if self.shell_mode == SESSION_MODE and not base_cmd_args:
+            return self._session_shell(
+                args,
+                check_status=check_status,
+                timeout=timeout,
+                long_running=long_running,
+                print_output=print_output,
+                pretty_print=pretty_print,
+            )
+
         cmd = deepcopy(BASE_CMD)
 
         if base_cmd_args:
@@ -63,3 +271,33 @@ class ShellMixin:
             if print_output:
                 LOG.debug(out[0])
         return out
+
+    def _session_shell(
+        self: CephAdmProtocol,
+        args: List[str],
+        check_status: bool = True,
+        timeout: int = 600,
+        long_running: bool = False,
+        print_output: bool = True,
+        pretty_print: bool = False,
+    ):
+        """Execute the command in the shell session, returns like shell."""
+        cmd = " ".join(args)
+        out, err, rc, _ = self.shell_session.exec_command(
+            cmd,
+            timeout=timeout,
+            long_running=long_running,
+            pretty_print=pretty_print,
+        )
+
+        if check_status and rc != 0:
+            raise CommandFailed(
+                f"{cmd} returned {err} and code {rc} on {self.installer.node.ip_address}"
+            )
+
+        if long_running:
+            return rc
+
+        if print_output:
+            LOG.debug(out)
+        return out, err
@@ -27,6 +27,10 @@ class CephAdmProtocol(Protocol):
 
     def install(self, **kwargs: Dict) -> None: ...
 
+    def stop_shell_session(self) -> None: ...
+
+    def add_shell_observer(self, callback) -> None: ...
+
     def shell(
         self,
         args: List[str],
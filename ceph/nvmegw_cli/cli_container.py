@@ -0,0 +1,223 @@
+"""Long running nvmeof-cli container of the gateway nodes.
+
+Starting a new nvmeof-cli container for every command takes longer than the
+command itself, the scale tests adding thousands of namespaces spend most of
+their time there. Instead, one container per node, CLI image and mTLS setup is
+started once and the commands are executed in it using podman exec. A batch
+of commands is executed using a single podman exec, reporting the result of
+every command, e.g. adding many namespaces,
+
+    container = get_cli_container(node, image)
+    container.execute("--server-address 10.0.0.1 namespace list --subsystem nqn")
+    results = container.execute_batch([args_1, args_2, ...])
+"""
+
+import atexit
+import hashlib
+import json
+import shlex
+from uuid import uuid4
+
+from ceph.ceph import CommandFailed
+from utility.log import Log
+
+LOG = Log(__name__)
+
+# Entry point of the nvmeof-cli image, when podman inspect doesn't report it
+DEFAULT_ENTRYPOINT = ["python3", "-m", "control.cli"]
+
+# Executed in the container, runs the commands in one process when possible
+BATCH_SCRIPT = r"""
+import contextlib
+import inspect
+import io
+import json
+import subprocess
+
+COMMANDS = json.loads({commands!r})
+ENTRYPOINT = json.loads({entrypoint!r})
+
+try:
+    from control.cli import main
+
+    if not inspect.signature(main).parameters:
+        main = None
+except Exception:
+    main = None
+
+
+def run_in_process(argv):
+    out, err = io.StringIO(), io.StringIO()
+    with contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+        try:
+            rc = main(argv)
+            rc = rc if isinstance(rc, int) else 0
+        except SystemExit as exc:
+            rc = exc.code if isinstance(exc.code, int) else int(exc.code is not None)
+        except Exception as exc:
+            rc = 1
+            err.write(str(exc))
+    return {{"rc": rc, "stdout": out.getvalue(), "stderr": err.getvalue()}}
+
+
+def run_in_subprocess(argv):
+    proc = subprocess.run(ENTRYPOINT + argv, capture_output=True, text=True)
+    return {{"rc": proc.returncode, "stdout": proc.stdout, "stderr": proc.stderr}}
+
+
+run = run_in_process if main else run_in_subprocess
+print(json.dumps([run(argv) for argv in COMMANDS]))
+"""
+
+CONTAINERS = dict()
+
+
+class CLIContainer:
+    """nvmeof-cli container kept running on the node to execute the commands."""
+
+    def __init__(self, node, image, volumes=""):
+        """
+        Initialize the container.
+
+        Args:
+            node: node where the CLI runs
+            image: nvmeof-cli image
+            volumes: podman volume arguments, like the mTLS certificates
+        """
+        self.node = node
+        self.image = image
+        self.volumes = volumes.strip()
+        digest = hashlib.md5(f"{image} {self.volumes}".encode()).hexdigest()[:8]
+        self.name = f"cephci-nvmeof-cli-{digest}"
+        self.entrypoint = list(DEFAULT_ENTRYPOINT)
+        self.running = False
+
+    def start(self):
+        """Start the container, replacing the one left by an earlier run."""
+        self.node.exec_command(
+            cmd=f"podman rm -f {self.name}", sudo=True, check_ec=False
+        )
+        out, _ = self.node.exec_command(
+            cmd=f"podman image inspect --format '{{{{json .Config.Entrypoint}}}}' {self.image}",
+            sudo=True,
+            check_ec=False,
+        )
+        try:
+            self.entrypoint = json.loads(out) or self.entrypoint
+        except ValueError:
+            LOG.debug(f"Using the default entrypoint for {self.image}")
+
+        self.node.exec_command(
+            cmd=f"podman run --quiet -d --rm --name {self.name} --entrypoint sleep "
+            f"{self.volumes} {self.image} infinity",
+            sudo=True,
+        )
+        self.running = True
+        LOG.info(f"Started NVMe CLI container {self.name} on {self.node.hostname}")
+
+    def stop(self):
+        if not self.running:
+            return
+
+        self.running = False
+        self.node.exec_command(
+            cmd=f"podman rm -f {self.name}", sudo=True, check_ec=False
+        )
+
+    def exists(self):
+        out, _ = self.node.exec_command(
+            cmd=f"podman ps -q --filter name=^{self.name}$", sudo=True, check_ec=False
+        )
+        return bool(out.strip())
+
+    def execute(self, args):
+        """
+        Execute the CLI command in the container, restarting the container
+        when it is gone, e.g. after a node reboot.
+
+        Args:
+            args: CLI arguments, e.g. --server-address <ip> subsystem list
+
+        Returns:
+            output and error of the command, like node.exec_command
+        """
+        if not self.running:
+            self.start()
+
+        entrypoint = " ".join(shlex.quote(arg) for arg in self.entrypoint)
+        cmd = f"podman exec {self.name} {entrypoint} {args}"
+        try:
+            return self.node.exec_command(cmd=cmd, sudo=True, pretty_print=True)
+        except CommandFailed:
+            if self.exists():
+                raise
+
+        LOG.warning(f"NVMe CLI container {self.name} is gone, restarting it")
+        self.start()
+        return self.node.exec_command(cmd=cmd, sudo=True, pretty_print=True)
+
+    def execute_batch(self, commands, timeout=3600):
+        """
+        Execute the CLI commands in the container using one podman exec.
+
+        Args:
+            commands: CLI arguments of every command
+            timeout: maximum time allowed for the whole batch
+
+        Returns:
+            list of dictionaries having the rc, stdout and stderr of every command
+        """
+        if not self.running:
+            self.start()
+
+        script = BATCH_SCRIPT.format(
+            commands=json.dumps([shlex.split(args) for args in commands]),
+            entrypoint=json.dumps(self.entrypoint),
+        )
+        path = f"/tmp/cephci-nvmeof-batch-{uuid4().hex}.py"
+        _file = self.node.remote_file(sudo=True, file_name=path, file_mode="w")
+        _file.write(script)
+        _file.flush()
+        _file.close()
+
+        try:
+            out, _ = self.node.exec_command(
+                cmd=f"podman exec -i {self.name} python3 - < {path}",
+                sudo=True,
+                timeout=timeout,
+            )
+        finally:
+            self.node.exec_command(cmd=f"rm -f {path}", sudo=True, check_ec=False)
+
+        results = json.loads(out.strip().splitlines()[-1])
+        failed = [result for result in results if result["rc"]]
+        if failed:
+            LOG.warning(f"{len(failed)} of {len(results)} NVMe CLI commands failed")
+        return results
+
+
+def get_cli_container(node, image, volumes=""):
+    """
+    Return the CLI container of the node, image and volumes, started on first use.
+
+    Raises:
+        CommandFailed: when the container can't be started
+    """
+    key = (node.ip_address, image, volumes.strip())
+    if key not in CONTAINERS:
+        container = CLIContainer(node, image, volumes)
+        container.start()
+        CONTAINERS[key] = container
+
+    return CONTAINERS[key]
+
+
+@atexit.register
+def stop_cli_containers():
+    """Remove the CLI containers started by this run."""
+    for container in CONTAINERS.values():
+        try:
+            container.stop()
+        except Exception as err:  # noqa
+            LOG.debug(f"Failed to remove {container.name}: {err}")
+    CONTAINERS.clear()
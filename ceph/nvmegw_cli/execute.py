@@ -1,4 +1,6 @@
+from ceph.ceph import CommandFailed
 from ceph.ceph_admin.common import config_dict_to_string
+from ceph.nvmegw_cli.cli_container import get_cli_container
 from utility.log import Log
 
 LOG = Log(__name__)
@@ -8,11 +10,26 @@ DISCARD_OUTPUT_STR = (
 )
 
 
+def discard_mtls_output(out):
+    if DISCARD_OUTPUT_STR in out:
+        # TODO: This is the workaround to discard unwanted output for NVMe CLI
+        #   commands with mTLS. And this workaround has to discarded once
+        #   this BZ (https://bugzilla.redhat.com/show_bug.cgi?id=2304066) is fixed.
+        out = out.split("\n", 1)[-1]
+    return out
+
+
 class ExecuteCommandMixin:
-    """Execute Command class runs NVMe CLI on Gateway Node."""
+    """Execute Command class runs NVMe CLI on Gateway Node.
+
+    The commands are executed in a long running CLI container of the node,
+    set PERSISTENT_CLI to False to start a new container for every command.
+    """
 
     BASE_CMD = "podman run --quiet --rm"
     NVMEOF_CLI_IMAGE = "quay.io/ceph/nvmeof-cli:latest"
+    PERSISTENT_CLI = True
+    BULK_BATCH_SIZE = 500
     MTLS_BASE_CMD_ARGS = {
         "client-key": "/root/client.key",
         "client-cert": "/root/client.crt",
@@ -29,8 +46,14 @@ class ExecuteCommandMixin:
 
         return _path
 
-    def run_nvme_cli(self, action, **kwargs):
-        LOG.info(f"NVMe CLI command : {self.name} {action}")
+    def cli_container(self):
+        """Return the long running CLI container of the node."""
+        return get_cli_container(
+            self.node, self.NVMEOF_CLI_IMAGE, self.local_mtls_cert_path()
+        )
+
+    def nvme_cli_args(self, action, **kwargs):
+        """Return the NVMe CLI arguments of the action."""
         base_cmd_args = kwargs.get("base_cmd_args", {})
 
         if self.mtls:
@@ -42,24 +65,63 @@ class ExecuteCommandMixin:
             base_cmd_args.update({"server-port": self.port})
 
         cmd_args = kwargs.get("args", {})
-        command = " ".join(
+        return " ".join(
             [
-                self.BASE_CMD,
-                self.local_mtls_cert_path(),
-                self.NVMEOF_CLI_IMAGE,
                 config_dict_to_string(base_cmd_args),
                 self.name,
                 action,
                 config_dict_to_string(cmd_args),
             ]
         )
-        err, out = self.node.exec_command(cmd=command, sudo=True, pretty_print=True)
+
+    def run_nvme_cli(self, action, **kwargs):
+        LOG.info(f"NVMe CLI command : {self.name} {action}")
+        cli_args = self.nvme_cli_args(action, **kwargs)
+
+        if self.PERSISTENT_CLI:
+            err, out = self.cli_container().execute(cli_args)
+        else:
+            command = " ".join(
+                [
+                    self.BASE_CMD,
+                    self.local_mtls_cert_path(),
+                    self.NVMEOF_CLI_IMAGE,
+                    cli_args,
+                ]
+            )
+            err, out = self.node.exec_command(cmd=command, sudo=True, pretty_print=True)
         LOG.info(f"ERROR - {err or None},\nOUTPUT - {out}")
 
-        if DISCARD_OUTPUT_STR in out:
-            # TODO: This is the workaround to discard unwanted output for NVMe CLI
-            #   commands with mTLS. And this workaround has to discarded once
-            #   this BZ (https://bugzilla.redhat.com/show_bug.cgi?id=2304066) is fixed.
-            out = out.split("\n", 1)[-1]
+        return err, discard_mtls_output(out)
+
+    def run_nvme_cli_bulk(self, action, items):
+        """Run the action for every item, in batches using one request stream.
+
+        Args:
+            action: CLI action, e.g. add
+            items: list of the kwargs of run_nvme_cli, like base_cmd_args and args
+
+        Returns:
+            list of dictionaries having the args, rc, stdout and stderr of every item,
+            the stderr holds the CLI output returned by run_nvme_cli
+        """
+        LOG.info(f"NVMe CLI bulk command : {self.name} {action} x {len(items)}")
+        if not self.PERSISTENT_CLI:
+            results = []
+            for item in items:
+                try:
+                    stdout, stderr = self.run_nvme_cli(action, **item)
+                    results.append({"rc": 0, "stdout": stdout, "stderr": stderr})
+                except CommandFailed as err:
+                    results.append({"rc": 1, "stdout": "", "stderr": str(err)})
+        else:
+            commands = [self.nvme_cli_args(action, **item) for item in items]
+            container, results = self.cli_container(), []
+            for index in range(0, len(commands), self.BULK_BATCH_SIZE):
+                batch = commands[index : index + self.BULK_BATCH_SIZE]
+                results += container.execute_batch(batch)
 
-        return err, out
+        for item, result in zip(items, results):
+            result["args"] = item.get("args", {})
+            result["stderr"] = discard_mtls_output(result["stderr"])
+        return results
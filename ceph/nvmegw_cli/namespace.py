@@ -24,6 +24,19 @@ class Namespace(ExecuteCommandMixin):
         """Adds namespace for subsystem."""
         return self.run_nvme_cli("add", **kwargs)
 
+    def add_bulk(self, items):
+        """Adds namespaces for subsystems, using one request stream.
+
+        Args:
+            items: list of the add kwargs of every namespace, e.g.
+                [{"base_cmd_args": {"format": "json"},
+                  "args": {"subsystem": subnqn, "rbd-pool": pool, "rbd-image": image}}]
+
+        Returns:
+            list of dictionaries having the args, rc, stdout and stderr of every namespace
+        """
+        return self.run_nvme_cli_bulk("add", items)
+
     def delete(self, **kwargs):
         """Deletes  namespace."""
         return self.run_nvme_cli("del", **kwargs)
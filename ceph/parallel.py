@@ -1,13 +1,27 @@
+import multiprocessing
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 
+import gevent
 import gevent.pool
 import gevent.queue
+import gevent.threadpool
 
-from utility.log import Log
+from utility.log import Log, current_test, test_context
 
 log = Log(__name__)
 
 
+BACKENDS = ("gevent", "thread", "process")
+
+
+class TaskTimeout(Exception):
+    """Raised when a spawned function exceeds the allocated time."""
+
+    pass
+
+
 class ExceptionHolder(object):
     def __init__(self, exc_info):
         self.exc_info = exc_info
@@ -24,6 +38,12 @@ def capture_traceback(func, *args, **kwargs):
         return ExceptionHolder(sys.exc_info())
 
 
+def run_in_test_context(test_name, func, /, *args, **kwargs):
+    """Invoke the function attributing its log records to the given test."""
+    with test_context(test_name):
+        return func(*args, **kwargs)
+
+
 def resurrect_traceback(exc):
     if isinstance(exc, ExceptionHolder):
         exc_info = exc.exc_info
@@ -59,10 +79,55 @@ class parallel(object):
     At the end of the with block, the main thread waits until all
     spawned functions have completed, or, if one exited with an exception,
     kills the rest and raises the exception.
+
+    The behaviour can be tuned with the below options::
+
+        with parallel(max_workers=10, backend="thread", timeout=600,
+                      collect_errors=True) as p:
+            for node in nodes:
+                p.spawn(node.exec_command, cmd="uptime")
+
+        for err in p.errors:
+            print err
+
+    max_workers limits the number of functions running at a time, spawn blocks
+    till a worker is available. The thread backend runs the functions in a pool
+    of native threads, to be used for blocking code not patched by gevent. The
+    process backend runs them in a pool of spawned processes, for CPU bound work,
+    hence the functions, their arguments and results must be picklable and the
+    log handlers of the run are not available to them.
+    timeout is the maximum time allowed for each function, TaskTimeout is raised
+    when exceeded. Note, a function running in a native thread or a process
+    cannot be killed, only its result is discarded. With collect_errors, the
+    failures are gathered in the errors list instead of being raised. The
+    execution time of every function is available in stats.
     """
 
-    def __init__(self):
-        self.group = gevent.pool.Group()
+    def __init__(
+        self, max_workers=None, backend="gevent", timeout=None, collect_errors=False
+    ):
+        if backend not in BACKENDS:
+            raise ValueError(f"Unsupported backend {backend}, use one of {BACKENDS}")
+
+        self.group = (
+            gevent.pool.Pool(max_workers) if max_workers else gevent.pool.Group()
+        )
+        self.threads = (
+            gevent.threadpool.ThreadPool(max_workers or 10)
+            if backend in ("thread", "process")
+            else None
+        )
+        # The processes are spawned, the gevent hub of a forked child is unusable,
+        # and the native threads wait for their results
+        self.processes = (
+            ProcessPoolExecutor(max_workers, multiprocessing.get_context("spawn"))
+            if backend == "process"
+            else None
+        )
+        self.timeout = timeout
+        self.collect_errors = collect_errors
+        self.errors = []
+        self.stats = []
         self.results = gevent.queue.Queue()
         self.count = 0
         self.any_spawned = False
@@ -71,14 +136,56 @@ class parallel(object):
     def spawn(self, func, *args, **kwargs):
         self.count += 1
         self.any_spawned = True
-        greenlet = self.group.spawn(capture_traceback, func, *args, **kwargs)
+        # the spawned function logs to the test of the caller
+        greenlet = self.group.spawn(
+            run_in_test_context, current_test(), self._run, func, *args, **kwargs
+        )
         greenlet.link(self._finish)
 
+    def _run(self, func, *args, **kwargs):
+        """Execute the function within the allocated time and record its duration."""
+        name = getattr(func, "__qualname__", repr(func))
+        start = time.time()
+        timer = gevent.Timeout(
+            self.timeout, TaskTimeout(f"{name} exceeded {self.timeout} seconds")
+        )
+
+        try:
+            with timer:
+                if self.processes is not None:
+                    future = self.processes.submit(
+                        run_in_test_context, current_test(), func, *args, **kwargs
+                    )
+                    result = self.threads.apply(capture_traceback, (future.result,))
+                elif self.threads is not None:
+                    result = self.threads.apply(
+                        run_in_test_context,
+                        (current_test(), capture_traceback, func) + args,
+                        kwargs,
+                    )
+                else:
+                    result = capture_traceback(func, *args, **kwargs)
+        except TaskTimeout:
+            result = ExceptionHolder(sys.exc_info())
+
+        self.stats.append(
+            {
+                "name": name,
+                "duration": round(time.time() - start, 3),
+                "status": "fail" if isinstance(result, ExceptionHolder) else "pass",
+            }
+        )
+        return result
+
     def __enter__(self):
         return self
 
     def __exit__(self, type_, value, traceback):
         self.group.join()
+        if self.threads is not None:
+            self.threads.kill()
+        if self.processes is not None:
+            self.processes.shutdown(wait=False, cancel_futures=True)
 
         if value is not None:
             return False
@@ -92,23 +199,32 @@ class parallel(object):
             # Emit message here because traceback gets stomped when we re-raise
             log.exception("Exception in parallel execution")
             raise
+
+        for err in self.errors:
+            log.error(f"Parallel execution failure: {repr(err)}")
+
         return True
 
     def __iter__(self):
         return self
 
     def __next__(self):
-        if not self.any_spawned or self.iteration_stopped:
-            raise StopIteration()
-        result = self.results.get()
-
-        try:
-            resurrect_traceback(result)
-        except StopIteration:
-            self.iteration_stopped = True
-            raise
-
-        return result
+        while True:
+            if not self.any_spawned or self.iteration_stopped:
+                raise StopIteration()
+            result = self.results.get()
+
+            if self.collect_errors and isinstance(result, ExceptionHolder):
+                self.errors.append(result.exc_info[1])
+                continue
+
+            try:
+                resurrect_traceback(result)
+            except StopIteration:
+                self.iteration_stopped = True
+                raise
+
+            return result
 
     def _finish(self, greenlet):
         if greenlet.successful():
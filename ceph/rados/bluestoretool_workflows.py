@@ -23,6 +23,7 @@ from typing import Dict
 from ceph.ceph_admin import CephAdmin
 from ceph.ceph_admin.common import config_dict_to_string
 from ceph.rados.core_workflows import RadosOrchestrator
+from ceph.rados.offline_session import OfflineOsdSession
 from utility.log import Log
 
 log = Log(__name__)
@@ -42,6 +43,27 @@ class BluestoreToolWorkflows:
         self.rados_obj = RadosOrchestrator(node=node)
         self.cluster = node.cluster
         self.client = node.cluster.get_nodes(role="client")[0]
+        self.sessions = {}
+
+    def offline_session(self, osd_id: int, start: bool = True) -> OfflineOsdSession:
+        """
+        Returns the context manager keeping the OSD offline for multiple commands.
+        The OSD is stopped and started once, the commands of this class are run
+        in the same container within the session and the commands added using
+        the add method of the session are executed together.
+        Args:
+            osd_id: daemon ID of target OSD
+            start: flag to control OSD start at the end of the session
+        Returns:
+            OfflineOsdSession object
+        """
+        return OfflineOsdSession(
+            rados_obj=self.rados_obj,
+            osd_id=osd_id,
+            tool_cmd=lambda cmd: f"{cmd} --path /var/lib/ceph/osd/ceph-{osd_id}",
+            start=start,
+            registry=self.sessions,
+        )
 
     def run_cbt_command(
         self, cmd: str, osd_id: int, timeout: int = 300, env: Dict = None
@@ -57,6 +79,9 @@ class BluestoreToolWorkflows:
         Returns:
             output of respective ceph-bluestore-tool command in string format
         """
+        if osd_id in self.sessions:
+            return str(self.sessions[osd_id].run(cmd=cmd, timeout=timeout, env=env))
+
         osd_node = self.rados_obj.fetch_host_node(
             daemon_type="osd", daemon_id=str(osd_id)
         )
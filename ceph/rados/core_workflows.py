@@ -18,6 +18,9 @@ from collections import namedtuple
 
 from ceph.ceph_admin import CephAdmin
 from ceph.parallel import parallel
+from ceph.rados.pg_table import OsdTable, PgTable, iter_array
+from ceph.rados.snapshot_cache import get_snapshot_cache
+from ceph.waiter import Backoff
 from utility.log import Log
 
 log = Log(__name__)
@@ -39,6 +42,12 @@ class RadosOrchestrator:
         self.ceph_cluster = node.cluster
         self.client = node.cluster.get_nodes(role="client")[0]
         self.rhbuild = node.config.get("rhbuild")
+        self.cache = (
+            get_snapshot_cache(node)
+            if node.config.get("snapshot_cache", False)
+            else None
+        )
+        self._tables = dict()
 
     def change_recovery_flags(self, action, flags: list = None):
         """Sets and unsets the recovery flags on the cluster
@@ -79,11 +88,11 @@ class RadosOrchestrator:
         Returns: list of PG states for the PG
         """
         log.debug(f"Checking the PG state for PG ID : {pgid} ")
-        cmd = "ceph pg dump pgs"
-        pg_stats = self.run_ceph_command(cmd)
-        for pg in pg_stats["pg_stats"]:
-            if pg["pgid"] == pgid:
-                return pg["state"]
+        table = self.get_pg_table()
+        if table is not None:
+            states = table.states(table.pgid == pgid)
+            if states:
+                return states[0]
         log.error(f"could not find the given pg : {pgid}")
         return []
 
@@ -153,7 +162,8 @@ class RadosOrchestrator:
     def run_ceph_command(self, cmd: str, timeout: int = 300, client_exec: bool = False):
         """
         Runs ceph commands with json tag for the action specified otherwise treats action as command
-        and returns formatted output
+        and returns formatted output. Cluster state queries are served from the snapshot cache
+        when the snapshot_cache config is set to true.
         Args:
             cmd: Command that needs to be run
             timeout: Maximum time allowed for execution.
@@ -161,20 +171,78 @@ class RadosOrchestrator:
         Returns: dictionary of the output
         """
 
-        cmd = f"{cmd} -f json"
-        try:
-            if client_exec:
-                out, err = self.client.exec_command(cmd=cmd, sudo=True, timeout=timeout)
-            else:
-                out, err = self.node.shell([cmd], timeout=timeout, print_output=False)
-        except Exception as er:
-            log.error(f"Exception hit while command execution. {er}")
+        out = self._ceph_output(cmd, timeout=timeout, client_exec=client_exec)
+        if out is None:
             return None
         if out.isspace():
             return {}
         status = json.loads(out)
         return status
 
+    def _ceph_output(self, cmd: str, timeout: int = 300, client_exec: bool = False):
+        """
+        Runs the ceph command with json format and returns the raw output,
+        None when the command fails.
+        """
+        cmd = f"{cmd} -f json"
+
+        def fetch():
+            if client_exec:
+                out, _ = self.client.exec_command(cmd=cmd, sudo=True, timeout=timeout)
+                if self.cache:
+                    self.cache.observe(cmd)
+                return out
+
+            out, _ = self.node.shell([cmd], timeout=timeout, print_output=False)
+            return out
+
+        try:
+            return self.cache.get(cmd, fetch) if self.cache else fetch()
+        except Exception as er:
+            log.error(f"Exception hit while command execution. {er}")
+            return None
+
+    def _get_table(self, cmd: str, table_cls):
+        """
+        Returns the table of the command output, parsed once per output.
+        The snapshot cache returns the same output until the cluster changes,
+        hence the table is reused while the output is unchanged.
+        """
+        out = self._ceph_output(cmd)
+        if out is None:
+            return None
+
+        cached = self._tables.get(cmd)
+        if cached and cached[0] is out:
+            return cached[1]
+
+        table = table_cls(out)
+        self._tables[cmd] = (out, table)
+        return table
+
+    def get_pg_table(self, cmd: str = "ceph pg dump pgs"):
+        """
+        Fetches the PGs in columns, to be queried without loading the whole dump.
+        Args:
+            cmd: command listing the PGs, e.g. ceph pg dump pgs, ceph pg ls <pool_id>
+
+        Examples:
+            table = get_pg_table()
+            table.pgids(~table.in_state("active", "clean", match="all"))
+            table.pgs_per_osd()
+
+        Returns: PgTable object, None when the command fails
+        """
+        return self._get_table(cmd, PgTable)
+
+    def get_osd_table(self):
+        """
+        Fetches the OSDs of the osd dump in columns.
+
+        Returns: OsdTable object, None when the command fails
+        """
+        return self._get_table("ceph osd dump", OsdTable)
+
     def pool_inline_compression(self, pool_name: str, **kwargs) -> bool:
         """
         BlueStore supports inline compression using snappy, zlib, or lz4.
@@ -2814,9 +2882,7 @@ EOF"""
         dump_out_str, _ = self.client.exec_command(cmd=_cmd)
         if dump_out_str.isspace():
             return {}
-        dump_out = json.loads(dump_out_str)
-        pg_stats = dump_out["pg_map"]["pg_stats"]
-        for pg_stat in pg_stats:
+        for pg_stat in iter_array(dump_out_str, "pg_stats"):
             if pg_stat["pgid"] == pg_id:
                 return pg_stat
 
@@ -2934,17 +3000,15 @@ EOF"""
         pool_names = [entry["name"] for entry in out.get("pools", [])]
         pool_id = out["pools"][pool_names.index(pool)]["id"]
 
-        cmd = f" ceph pg ls {pool_id}"
-        out = self.run_ceph_command(cmd=cmd)
-        for ele in out["pg_stats"]:
-            if any(key in disallowed_states for key in ele["state"].split("+")):
+        table = self.get_pg_table(cmd=f"ceph pg ls {pool_id}")
+        disallowed = table.in_state(*disallowed_states)
+        if disallowed.any():
+            for pgid, state in zip(table.pgids(disallowed), table.states(disallowed)):
                 log.error(
-                    f"PG : {ele['pgid']} is in state : {ele['state']}. "
-                    "PG expected to be active+clean"
+                    f"PG : {pgid} is in state : {state}. PG expected to be active+clean"
                 )
-                return False
-            else:
-                log.info(f"PG : {ele['pgid']} is in expected state : {ele['state']}. ")
+            return False
+        log.info(f"All {len(table)} PGs of the pool are in the expected states")
         log.info("Completed checking PG states on all PGs of the pool. Pass")
         return True
 
@@ -3176,10 +3240,7 @@ EOF"""
         else:
             log.debug("Initiated scheduled scrub")
 
-        start_time = datetime.datetime.now()
-        while datetime.datetime.now() <= start_time + datetime.timedelta(
-            seconds=wait_time
-        ):
+        for _ in Backoff(timeout=wait_time, initial=2, maximum=30):
             pool_pg_dump = self.get_ceph_pg_dump(pg_id=pg_id)
             current_scrub_stamp = datetime.datetime.strptime(
                 pool_pg_dump["last_scrub_stamp"], "%Y-%m-%dT%H:%M:%S.%f%z"
@@ -3203,9 +3264,8 @@ EOF"""
                     f" {current_scrub_stamp - init_scrub_stamp}"
                 )
                 log.info(
-                    f"scrub is yet to complete, pg state: {pool_pg_dump['state']}. Sleeping for 30 secs"
+                    f"scrub is yet to complete, pg state: {pool_pg_dump['state']}. Retrying"
                 )
-                time.sleep(30)
         else:
             log.error(f"PG :{pg_id} could not be scrubbed in time")
             raise Exception("Objects not scrubbed error")
@@ -3236,10 +3296,7 @@ EOF"""
         else:
             log.debug("Initiated scheduled deep-scrub")
 
-        start_time = datetime.datetime.now()
-        while datetime.datetime.now() <= start_time + datetime.timedelta(
-            seconds=wait_time
-        ):
+        for _ in Backoff(timeout=wait_time, initial=2, maximum=30):
             pool_pg_dump = self.get_ceph_pg_dump(pg_id=pg_id)
             # Parse the timestamp string into a datetime object
             current_scrub_stamp = datetime.datetime.strptime(
@@ -3266,9 +3323,8 @@ EOF"""
                     f" {current_scrub_stamp - init_scrub_stamp}"
                 )
                 log.info(
-                    f"Deep-scrub is yet to complete, pg state: {pool_pg_dump['state']}. Sleeping for 30 secs"
+                    f"Deep-scrub is yet to complete, pg state: {pool_pg_dump['state']}. Retrying"
                 )
-                time.sleep(30)
         else:
             log.error(f"PG : {pg_id} could not be deep-scrubbed in time")
             raise Exception("Objects not scrubbed error")
@@ -9,6 +9,7 @@ Module to Generate, Modify and Apply Crush maps on ceph cluster. Methods include
 7. Moving buckets from one to other in bin file, and it's Verification.
 8. bin file tests. ( stats, bad mappings etc.)
 9. dump and verify bin file contents
+10. Offline evaluation of the PG placement using the placement simulator.
 """
 
 import json
@@ -16,6 +17,7 @@ import re
 
 from ceph.ceph_admin import CephAdmin
 from ceph.rados.core_workflows import RadosOrchestrator
+from ceph.rados.placement_simulator import PlacementSimulator
 from utility.log import Log
 
 log = Log(__name__)
@@ -808,3 +810,20 @@ class OsdToolWorkflows:
             ),
             f"{target_loc}/{pool_name}_res.txt",
         )
+
+    def placement_simulator(self, source_loc=None) -> PlacementSimulator:
+        """Module to fetch the maps once and evaluate the PG placement offline
+
+         The PG distribution, read scores and expected upmap and read balancer
+         outcomes are computed from the maps without querying the cluster again.
+         Args::
+            source_loc: existing osdmap file to be used, fetched from the cluster when not given
+        Examples::
+            simulator = obj.placement_simulator()
+            expected_score = simulator.expected_read_score(pool_name="test-pool")
+        Returns::
+            PlacementSimulator object having the maps and PG mappings fetched
+        """
+        simulator = PlacementSimulator(self.client)
+        simulator.fetch(osdmap_loc=source_loc)
+        return simulator
@@ -23,6 +23,7 @@ ceph-objectstore-tool --data-path path to osd [ --op list $obj_ID]
 
 from ceph.ceph_admin import CephAdmin
 from ceph.rados.core_workflows import RadosOrchestrator
+from ceph.rados.offline_session import OfflineOsdSession
 from utility.log import Log
 
 log = Log(__name__)
@@ -42,6 +43,33 @@ class objectstoreToolWorkflows:
         self.rados_obj = RadosOrchestrator(node=node)
         self.cluster = node.cluster
         self.client = node.cluster.get_nodes(role="client")[0]
+        self.sessions = {}
+
+    def offline_session(
+        self, osd_id: int, mount: bool = False, start: bool = True
+    ) -> OfflineOsdSession:
+        """
+        Returns the context manager keeping the OSD offline for multiple commands.
+        The OSD is stopped and started once, the commands of this class are run
+        in the same container within the session and the commands added using
+        the add method of the session are executed together.
+        Args:
+            osd_id: daemon ID of target OSD
+            mount: boolean to control mounting of /tmp directory
+            to cephadm container
+            start: flag to control OSD start at the end of the session
+        Returns:
+            OfflineOsdSession object
+        """
+        return OfflineOsdSession(
+            rados_obj=self.rados_obj,
+            osd_id=osd_id,
+            tool_cmd=lambda cmd: "ceph-objectstore-tool --data-path "
+            f"/var/lib/ceph/osd/ceph-{osd_id} {cmd}",
+            mount=mount,
+            start=start,
+            registry=self.sessions,
+        )
 
     def run_cot_command(
         self,
@@ -62,7 +90,25 @@ class objectstoreToolWorkflows:
             start: flag to control OSD start after command execution
         Returns:
             output of respective ceph-objectstore-tool command in string format
+        Raises:
+            ValueError: when /tmp is to be mounted and the open offline session
+            of the OSD was created without mount
         """
+        if osd_id in self.sessions:
+            session = self.sessions[osd_id]
+            if mount and not session.mount:
+                raise ValueError(
+                    f"{cmd} requires /tmp to be mounted, the offline session of "
+                    f"osd.{osd_id} was opened without mount"
+                )
+            if start != session.start:
+                log.info(
+                    f"Ignoring start={start} for {cmd}, osd.{osd_id} is "
+                    f"{'started' if session.start else 'left stopped'} at the end "
+                    "of the offline session"
+                )
+            return str(session.run(cmd=cmd, timeout=timeout))
+
         osd_node = self.rados_obj.fetch_host_node(
             daemon_type="osd", daemon_id=str(osd_id)
         )
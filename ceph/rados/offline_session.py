@@ -0,0 +1,196 @@
+"""
+Module to run the offline OSD tools, like ceph-objectstore-tool, in batches.
+
+The offline tools need the OSD to be stopped, running every command with a
+new cephadm shell container and an OSD restart takes minutes for a few
+commands. An offline session instead,
+
+1. stops the OSD once on entry.
+2. starts a single cephadm shell container of the OSD.
+3. executes the queued commands in the container using one script, the
+   output and exit code of every command is returned separately.
+4. removes the container and starts the OSD once on exit.
+
+  Typical usage example:
+
+    with cot_obj.offline_session(osd_id=2) as session:
+        for obj in objects:
+            session.add(f"--pgid {pgid} '{obj}' list-omap")
+        results = session.execute()
+        pg_info = cot_obj.list_objects(osd_id=2, pgid=pgid)
+"""
+
+import re
+from typing import Callable, Dict, List
+from uuid import uuid4
+
+from ceph.ceph import CommandFailed
+from ceph.ceph_admin.common import config_dict_to_string
+from ceph.ceph_admin.shell import ShellSession
+from utility.log import Log
+
+log = Log(__name__)
+
+MARKER = "<<<cephci-offline"
+RESULT_PATTERN = re.compile(
+    rf"{MARKER} op (\d+)>>>\n(.*?){MARKER} rc \1 (\d+)>>>\n(.*?){MARKER} end \1>>>",
+    re.S,
+)
+
+
+def parse_batch_output(output: str, cmds: List) -> List:
+    """
+    Split the output of the batch script into the results of the commands.
+
+    Args:
+        output: stdout of the batch script
+        cmds: commands of the batch
+
+    Returns:
+        list of dictionaries having the cmd, rc, out and err of every command,
+        rc is None when the command was not executed
+    """
+    results = [{"cmd": cmd, "rc": None, "out": "", "err": ""} for cmd in cmds]
+    for match in RESULT_PATTERN.finditer(output):
+        index = int(match.group(1))
+        results[index].update(
+            {"rc": int(match.group(3)), "out": match.group(2), "err": match.group(4)}
+        )
+
+    return results
+
+
+class OfflineOsdSession:
+    """Stopped OSD along with a cephadm shell container to run the offline tools."""
+
+    def __init__(
+        self,
+        rados_obj,
+        osd_id: int,
+        tool_cmd: Callable,
+        mount: bool = False,
+        start: bool = True,
+        registry: Dict = None,
+    ):
+        """
+        initializes the offline session of the OSD
+        Args:
+            rados_obj: RadosOrchestrator object
+            osd_id: daemon ID of target OSD
+            tool_cmd: returns the tool command line for the given arguments
+            mount: boolean to control mounting of /tmp directory to the container
+            start: flag to control OSD start at the end of the session
+            registry: open sessions keyed by OSD ID, the session is added to it
+        """
+        self.rados_obj = rados_obj
+        self.osd_id = osd_id
+        self.tool_cmd = tool_cmd
+        self.mount = mount
+        self.start = start
+        self.registry = registry if registry is not None else {}
+        self.queue = []
+        self.node = rados_obj.fetch_host_node(daemon_type="osd", daemon_id=str(osd_id))
+        shell_args = f"--name osd.{osd_id}"
+        if mount:
+            shell_args = f"{shell_args} --mount /tmp/"
+        self.shell = ShellSession(self.node, shell_args=shell_args)
+
+    def __enter__(self):
+        self.rados_obj.change_osd_state(action="stop", target=self.osd_id)
+        try:
+            self.shell.start()
+        except Exception:
+            if self.start:
+                self.rados_obj.change_osd_state(action="start", target=self.osd_id)
+            raise
+
+        self.registry[self.osd_id] = self
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            if self.queue and exc_type is None:
+                self.execute()
+        finally:
+            self.registry.pop(self.osd_id, None)
+            self.shell.stop()
+            if self.start:
+                self.rados_obj.change_osd_state(action="start", target=self.osd_id)
+
+    def add(self, cmd: str, timeout: int = 300, env: Dict = None) -> int:
+        """
+        Queue the tool command, executed by execute or at the end of the session.
+        Args:
+            cmd: tool arguments, like --op list
+            timeout: Maximum time allowed for execution.
+            env: environment variables of the command
+                e.g. - {"env": "CEPH_ARGS='--bluestore_block_db_size=1024'"}
+        Returns:
+            index of the command result returned by execute
+        """
+        self.queue.append((cmd, timeout, env))
+        return len(self.queue) - 1
+
+    def execute(self) -> List:
+        """
+        Execute the queued commands in the session container using one script.
+        Returns:
+            list of dictionaries having the cmd, rc, out and err of every command
+        """
+        queue, self.queue = self.queue, []
+        return self._run_batch(queue) if queue else []
+
+    def _run_batch(self, queue: List) -> List:
+        token = uuid4().hex
+        script = f"/tmp/cephci-offline-{token}.sh"
+        err_file = f"/tmp/cephci-offline-{token}.err"
+        lines = []
+        for index, (cmd, _, env) in enumerate(queue):
+            env_args = config_dict_to_string(env) if env else ""
+            lines += [
+                f"echo '{MARKER} op {index}>>>'",
+                f"podman exec -i{env_args} {self.shell.container} "
+                f"{self.tool_cmd(cmd)} 2> {err_file}",
+                f'echo "{MARKER} rc {index} $?>>>"',
+                f"cat {err_file}",
+                f"echo '{MARKER} end {index}>>>'",
+            ]
+        lines.append(f"rm -f {err_file}")
+
+        _file = self.node.remote_file(sudo=True, file_name=script, file_mode="w")
+        _file.write("\n".join(lines) + "\n")
+        _file.flush()
+        _file.close()
+
+        log.info(f"Executing {len(queue)} offline commands on osd.{self.osd_id}")
+        try:
+            out, _ = self.node.exec_command(
+                sudo=True,
+                cmd=f"bash {script} < /dev/null",
+                timeout=sum(timeout for _, timeout, _ in queue),
+            )
+        finally:
+            self.node.exec_command(sudo=True, cmd=f"rm -f {script}", check_ec=False)
+
+        results = parse_batch_output(str(out), [cmd for cmd, _, _ in queue])
+        failed = [result for result in results if result["rc"] != 0]
+        if failed:
+            log.warning(f"{len(failed)} offline commands failed: {failed}")
+
+        return results
+
+    def run(self, cmd: str, timeout: int = 300, env: Dict = None) -> str:
+        """
+        Execute the tool command right away in the session container.
+        Returns:
+            output of the command
+        Raises:
+            CommandFailed: when the command fails
+        """
+        (result,) = self._run_batch([(cmd, timeout, env)])
+        if result["rc"] != 0:
+            raise CommandFailed(
+                f"{self.tool_cmd(cmd)} failed with rc {result['rc']}: {result['err']}"
+            )
+
+        return result["out"]
@@ -0,0 +1,281 @@
+"""
+Module to hold the PG and OSD dumps of large clusters in compact columns.
+
+Loading the JSON output of ceph pg dump creates a dictionary per PG, which is
+hundreds of MB on clusters having 100k+ PGs. The entries of the pg_stats and
+osds arrays are instead decoded one at a time and only the columns used by the
+tests are kept, in numpy arrays,
+
+    pgid, pool, state bitmask and state string, up/acting sets and primaries,
+    scrub stamps, objects and bytes for the PGs.
+    osd, up, in and weight for the OSDs.
+
+The common queries are vectorized over the columns,
+
+    table = rados_obj.get_pg_table()
+    table.pgids(~table.in_state("active", "clean", match="all"))
+    table.pgs_per_osd()
+    table.pgids(table.scrub_older_than(seconds=3600, deep=True))
+"""
+
+import json
+import re
+
+import numpy as np
+
+# PG states known to ceph, the unknown ones are appended while parsing
+PG_STATES = (
+    "creating",
+    "active",
+    "clean",
+    "down",
+    "recovery_unfound",
+    "backfill_unfound",
+    "scrubbing",
+    "degraded",
+    "inconsistent",
+    "peering",
+    "repair",
+    "recovering",
+    "backfill_wait",
+    "incomplete",
+    "stale",
+    "remapped",
+    "deep",
+    "backfilling",
+    "backfill_toofull",
+    "recovery_wait",
+    "recovery_toofull",
+    "undersized",
+    "activating",
+    "peered",
+    "snaptrim",
+    "snaptrim_wait",
+    "snaptrim_error",
+    "forced_recovery",
+    "forced_backfill",
+    "failed_repair",
+    "laggy",
+    "wait",
+    "premerge",
+    "unknown",
+)
+
+_decoder = json.JSONDecoder()
+_whitespace = re.compile(r"\s*")
+
+
+def iter_array(text: str, key: str):
+    """
+    Yield the entries of the first JSON array having the given key, one at a time.
+
+    Args:
+        text: JSON document, e.g. the output of ceph pg dump -f json
+        key: name of the array, e.g. pg_stats or osds
+
+    Returns:
+        generator of the decoded entries, none when the key is missing
+    """
+    match = re.search(rf'"{key}"\s*:\s*\[', text)
+    if not match:
+        return
+
+    index = match.end()
+    while True:
+        index = _whitespace.match(text, index).end()
+        if text[index] == "]":
+            return
+
+        entry, index = _decoder.raw_decode(text, index)
+        yield entry
+        index = _whitespace.match(text, index).end()
+        if text[index] == ",":
+            index += 1
+
+
+def _stamps(values):
+    """Return the ceph time stamps as datetime64, NaT when not set."""
+    stamps = [
+        value[:26].replace(" ", "T") if value and value[0] != "0" else "NaT"
+        for value in values
+    ]
+    return np.array(stamps, dtype="datetime64[us]")
+
+
+def _osd_sets(sets):
+    """Return the OSD sets as a 2D array padded with -1."""
+    width = max((len(osds) for osds in sets), default=0)
+    array = np.full((len(sets), width), -1, dtype=np.int32)
+    for row, osds in enumerate(sets):
+        array[row, : len(osds)] = osds
+
+    return array
+
+
+class PgTable:
+    """Columns of the PGs of a ceph pg dump or ceph pg ls output."""
+
+    def __init__(self, text: str):
+        """
+        Parse the PGs of the JSON output.
+
+        Args:
+            text: output of ceph pg dump, pg dump pgs or pg ls in json format
+        """
+        self.state_bits = {state: bit for bit, state in enumerate(PG_STATES)}
+        # Distinct state strings as reported, the PGs hold an index in them
+        self.state_names = []
+        state_ids = dict()
+        pgids, states, up, acting, scrub, deep_scrub = [], [], [], [], [], []
+        numbers = {
+            "up_primary": [],
+            "acting_primary": [],
+            "num_objects": [],
+            "num_bytes": [],
+        }
+
+        for pg in iter_array(text, "pg_stats"):
+            pgids.append(pg["pgid"])
+            if pg["state"] not in state_ids:
+                state_ids[pg["state"]] = len(self.state_names)
+                self.state_names.append(pg["state"])
+            states.append(state_ids[pg["state"]])
+            up.append(pg.get("up", []))
+            acting.append(pg.get("acting", []))
+            scrub.append(pg.get("last_scrub_stamp"))
+            deep_scrub.append(pg.get("last_deep_scrub_stamp"))
+            numbers["up_primary"].append(pg.get("up_primary", -1))
+            numbers["acting_primary"].append(pg.get("acting_primary", -1))
+            stat_sum = pg.get("stat_sum", {})
+            numbers["num_objects"].append(stat_sum.get("num_objects", 0))
+            numbers["num_bytes"].append(stat_sum.get("num_bytes", 0))
+
+        self.pgid = np.array(pgids, dtype=str)
+        self.pool = np.array([int(pgid.split(".")[0]) for pgid in pgids], np.int32)
+        self.state_id = np.array(states, dtype=np.uint32)
+        masks = [self._state_mask(name) for name in self.state_names]
+        self.state = np.array(masks, dtype=np.uint64)[self.state_id]
+        self.up = _osd_sets(up)
+        self.acting = _osd_sets(acting)
+        self.up_primary = np.array(numbers["up_primary"], dtype=np.int32)
+        self.acting_primary = np.array(numbers["acting_primary"], dtype=np.int32)
+        self.num_objects = np.array(numbers["num_objects"], dtype=np.int64)
+        self.num_bytes = np.array(numbers["num_bytes"], dtype=np.int64)
+        self.last_scrub_stamp = _stamps(scrub)
+        self.last_deep_scrub_stamp = _stamps(deep_scrub)
+
+    def __len__(self):
+        return len(self.pgid)
+
+    def _state_mask(self, state: str) -> int:
+        mask = 0
+        for name in state.split("+"):
+            if name not in self.state_bits:
+                self.state_bits[name] = len(self.state_bits)
+            mask |= 1 << self.state_bits[name]
+
+        return mask
+
+    def in_state(self, *states, match: str = "any"):
+        """
+        Return the mask of the PGs in the given states.
+
+        Args:
+            states: PG states like active, clean or scrubbing
+            match: any to have one of the states, all to have every state and
+                   exact to have only the given states
+        """
+        bits = [self.state_bits.get(state) for state in states]
+        if None in bits:
+            # a state not seen while parsing
+            if match == "any" and any(bit is not None for bit in bits):
+                bits = [bit for bit in bits if bit is not None]
+            else:
+                return np.zeros(len(self), dtype=bool)
+
+        mask = np.uint64(sum(1 << bit for bit in bits))
+        if match == "all":
+            return (self.state & mask) == mask
+        if match == "exact":
+            return self.state == mask
+
+        return (self.state & mask) != 0
+
+    def in_pool(self, pool_id: int):
+        """Return the mask of the PGs of the pool."""
+        return self.pool == pool_id
+
+    def on_osd(self, osd_id: int, primary: bool = False):
+        """Return the mask of the PGs having the OSD in the acting set."""
+        if primary:
+            return self.acting_primary == osd_id
+
+        return (self.acting == osd_id).any(axis=1)
+
+    def pgs_per_osd(self, primary: bool = False) -> dict:
+        """Return the number of PGs in the acting set of every OSD."""
+        osds = self.acting_primary if primary else self.acting.ravel()
+        osds = osds[osds >= 0]
+        counts = np.bincount(osds) if len(osds) else np.array([], dtype=np.int64)
+        return {osd: int(count) for osd, count in enumerate(counts) if count}
+
+    def scrub_older_than(self, seconds: float, deep: bool = False, now=None):
+        """
+        Return the mask of the PGs not scrubbed within the given time.
+
+        Args:
+            seconds: maximum age of the scrub stamp
+            deep: check the deep scrub stamp instead of the scrub stamp
+            now: reference time as numpy datetime64, defaults to the current UTC time
+        """
+        stamps = self.last_deep_scrub_stamp if deep else self.last_scrub_stamp
+        now = now if now is not None else np.datetime64("now", "us")
+        cutoff = now - np.timedelta64(int(seconds * 1e6), "us")
+        return np.isnat(stamps) | (stamps < cutoff)
+
+    def pgids(self, mask=None) -> list:
+        """Return the PG IDs, the ones selected by the mask when given."""
+        pgids = self.pgid if mask is None else self.pgid[mask]
+        return pgids.tolist()
+
+    def states(self, mask=None) -> list:
+        """Return the PG state strings, the ones selected by the mask when given."""
+        state_ids = self.state_id if mask is None else self.state_id[mask]
+        return [self.state_names[state_id] for state_id in state_ids]
+
+
+class OsdTable:
+    """Columns of the OSDs of a ceph osd dump output."""
+
+    def __init__(self, text: str):
+        """
+        Parse the OSDs of the JSON output.
+
+        Args:
+            text: output of ceph osd dump in json format
+        """
+        rows = [
+            (osd["osd"], osd["up"], osd["in"], osd.get("weight", 0.0))
+            for osd in iter_array(text, "osds")
+        ]
+        columns = list(zip(*rows)) or [(), (), (), ()]
+        self.osd = np.array(columns[0], dtype=np.int32)
+        self.up = np.array(columns[1], dtype=bool)
+        self.in_ = np.array(columns[2], dtype=bool)
+        self.weight = np.array(columns[3], dtype=np.float32)
+
+    def __len__(self):
+        return len(self.osd)
+
+    def osds(self, mask=None) -> list:
+        """Return the OSD IDs, the ones selected by the mask when given."""
+        osds = self.osd if mask is None else self.osd[mask]
+        return osds.tolist()
+
+    def down(self):
+        """Return the mask of the OSDs not up."""
+        return ~self.up
+
+    def out(self):
+        """Return the mask of the OSDs not in."""
+        return ~self.in_
@@ -0,0 +1,391 @@
+"""
+Module to evaluate the PG placement of a cluster offline.
+
+The crushtool and osdmaptool tests edit and query the maps of the cluster one
+remote command at a time, and the balancer tests poll the cluster to see the
+outcome. The placement simulator instead fetches the osdmap and the crushmap
+once, runs the tools over every PG mapping in a single call and does the
+analysis in memory using numpy,
+
+1. PG and primary distribution across the OSDs, per pool or for the cluster.
+2. read balance scores of the replicated pools.
+3. CRUSH rule mappings and utilization for any number of inputs.
+4. expected PG distribution and read scores after applying the upmap and
+   read balancer recommendations of osdmaptool, without setting them.
+
+  Typical usage example:
+
+    simulator = PlacementSimulator(client_node)
+    simulator.fetch()
+    scores = simulator.read_scores()
+    after_upmap = simulator.expected_upmap(pool_name="test-pool")
+    stats = distribution_stats(after_upmap.pg_counts(simulator.num_osds))
+"""
+
+import json
+import re
+
+import numpy as np
+
+from utility.log import Log
+
+log = Log(__name__)
+
+# CRUSH_ITEM_NONE, printed by the tools for holes in the EC sets
+ITEM_NONE = 2147483647
+
+PG_MAPPING_PATTERN = re.compile(
+    r"^(\d+\.[0-9a-f]+)\s+raw \(\[[^\]]*\], p-?\d+\)\s+"
+    r"up \(\[([^\]]*)\], p(-?\d+)\)\s+acting \(\[([^\]]*)\], p(-?\d+)\)",
+    re.M,
+)
+CRUSH_MAPPING_PATTERN = re.compile(r"^CRUSH rule \d+ x (\d+) \[([^\]]*)\]", re.M)
+UPMAP_ITEMS_PATTERN = re.compile(r"pg-upmap-items\s+(\d+\.[0-9a-f]+)((?:\s+\d+)+)")
+UPMAP_PRIMARY_PATTERN = re.compile(r"pg-upmap-primary\s+(\d+\.[0-9a-f]+)\s+(\d+)")
+
+
+def _osd_list(text: str) -> list:
+    osds = [int(osd) for osd in text.split(",") if osd.strip()]
+    return [-1 if osd == ITEM_NONE else osd for osd in osds]
+
+
+def _osd_array(sets: list) -> np.ndarray:
+    """Return the OSD sets as a 2D array padded with -1."""
+    width = max((len(osds) for osds in sets), default=0)
+    array = np.full((len(sets), width), -1, dtype=np.int32)
+    for row, osds in enumerate(sets):
+        array[row, : len(osds)] = osds
+
+    return array
+
+
+def parse_upmap_items(text: str) -> dict:
+    """
+    Parse the pg-upmap-items recommendations of osdmaptool --upmap.
+
+    Returns:
+        dictionary of PG ID and list of (from OSD, to OSD) pairs
+    """
+    items = {}
+    for pgid, osds in UPMAP_ITEMS_PATTERN.findall(text):
+        osds = [int(osd) for osd in osds.split()]
+        items[pgid] = list(zip(osds[::2], osds[1::2]))
+
+    return items
+
+
+def parse_upmap_primaries(text: str) -> dict:
+    """
+    Parse the pg-upmap-primary recommendations of osdmaptool --read.
+
+    Returns:
+        dictionary of PG ID and the new primary OSD
+    """
+    return {pgid: int(osd) for pgid, osd in UPMAP_PRIMARY_PATTERN.findall(text)}
+
+
+def distribution_stats(counts, weights=None) -> dict:
+    """
+    Summarize the distribution of the PGs across the OSDs.
+
+    Args:
+        counts: number of PGs of every OSD, indexed by the OSD ID
+        weights: weight of every OSD, the OSDs having 0 weight are left out,
+                 all the OSDs having PGs are considered when not given
+
+    Returns:
+        dictionary having the min, max, mean, stddev and the max deviation
+        of the PG count from the count expected by the weights
+    """
+    counts = np.asarray(counts, dtype=np.float64)
+    if weights is None:
+        weights = (counts > 0).astype(np.float64)
+    weights = np.asarray(weights, dtype=np.float64)[: len(counts)]
+    counts = counts[: len(weights)]
+    selected = weights > 0
+    if not selected.any():
+        return {"min": 0, "max": 0, "mean": 0.0, "stddev": 0.0, "max_deviation": 0.0}
+
+    counts, weights = counts[selected], weights[selected]
+    expected = counts.sum() * weights / weights.sum()
+    return {
+        "min": int(counts.min()),
+        "max": int(counts.max()),
+        "mean": round(float(counts.mean()), 2),
+        "stddev": round(float(counts.std()), 2),
+        "max_deviation": round(float(np.abs(counts - expected).max()), 2),
+    }
+
+
+class PgMappings:
+    """Up and acting sets of the PGs, in columns."""
+
+    def __init__(self, pgids, up, up_primary, acting, acting_primary):
+        self.pgid = np.asarray(pgids, dtype=str)
+        self.pool = np.array([int(pgid.split(".")[0]) for pgid in self.pgid], np.int32)
+        self.up = np.asarray(up, dtype=np.int32).reshape(len(self.pgid), -1)
+        self.up_primary = np.asarray(up_primary, dtype=np.int32)
+        self.acting = np.asarray(acting, dtype=np.int32).reshape(len(self.pgid), -1)
+        self.acting_primary = np.asarray(acting_primary, dtype=np.int32)
+
+    @classmethod
+    def from_dump(cls, text: str):
+        """
+        Parse the output of osdmaptool --test-map-pgs-dump-all.
+        Args:
+            text: lines like 1.0 raw ([2,1,0], p2) up ([2,1,0], p2) acting ([2,1,0], p2)
+        """
+        pgids, up, up_primary, acting, acting_primary = [], [], [], [], []
+        for match in PG_MAPPING_PATTERN.finditer(text):
+            pgids.append(match.group(1))
+            up.append(_osd_list(match.group(2)))
+            up_primary.append(int(match.group(3)))
+            acting.append(_osd_list(match.group(4)))
+            acting_primary.append(int(match.group(5)))
+
+        return cls(
+            pgids, _osd_array(up), up_primary, _osd_array(acting), acting_primary
+        )
+
+    def __len__(self):
+        return len(self.pgid)
+
+    def _copy(self, mask=None):
+        mask = slice(None) if mask is None else mask
+        return PgMappings(
+            self.pgid[mask],
+            self.up[mask].copy(),
+            self.up_primary[mask].copy(),
+            self.acting[mask].copy(),
+            self.acting_primary[mask].copy(),
+        )
+
+    def select(self, pool_id: int):
+        """Return the mappings of the PGs of the pool."""
+        return self._copy(self.pool == pool_id)
+
+    def pg_counts(self, num_osds: int, acting: bool = True) -> np.ndarray:
+        """Return the number of PGs mapped to every OSD."""
+        osds = (self.acting if acting else self.up).ravel()
+        return np.bincount(osds[osds >= 0], minlength=num_osds)
+
+    def primary_counts(self, num_osds: int, acting: bool = True) -> np.ndarray:
+        """Return the number of PGs having every OSD as primary."""
+        primaries = self.acting_primary if acting else self.up_primary
+        return np.bincount(primaries[primaries >= 0], minlength=num_osds)
+
+    def apply_upmap_items(self, items: dict):
+        """
+        Return the mappings after applying the pg-upmap-items.
+        The PGs are expected to be clean afterwards, i.e. acting same as up.
+
+        Args:
+            items: dictionary of PG ID and list of (from OSD, to OSD) pairs
+        """
+        mappings = self._copy()
+        rows = {pgid: row for row, pgid in enumerate(mappings.pgid.tolist())}
+        for pgid, pairs in items.items():
+            if pgid not in rows:
+                continue
+
+            up = mappings.up[rows[pgid]]
+            for source, target in pairs:
+                if target in up:
+                    continue
+                up[up == source] = target
+
+            valid = up[up >= 0]
+            mappings.up_primary[rows[pgid]] = valid[0] if len(valid) else -1
+
+        mappings.acting = mappings.up.copy()
+        mappings.acting_primary = mappings.up_primary.copy()
+        return mappings
+
+    def apply_upmap_primaries(self, primaries: dict):
+        """
+        Return the mappings after applying the pg-upmap-primary recommendations.
+
+        Args:
+            primaries: dictionary of PG ID and the new primary OSD
+        """
+        mappings = self._copy()
+        rows = {pgid: row for row, pgid in enumerate(mappings.pgid.tolist())}
+        for pgid, osd in primaries.items():
+            row = rows.get(pgid)
+            if row is not None and osd in mappings.acting[row]:
+                mappings.acting_primary[row] = osd
+                mappings.up_primary[row] = osd
+
+        return mappings
+
+    def read_score(self, num_osds: int) -> float:
+        """
+        Return the read balance score of the mappings of a replicated pool.
+
+        The score is the ratio of the primaries on the most loaded OSD to the
+        average primaries of the OSDs of the pool, 1 being perfectly balanced.
+        """
+        osds = np.flatnonzero(self.pg_counts(num_osds))
+        if not len(osds) or not len(self):
+            return 0.0
+
+        primaries = self.primary_counts(num_osds)[osds]
+        return round(float(primaries.max() / (len(self) / len(osds))), 2)
+
+
+class PlacementSimulator:
+    """Maps of the cluster fetched once, analysed in memory."""
+
+    def __init__(self, client, loc: str = "/tmp/cephci_placement"):
+        """
+        initializes the simulator
+        Args:
+            client: node having the ceph-base package, where the tools run
+            loc: directory of the maps and the tool outputs on the client
+        """
+        self.client = client
+        self.loc = loc
+        self.osdmap_loc = f"{loc}/osd_map"
+        self.crushmap_loc = f"{loc}/crush_map"
+        self.osdmap = {}
+        self.mappings = None
+
+    def _run(self, cmd: str) -> str:
+        out, _ = self.client.exec_command(cmd=cmd, sudo=True)
+        return out
+
+    def fetch(self, osdmap_loc: str = None):
+        """
+        Fetch the maps of the cluster and the mappings of every PG.
+        Args:
+            osdmap_loc: existing osdmap file on the client to use instead,
+                        e.g. the one generated by OsdToolWorkflows.generate_osdmap
+        """
+        if osdmap_loc:
+            self.osdmap_loc = osdmap_loc
+            self._run(f"mkdir -p {self.loc}")
+        else:
+            self._run(f"mkdir -p {self.loc} && ceph osd getmap -o {self.osdmap_loc}")
+
+        self._run(f"osdmaptool {self.osdmap_loc} --export-crush {self.crushmap_loc}")
+        self.osdmap = json.loads(self._run(f"osdmaptool {self.osdmap_loc} --dump json"))
+        self.mappings = PgMappings.from_dump(
+            self._run(f"osdmaptool {self.osdmap_loc} --test-map-pgs-dump-all")
+        )
+        log.info(
+            f"Fetched the maps of epoch {self.osdmap.get('epoch')} having "
+            f"{len(self.mappings)} PGs and {self.num_osds} OSDs"
+        )
+
+    @property
+    def num_osds(self) -> int:
+        return max((osd["osd"] for osd in self.osdmap.get("osds", [])), default=-1) + 1
+
+    @property
+    def pools(self) -> dict:
+        """Pools of the osdmap keyed by the pool name."""
+        return {pool["pool_name"]: pool for pool in self.osdmap.get("pools", [])}
+
+    def osd_weights(self) -> np.ndarray:
+        """Return the weight of every OSD, 0 for the down and out OSDs."""
+        weights = np.zeros(self.num_osds, dtype=np.float64)
+        for osd in self.osdmap.get("osds", []):
+            if osd["up"] and osd["in"]:
+                weights[osd["osd"]] = osd.get("weight", 1.0)
+
+        return weights
+
+    def pool_mappings(self, pool_name: str = None) -> PgMappings:
+        """Return the mappings of the pool, of every PG when not given."""
+        if pool_name is None:
+            return self.mappings
+
+        return self.mappings.select(self.pools[pool_name]["pool"])
+
+    def pg_distribution(self, pool_name: str = None) -> dict:
+        """Return the distribution stats of the PGs of the pool or the cluster."""
+        counts = self.pool_mappings(pool_name).pg_counts(self.num_osds)
+        weights = self.osd_weights() if pool_name is None else None
+        return distribution_stats(counts, weights)
+
+    def read_scores(self) -> dict:
+        """
+        Return the read balance scores of the replicated pools, like
+        RadosOrchestrator.get_read_scores_on_cluster computed from the osdmap.
+        """
+        return {
+            name: self.pool_mappings(name).read_score(self.num_osds)
+            for name, pool in self.pools.items()
+            if not pool.get("erasure_code_profile")
+        }
+
+    def crush_mappings(self, rule: int, num_rep: int, max_x: int = 1023):
+        """
+        Map the inputs 0 to max_x using the CRUSH rule, in one crushtool run.
+        Returns:
+            2D array of the OSDs of every input, padded with -1 for bad mappings
+        """
+        out = self._run(
+            f"crushtool -i {self.crushmap_loc} --test --show-mappings --rule {rule} "
+            f"--num-rep {num_rep} --min-x 0 --max-x {max_x}"
+        )
+        sets = [[] for _ in range(max_x + 1)]
+        for x, osds in CRUSH_MAPPING_PATTERN.findall(out):
+            sets[int(x)] = _osd_list(osds)
+
+        array = _osd_array(sets)
+        if array.shape[1] < num_rep:
+            array = np.pad(
+                array, ((0, 0), (0, num_rep - array.shape[1])), constant_values=-1
+            )
+        return array
+
+    def crush_utilization(self, rule: int, num_rep: int, max_x: int = 1023) -> dict:
+        """
+        Return the stats of the CRUSH rule mappings across the OSDs, along with
+        the number of bad mappings, i.e. inputs mapped to less than num_rep OSDs.
+        """
+        osd_sets = self.crush_mappings(rule, num_rep, max_x)
+        osds = osd_sets.ravel()
+        counts = np.bincount(osds[osds >= 0], minlength=self.num_osds)
+        stats = distribution_stats(counts, self.osd_weights())
+        stats["bad_mappings"] = int(((osd_sets >= 0).sum(axis=1) < num_rep).sum())
+        return stats
+
+    def upmap_items(self, pool_name: str = None, **kwargs) -> dict:
+        """
+        Return the upmap recommendations of osdmaptool --upmap for the osdmap.
+        Args:
+            pool_name: restrict the recommendations to the pool
+            kwargs:
+                max_changes: maximum number of PGs to remap
+                deviation: maximum deviation of the PG count of the OSDs
+        """
+        target = f"{self.loc}/upmap_res.txt"
+        cmd = f"osdmaptool {self.osdmap_loc} --upmap {target}"
+        if pool_name:
+            cmd += f" --upmap-pool {pool_name}"
+        if kwargs.get("max_changes"):
+            cmd += f" --upmap-max {kwargs['max_changes']}"
+        if kwargs.get("deviation"):
+            cmd += f" --upmap-deviation {kwargs['deviation']}"
+
+        return parse_upmap_items(self._run(f"{cmd} > /dev/null && cat {target}"))
+
+    def expected_upmap(self, pool_name: str = None, **kwargs) -> PgMappings:
+        """Return the mappings expected after setting the upmap recommendations."""
+        items = self.upmap_items(pool_name, **kwargs)
+        log.info(f"osdmaptool recommends remapping {len(items)} PGs")
+        return self.pool_mappings(pool_name).apply_upmap_items(items)
+
+    def upmap_primaries(self, pool_name: str) -> dict:
+        """Return the read balancer recommendations of osdmaptool --read for the pool."""
+        target = f"{self.loc}/{pool_name}_res.txt"
+        cmd = f"osdmaptool {self.osdmap_loc} --read {target} --read-pool {pool_name}"
+        return parse_upmap_primaries(self._run(f"{cmd} > /dev/null && cat {target}"))
+
+    def expected_read_score(self, pool_name: str) -> float:
+        """Return the read score of the pool expected after the read balancing."""
+        primaries = self.upmap_primaries(pool_name)
+        mappings = self.pool_mappings(pool_name).apply_upmap_primaries(primaries)
+        return mappings.read_score(self.num_osds)
@@ -25,6 +25,7 @@ import json
 from collections import defaultdict
 
 from ceph.rados.core_workflows import RadosOrchestrator
+from ceph.rados.pg_table import iter_array
 from utility.log import Log
 
 log = Log(__name__)
@@ -80,14 +81,15 @@ class RadosScrubber(RadosOrchestrator):
         column_dict = defaultdict(list)
 
         log.info(f'{"Getting  PG dump of the cluster"}')
-        pgDump = super().run_ceph_command(cmd=cmd)
         if args:
+            # decode the PGs one at a time, keeping only the requested columns
             columns = list(args)
-            for detail in pgDump["pg_map"]["pg_stats"]:
+            for detail in iter_array(self._ceph_output(cmd) or "", "pg_stats"):
                 for column in columns:
                     column_dict[column].append(detail[column])
             return column_dict
         else:
+            pgDump = super().run_ceph_command(cmd=cmd)
             return pgDump
 
     def verify_scrub_deepscrub(self, before_scrub_data, after_scrub_data, flag):
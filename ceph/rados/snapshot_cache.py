@@ -0,0 +1,227 @@
+"""
+Snapshot cache of the cluster state queries issued by RadosOrchestrator.
+
+Helpers like get_pool_details, get_pg_acting_set or get_osd_df_stats fetch the
+osd dump, pg dump, df and osd tree independently, often several times within
+one assertion. The cache serves the repeated reads from memory,
+
+1. osdmap derived queries are kept as long as the osdmap epoch is unchanged.
+2. pgmap derived queries (usage, pg states) are only kept for the ttl window
+   since the pgmap version advances with every mgr stats report.
+3. Any mutating command executed through the cephadm shell drops the cache.
+
+A single cache is shared by all the RadosOrchestrator objects of a cluster.
+The cache is enabled by the snapshot_cache config. Commands executed directly
+on the nodes, e.g. using client.exec_command, do not drop it, hence it is
+meant for the tests modifying the cluster through the cephadm shell only.
+"""
+
+import json
+import time
+from typing import Callable, Dict, Optional
+
+from utility.log import Log
+
+log = Log(__name__)
+
+OSDMAP = "osdmap"
+PGMAP = "pgmap"
+
+# Query prefixes that are served from the cache, mapped to the map they depend on
+CACHEABLE_QUERIES = {
+    "ceph osd dump": OSDMAP,
+    "ceph osd tree": OSDMAP,
+    "ceph osd ls": OSDMAP,
+    "ceph osd pool ls": OSDMAP,
+    "ceph osd pool get": OSDMAP,
+    "ceph osd crush rule": OSDMAP,
+    "ceph osd map": OSDMAP,
+    "ceph pg map": OSDMAP,
+    "ceph pg dump": PGMAP,
+    "ceph pg ls": PGMAP,
+    "ceph df": PGMAP,
+    "ceph osd df": PGMAP,
+    "ceph osd pool stats": PGMAP,
+}
+
+# Leading words of the ceph commands that do not modify the cluster, the words
+# following them are arguments like pool or object names
+READ_ONLY_COMMANDS = tuple(CACHEABLE_QUERIES) + (
+    "ceph -s",
+    "ceph status",
+    "ceph health",
+    "ceph fsid",
+    "ceph versions",
+    "ceph report",
+    "ceph quorum_status",
+    "ceph mon dump",
+    "ceph mon stat",
+    "ceph mgr dump",
+    "ceph mgr stat",
+    "ceph osd stat",
+    "ceph osd find",
+    "ceph osd metadata",
+    "ceph osd crush dump",
+    "ceph osd crush ls",
+    "ceph osd crush tree",
+    "ceph osd erasure-code-profile get",
+    "ceph osd erasure-code-profile ls",
+    "ceph pg stat",
+    "ceph config dump",
+    "ceph config get",
+    "ceph config show",
+    "ceph orch ls",
+    "ceph orch ps",
+    "ceph orch host ls",
+    "ceph crash ls",
+    "ceph crash ls-new",
+)
+
+# Shared snapshot caches keyed by the installer IP address
+SNAPSHOT_CACHES = {}
+
+
+def _normalize(cmd: str) -> str:
+    """Return the ceph command without sudo, the format option and extra spaces."""
+    words = cmd.split()
+    if words and words[0] == "sudo":
+        words = words[1:]
+
+    for opt in ("-f", "--format"):
+        while opt in words:
+            idx = words.index(opt)
+            del words[idx : idx + 2]
+
+    return " ".join(words)
+
+
+def is_read_only(cmd: str) -> bool:
+    """
+    Return True when the command does not modify the cluster state.
+
+    Only the commands starting with one of the READ_ONLY_COMMANDS are
+    considered, any other command is treated as mutating.
+
+    Args:
+        cmd: command executed on the cluster
+    """
+    query = _normalize(cmd)
+    return any(
+        query == prefix or query.startswith(f"{prefix} ")
+        for prefix in READ_ONLY_COMMANDS
+    )
+
+
+class SnapshotCache:
+    """Epoch aware cache of the ceph query outputs."""
+
+    def __init__(self, runner: Callable[[str], str], ttl: float = 5) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            runner: executes the given ceph command and returns its output
+            ttl: seconds within which the entries are served without revalidation
+        """
+        self.runner = runner
+        self.ttl = ttl
+        self._entries = {}
+        self._epoch = None
+        self.stats = {"hits": 0, "misses": 0, "invalidations": 0, "validations": 0}
+
+    @staticmethod
+    def map_of(cmd: str) -> Optional[str]:
+        """Return the map the query depends on, None when it is not cacheable."""
+        query = _normalize(cmd)
+        for prefix, map_ in CACHEABLE_QUERIES.items():
+            if query == prefix or query.startswith(f"{prefix} "):
+                return map_
+
+        return None
+
+    def osdmap_epoch(self) -> int:
+        """Return the current osdmap epoch, checked at most once per ttl window."""
+        now = time.monotonic()
+        if self._epoch and now - self._epoch[1] < self.ttl:
+            return self._epoch[0]
+
+        self.stats["validations"] += 1
+        epoch = json.loads(self.runner("ceph osd stat -f json"))["epoch"]
+        self._epoch = (epoch, now)
+        return epoch
+
+    def get(self, cmd: str, fetch: Callable[[], str]) -> str:
+        """
+        Return the output of the query, fetching it when the cached one is stale.
+
+        Args:
+            cmd: ceph query
+            fetch: executes the query and returns its output
+        """
+        map_ = self.map_of(cmd)
+        if not map_:
+            return fetch()
+
+        key = _normalize(cmd)
+        entry = self._entries.get(key)
+        now = time.monotonic()
+
+        if entry and now - entry["time"] < self.ttl:
+            self.stats["hits"] += 1
+            return entry["out"]
+
+        epoch = self.osdmap_epoch() if map_ == OSDMAP else None
+        if entry and epoch is not None and entry["epoch"] == epoch:
+            self.stats["hits"] += 1
+            entry["time"] = now
+            return entry["out"]
+
+        self.stats["misses"] += 1
+        out = fetch()
+        self._entries[key] = {"out": out, "epoch": epoch, "time": time.monotonic()}
+        return out
+
+    def observe(self, cmd: str) -> None:
+        """Drop the cached state when the executed command is a mutating one."""
+        if is_read_only(cmd) or not (self._entries or self._epoch):
+            return
+
+        log.debug(f"Dropping the cluster state snapshot after {cmd}")
+        self.invalidate()
+
+    def invalidate(self) -> None:
+        """Drop all cached entries."""
+        self.stats["invalidations"] += 1
+        self._entries.clear()
+        self._epoch = None
+
+    def summary(self) -> Dict:
+        """Return the cache metrics along with the hit ratio."""
+        lookups = self.stats["hits"] + self.stats["misses"]
+        summary = dict(self.stats)
+        summary["hit_ratio"] = round(self.stats["hits"] / lookups, 3) if lookups else 0
+        return summary
+
+
+def get_snapshot_cache(node) -> SnapshotCache:
+    """
+    Return the snapshot cache shared by the cluster of the given CephAdmin object.
+
+    The cache is registered as shell observer, hence every mutating command
+    executed using the cephadm shell of the cluster invalidates it.
+
+    Args:
+        node: CephAdmin object
+    """
+    key = node.installer.node.ip_address
+    if key not in SNAPSHOT_CACHES:
+
+        def runner(cmd):
+            out, _ = node.shell([cmd], print_output=False)
+            return out
+
+        cache = SnapshotCache(runner, ttl=node.config.get("snapshot_cache_ttl", 5))
+        node.add_shell_observer(cache.observe)
+        SNAPSHOT_CACHES[key] = cache
+
+    return SNAPSHOT_CACHES[key]
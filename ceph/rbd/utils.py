@@ -3,6 +3,7 @@ import random
 import string
 
 from ceph.ceph import CommandFailed
+from ceph.rbd.workflows.image_compare import compare_image_data
 from utility.log import Log
 
 log = Log(__name__)
@@ -89,7 +90,13 @@ def check_data_integrity(**kw):
             "client":<client_node>
         }
     }
+    When both the sides have the image_spec, the allocated extents of the images
+    are hashed in place using compare_image_data instead of exporting them.
     """
+    if kw["first"].get("image_spec") and kw["second"].get("image_spec"):
+        # compare the allocated extents of the images, without exporting them
+        return compare_image_data(first=kw["first"], second=kw["second"])
+
     md5_sum_first = get_md5sum_rbd_image(**kw.get("first"))
     if not md5_sum_first:
         log.error("Error while fetching md5sum")
@@ -0,0 +1,252 @@
+"""
+Module to compare the data of RBD images without exporting them to disk.
+
+Exporting both images and running md5sum over the files reads and writes the
+whole provisioned size twice on every cluster. Instead, the images are hashed
+on their client nodes in fixed size chunks,
+
+1. only the chunks having allocated extents, found using the diff of the
+   image, are read and hashed, the others hold zeros.
+2. the image is read using librbd, or by streaming rbd export to stdout when
+   the python bindings are not installed, nothing is written to disk.
+3. both the images are hashed concurrently.
+
+The chunk hashes are then compared to report the first mismatching offset.
+The images can be on the same or different clusters, e.g. mirrored images,
+clones, migrated images or snapshots,
+
+    compare_image_data(
+        first={"image_spec": "pool/image", "client": primary_client},
+        second={"image_spec": "pool/image", "client": secondary_client},
+    )
+"""
+
+import hashlib
+import json
+from uuid import uuid4
+
+from ceph.parallel import parallel
+from utility.log import Log
+
+log = Log(__name__)
+
+CHUNK_SIZE = 4 * 1024 * 1024
+
+# Executed on the client node, prints the size and the chunk hashes as json
+HASH_SCRIPT = r"""
+import hashlib
+import json
+import subprocess
+import sys
+
+
+def allocated_chunks(extents, chunk_size):
+    chunks = set()
+    for offset, length in extents:
+        if length:
+            chunks.update(range(offset // chunk_size, (offset + length - 1) // chunk_size + 1))
+    return chunks
+
+
+def parse_spec(spec):
+    spec, _, snap = spec.partition("@")
+    parts = spec.split("/")
+    if len(parts) == 1:
+        parts = ["rbd"] + parts
+    pool, image = parts[0], parts[-1]
+    namespace = parts[1] if len(parts) == 3 else ""
+    return pool, namespace, image, snap or None
+
+
+def librbd_hashes(spec, cluster, chunk_size):
+    import rados
+    import rbd
+
+    pool, namespace, image, snap = parse_spec(spec)
+    extents, hashes = [], {}
+
+    def collect(offset, length, exists):
+        if exists:
+            extents.append((offset, length))
+        return 0
+
+    with rados.Rados(conffile=f"/etc/ceph/{cluster}.conf") as conn:
+        with conn.open_ioctx(pool) as ioctx:
+            ioctx.set_namespace(namespace)
+            with rbd.Image(ioctx, image, snapshot=snap, read_only=True) as img:
+                size = img.size()
+                img.diff_iterate(0, size, None, collect, include_parent=True, whole_object=True)
+                for chunk in sorted(allocated_chunks(extents, chunk_size)):
+                    offset = chunk * chunk_size
+                    data = img.read(offset, min(chunk_size, size - offset))
+                    hashes[chunk] = hashlib.md5(data).hexdigest()
+    return size, hashes
+
+
+def export_hashes(spec, cluster, chunk_size):
+    rbd_cmd = ["rbd", "--cluster", cluster]
+    info = json.loads(subprocess.check_output(rbd_cmd + ["info", spec, "--format", "json"]))
+    diff = json.loads(
+        subprocess.check_output(rbd_cmd + ["diff", spec, "--whole-object", "--format", "json"])
+    )
+    extents = [(e["offset"], e["length"]) for e in diff if e.get("exists") in (True, "true")]
+    chunks = allocated_chunks(extents, chunk_size)
+    last, hashes, chunk = max(chunks, default=-1), {}, 0
+    proc = subprocess.Popen(
+        rbd_cmd + ["export", spec, "-", "--no-progress"], stdout=subprocess.PIPE
+    )
+    while chunk <= last:
+        data = proc.stdout.read(chunk_size)
+        if not data:
+            break
+        if chunk in chunks:
+            hashes[chunk] = hashlib.md5(data).hexdigest()
+        chunk += 1
+    if chunk <= last:
+        if proc.wait():
+            sys.exit(f"rbd export of {spec} failed")
+    else:
+        proc.kill()
+        proc.wait()
+    return info["size"], hashes
+
+
+def main(spec, cluster, chunk_size):
+    chunk_size = int(chunk_size)
+    try:
+        size, hashes = librbd_hashes(spec, cluster, chunk_size)
+    except ImportError:
+        size, hashes = export_hashes(spec, cluster, chunk_size)
+    print(json.dumps({"size": size, "chunk_size": chunk_size, "hashes": hashes}))
+
+
+main(*sys.argv[1:])
+"""
+
+
+def get_image_chunk_hashes(client, image_spec, chunk_size=CHUNK_SIZE, cluster="ceph"):
+    """
+    Hash the allocated chunks of the image on the client node.
+
+    Args:
+        client: client node of the cluster having the image
+        image_spec: <pool>/[<namespace>/]<image>[@<snap>]
+        chunk_size: size of the hashed chunks in bytes
+        cluster: name of the cluster configuration on the client
+
+    Returns:
+        dictionary having the image size, chunk_size and the md5 of every
+        allocated chunk keyed by the chunk index
+    """
+    # Unique per call, both the images can be hashed on the same client
+    path = f"/tmp/cephci_rbd_chunk_hash_{uuid4().hex}.py"
+    script = client.remote_file(sudo=True, file_name=path, file_mode="w")
+    script.write(HASH_SCRIPT)
+    script.flush()
+    script.close()
+
+    try:
+        out, _ = client.exec_command(
+            sudo=True,
+            cmd=f"python3 {path} {image_spec} {cluster} {chunk_size}",
+            timeout=3600,
+        )
+    finally:
+        client.exec_command(sudo=True, cmd=f"rm -f {path}", check_ec=False)
+    result = json.loads(out)
+    result["hashes"] = {int(chunk): md5 for chunk, md5 in result["hashes"].items()}
+    log.info(
+        f"Hashed {len(result['hashes'])} allocated chunks of {image_spec} "
+        f"having size {result['size']}"
+    )
+    return result
+
+
+def find_first_mismatch(first, second):
+    """
+    Compare the chunk hashes of two images.
+
+    Args:
+        first: chunk hashes returned by get_image_chunk_hashes
+        second: chunk hashes returned by get_image_chunk_hashes
+
+    Returns:
+        offset of the first mismatching chunk, None when the data matches
+    """
+    if first["chunk_size"] != second["chunk_size"]:
+        raise ValueError("Chunk hashes of different chunk sizes can't be compared")
+
+    chunk_size = first["chunk_size"]
+    size = min(first["size"], second["size"])
+    zero_hashes = {}
+
+    def chunk_hash(hashes, chunk):
+        if chunk in hashes:
+            return hashes[chunk]
+
+        length = min(chunk_size, size - chunk * chunk_size)
+        if length not in zero_hashes:
+            zero_hashes[length] = hashlib.md5(bytes(length)).hexdigest()
+        return zero_hashes[length]
+
+    for chunk in sorted(set(first["hashes"]) | set(second["hashes"])):
+        if chunk * chunk_size >= size:
+            break
+        if chunk_hash(first["hashes"], chunk) != chunk_hash(second["hashes"], chunk):
+            return chunk * chunk_size
+
+    if first["size"] != second["size"]:
+        return size
+
+    return None
+
+
+def compare_image_data(**kw):
+    """
+    Compare the data of two images, hashing them concurrently.
+
+    kw: {
+        "first": {
+            "image_spec": <pool/image[@snap]>,
+            "client": <client_node>,
+            "cluster": <cluster name, default ceph>
+        },
+        "second": {
+            "image_spec": <pool/image[@snap]>,
+            "client": <client_node>,
+            "cluster": <cluster name, default ceph>
+        },
+        "chunk_size": <size of the hashed chunks in bytes>
+    }
+
+    Returns:
+        0 if the data matches, 1 otherwise, the first mismatching offset is logged
+    """
+    chunk_size = kw.get("chunk_size", CHUNK_SIZE)
+
+    def _hash(key):
+        spec = kw[key]
+        return key, get_image_chunk_hashes(
+            spec["client"],
+            spec["image_spec"],
+            chunk_size=chunk_size,
+            cluster=spec.get("cluster", "ceph"),
+        )
+
+    with parallel() as p:
+        p.spawn(_hash, "first")
+        p.spawn(_hash, "second")
+        hashes = dict(p)
+
+    offset = find_first_mismatch(hashes["first"], hashes["second"])
+    if offset is not None:
+        log.error(
+            f"Data of {kw['first']['image_spec']} and {kw['second']['image_spec']} "
+            f"differs at offset {offset}"
+        )
+        return 1
+
+    log.info(
+        f"Data of {kw['first']['image_spec']} and {kw['second']['image_spec']} matches"
+    )
+    return 0
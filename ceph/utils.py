@@ -2,6 +2,7 @@ import datetime
 import json
 import os
 import re
+import socket
 import time
 import traceback
 from json import loads
@@ -10,7 +11,6 @@ from time import mktime
 import requests
 import yaml
 from gevent import sleep
-from htmllistparse import fetch_listing
 from libcloud.common.exceptions import BaseHTTPError
 from libcloud.compute.providers import get_driver
 from libcloud.compute.types import Provider
@@ -19,17 +19,31 @@ from cli.utilities.configure import add_centos_epel_repo
 from compute.baremetal import CephBaremetalNode
 from compute.ibm_vpc import CephVMNodeIBM, get_ibm_service
 from compute.openstack import CephVMNodeV2, NetworkOpFailure, NodeError, VolumeOpFailure
+from utility.lazy_import import lazy_import
 from utility.log import Log
+from utility.rate_limiter import TokenBucket
 from utility.retry import retry
 from utility.utils import generate_node_name
 
 from .ceph import Ceph, CommandFailed, RolesContainer
 from .parallel import parallel
+from .waiter import Backoff
 
 log = Log(__name__)
+
+# Pulls in setuptools, only required to look up the OSBS builds
+htmllistparse = lazy_import("htmllistparse")
 RETRY_EXCEPTIONS = (NodeError, VolumeOpFailure, NetworkOpFailure)
 DEFAULT_OSBS_SERVER = "http://file.corp.redhat.com/~kdreyer/osbs/"
 
+# Maximum number of concurrent cloud API operations
+CLOUD_API_WORKERS = 10
+
+# Default rate (requests per second) and burst of VM create requests. They can be
+# overridden using provision-rate and provision-burst keys of the cloud credentials.
+PROVISION_RATE = 0.2
+PROVISION_BURST = 4
+
 
 def cleanup_ibmc_ceph_nodes(ibm_cred, pattern):
     """
@@ -66,17 +80,16 @@ def cleanup_ibmc_ceph_nodes(ibm_cred, pattern):
         instances += instance_list
 
     # Throttling removal otherwise Cloudflare will blacklist us
-    counter = 0
-    with parallel() as p:
+    limiter = TokenBucket(rate=1 / 3)
+    with parallel(max_workers=CLOUD_API_WORKERS) as p:
         for instance in instances:
-            sleep(counter * 3)
+            limiter.acquire()
             vsi = CephVMNodeIBM(
                 access_key=ibmc["access-key"],
                 service_url=ibmc["service-url"],
                 node=instance,
             )
             p.spawn(vsi.delete, ibmc["zone_name"])
-            counter += 1
 
     log.info(f"Done cleaning up nodes with pattern {pattern}")
 
@@ -119,6 +132,65 @@ def create_baremetal_ceph_nodes(cluster_conf):
     return ceph_nodes
 
 
+def provision_rate_limiter(cloud_cred):
+    """
+    Return the rate limiter for the VM create requests.
+
+    Args:
+        cloud_cred (dict):  Cloud credentials having optional provision-rate and
+                            provision-burst keys.
+
+    Returns:
+        TokenBucket
+    """
+    return TokenBucket(
+        rate=float(cloud_cred.get("provision-rate", PROVISION_RATE)),
+        burst=int(cloud_cred.get("provision-burst", PROVISION_BURST)),
+    )
+
+
+def log_provisioning_latency(ceph_nodes):
+    """Log the time taken to provision each of the nodes."""
+    for name, vm in sorted(ceph_nodes.items()):
+        log.info(
+            f"{name} provisioned in {getattr(vm, 'provision_time', 0):.1f} seconds "
+            f"after waiting {getattr(vm, 'throttle_time', 0):.1f} seconds for quota"
+        )
+
+
+def wait_for_ssh(ip_address, port=22, timeout=600, interval=2):
+    """
+    Wait till the SSH server of the node sends its banner.
+
+    Args:
+        ip_address (str):   IP address of the node
+        port (int):         SSH port
+        timeout (int):      Maximum time to wait in seconds
+        interval (int):     Time between the attempts in seconds
+
+    Returns:
+        Time taken in seconds for the node to be reachable
+
+    Raises:
+        NodeError when the banner is not received within the timeout
+    """
+    start = time.time()
+    while time.time() - start < timeout:
+        try:
+            with socket.create_connection((ip_address, port), timeout=10) as sock:
+                sock.settimeout(10)
+                if sock.recv(4) == b"SSH-":
+                    duration = time.time() - start
+                    log.debug(f"{ip_address} is reachable after {duration:.1f}s")
+                    return duration
+        except OSError as err:
+            log.debug(f"{ip_address} is not reachable yet: {err}")
+
+        sleep(interval)
+
+    raise NodeError(f"SSH service of {ip_address} is unreachable after {timeout}s")
+
+
 def setup_vm_node_baremetal(node, ceph_nodes, **params):
     """
     Create the VM node using details provided.
@@ -159,6 +231,7 @@ def create_ibmc_ceph_nodes(
     params["zone_name"] = ibm_cred["zone_name"]
     params["vpc_name"] = ibm_cred["vpc_name"]
     params["zone_id_model_name"] = ibm_cred["zone_id_model_name"]
+    limiter = provision_rate_limiter(ibm_cred)
 
     if inventory.get("instance").get("create"):
         if ceph_cluster.get("image-name"):
@@ -218,10 +291,14 @@ def create_ibmc_ceph_nodes(
                     node_params["cloud-data"] = node_dict.get("cloud-data")
 
                 # Throttling the spawning of VSI's to avoid hammering of provisioner
-                sleep(node_count * 5)
                 node_count += 1
-
-                p.spawn(setup_vm_node_ibm, node, ceph_nodes, **node_params)
+                p.spawn(
+                    setup_vm_node_ibm,
+                    node,
+                    ceph_nodes,
+                    rate_limiter=limiter,
+                    **node_params,
+                )
 
     if len(ceph_nodes) != node_count:
         log.error(
@@ -230,19 +307,23 @@ def create_ibmc_ceph_nodes(
         )
         raise NodeError("Required number of nodes not created")
 
+    log_provisioning_latency(ceph_nodes)
     log.info("Done creating nodes")
     return ceph_nodes
 
 
 @retry(RETRY_EXCEPTIONS, tries=3, delay=10)
-def setup_vm_node_ibm(node, ceph_nodes, **params):
+def setup_vm_node_ibm(node, ceph_nodes, rate_limiter=None, **params):
     """
     Create the VM node using IBM API calls.
 
     The retry decorator will trigger a rerun when a soft error is encountered. The VM
     node is removed in exception scope before throwing raising the exception again.
+    The create request is submitted once the rate_limiter grants a token.
     """
     vm = None
+    throttle_time = rate_limiter.acquire() if rate_limiter else 0
+    start = time.time()
     try:
         vm = CephVMNodeIBM(
             access_key=params["accesskey"], service_url=params["service_url"]
@@ -268,6 +349,8 @@ def setup_vm_node_ibm(node, ceph_nodes, **params):
         vm.osd_scenario = params.get("osd-scenario")
         vm.location = params.get("location")
         vm.id = params.get("id")
+        vm.throttle_time = throttle_time
+        vm.provision_time = time.time() - start
         ceph_nodes[node] = vm
     except RETRY_EXCEPTIONS as retry_except:
         log.warning(retry_except, exc_info=True)
@@ -304,6 +387,7 @@ def create_ceph_nodes(
     params["domain"] = os_cred["domain"]
     params["tenant-domain-id"] = os_cred["tenant-domain-id"]
     params["keypair"] = os_cred.get("keypair", None)
+    limiter = provision_rate_limiter(os_cred)
     ceph_nodes = dict()
     if enable_eus and not inventory.get("instance").get("eus-supported", False):
         raise Exception("EUS release is not supported for this distro")
@@ -326,7 +410,6 @@ def create_ceph_nodes(
 
         with parallel() as p:
             for node in range(1, 100):
-                sleep(10 * node)
                 node = "node" + str(node)
                 if not ceph_cluster.get(node):
                     break
@@ -359,7 +442,9 @@ def create_ceph_nodes(
                 if node_dict.get("cloud-data"):
                     node_params["cloud-data"] = node_dict.get("cloud-data")
                 node_count += 1
-                p.spawn(setup_vm_node, node, ceph_nodes, **node_params)
+                p.spawn(
+                    setup_vm_node, node, ceph_nodes, rate_limiter=limiter, **node_params
+                )
 
     if len(ceph_nodes) != node_count:
         log.error(
@@ -368,19 +453,23 @@ def create_ceph_nodes(
         )
         raise NodeError("Required number of nodes not created")
 
+    log_provisioning_latency(ceph_nodes)
     log.info("Done creating nodes")
     return ceph_nodes
 
 
 @retry(RETRY_EXCEPTIONS, tries=3, delay=10)
-def setup_vm_node(node, ceph_nodes, **params):
+def setup_vm_node(node, ceph_nodes, rate_limiter=None, **params):
     """
     Create the VM node using OpenStack API calls.
 
     The retry decorator will trigger a rerun when a soft error is encountered. The VM
     node is removed in exception scope before throwing raising the exception again.
+    The create request is submitted once the rate_limiter grants a token.
     """
     vm = None
+    throttle_time = rate_limiter.acquire() if rate_limiter else 0
+    start = time.time()
     try:
         vm = CephVMNodeV2(
             username=params["username"],
@@ -409,6 +498,8 @@ def setup_vm_node(node, ceph_nodes, **params):
         vm.osd_scenario = params.get("osd-scenario", False)
         vm.location = params.get("location")
         vm.id = params.get("id")
+        vm.throttle_time = throttle_time
+        vm.provision_time = time.time() - start
         ceph_nodes[node] = vm
     except RETRY_EXCEPTIONS as retry_except:
         log.warning(retry_except, exc_info=True)
@@ -452,7 +543,7 @@ def cleanup_ceph_nodes(osp_cred, pattern=None, timeout=300):
     name = pattern if pattern else "-{user}-".format(user=user)
     driver = get_openstack_driver(osp_cred)
     timeout = datetime.timedelta(seconds=timeout)
-    with parallel() as p:
+    with parallel(max_workers=CLOUD_API_WORKERS) as p:
         for volume in driver.list_volumes():
             if volume.name is None:
                 log.info("Volume has no name, skipping")
@@ -580,13 +671,11 @@ def check_ceph_healthly(
        return 0 when ceph is in healthy state, else 1
     """
 
-    timeout = datetime.timedelta(seconds=timeout)
-    starttime = datetime.datetime.now()
     pending_states = ["peering", "activating", "creating"]
     valid_states = ["active+clean"]
 
     out = None
-    while datetime.datetime.now() - starttime <= timeout:
+    for _ in Backoff(timeout=timeout, initial=1, maximum=5):
         if mon_container:
             distro_info = ceph_mon.distro_info
             distro_ver = distro_info["VERSION_ID"]
@@ -608,7 +697,6 @@ def check_ceph_healthly(
         if not any(state in out for state in pending_states):
             if all(state in out for state in valid_states):
                 break
-        sleep(5)
     log.info(out)
     if not all(state in out for state in valid_states):
         log.error("Valid States are not found in the health check")
@@ -1086,7 +1174,7 @@ def fetch_image_builds(version):
     todo: Fix when upgrade scenario needs image from source path
     """
     try:
-        cwd, c_list = fetch_listing(DEFAULT_OSBS_SERVER, timeout=60)
+        cwd, c_list = htmllistparse.fetch_listing(DEFAULT_OSBS_SERVER, timeout=60)
         assert c_list, "Container file(s) not found"
         c_list = [i for i in c_list if i.endswith("json")]
 
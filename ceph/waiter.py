@@ -1,5 +1,6 @@
 """Helper object to encapsulate waiting for timeouts"""
 
+import random
 import time
 
 
@@ -30,3 +31,85 @@ class WaitUntil(object):
             time.sleep(self.interval)
         self._attempt += 1
         return self
+
+
+class Backoff(object):
+    """A wait-retry loop with exponential backoff and jitter as iterable.
+
+    The first attempt is immediate and the wait between the attempts grows from
+    initial to maximum seconds, hence conditions that become true quickly are
+    detected quickly while long waits do not hammer the cluster. The last wait is
+    trimmed so that an attempt is made at the timeout.
+
+        for w in Backoff(timeout=300, maximum=30):
+            if condition():
+                break
+
+        if w.expired:
+            raise Exception("condition not met")
+    """
+
+    def __init__(self, timeout=60, initial=0.5, maximum=30, factor=2, jitter=0.1):
+        self.timeout = timeout
+        self.initial = initial
+        self.maximum = maximum
+        self.factor = factor
+        self.jitter = jitter
+        self.expired = False
+        self._interval = initial
+        self._attempt = 0
+        self._start = None
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self._start is None:
+            self._start = time.time()
+
+        remaining = self.timeout - (time.time() - self._start)
+        if self._attempt != 0:
+            if remaining <= 0:
+                self.expired = True
+                raise StopIteration()
+
+            wait = self._interval * random.uniform(1 - self.jitter, 1 + self.jitter)
+            time.sleep(min(wait, remaining))
+            self._interval = min(self._interval * self.factor, self.maximum)
+
+        self._attempt += 1
+        return self
+
+
+def watch_stream(node, cmd, predicate, timeout=300, sudo=True):
+    """Follow the output of a streaming command till a line satisfies the predicate.
+
+    Conditions are detected as soon as the cluster reports them, for example
+    watch_stream(node, "ceph -w", lambda ln: "HEALTH_OK" in ln) returns once the
+    health changes to HEALTH_OK.
+
+    Args:
+        node: node on which the command is executed
+        cmd: streaming command like ceph -w
+        predicate: callable accepting a line of output
+        timeout: maximum time to wait in seconds
+        sudo: execute the command as root
+
+    Returns:
+        the matching line, None on timeout
+    """
+    matched = []
+
+    def _check(line):
+        if predicate(line):
+            matched.append(line)
+            return True
+
+    node.exec_command(
+        cmd=f"timeout {timeout} {cmd}",
+        sudo=sudo,
+        timeout=timeout + 30,
+        check_ec=False,
+        output_callback=_check,
+    )
+    return matched[0] if matched else None
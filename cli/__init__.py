@@ -1,9 +1,21 @@
 from functools import partialmethod
 
+from ceph.parallel import parallel
+from cli.exceptions import FanOutError
+
+# Concurrent executions used by execute_as_completed when workers is not set
+DEFAULT_WORKERS = 16
+
 
 class Cli:
-    def __init__(self, ctx):
+    # Maximum number of nodes on which a command is executed concurrently when the
+    # context is a list of nodes. Nodes are processed one after another when unset.
+    workers = None
+
+    def __init__(self, ctx, workers=None):
         self.ctx = ctx
+        if workers:
+            self.workers = workers
 
     def execute(self, cmd, sudo=False, long_running=False, check_ec=False):
         """Inerface to execute commands on node(s).
@@ -13,8 +25,14 @@ class Cli:
             sudo (bool): Use root access
             long_running (bool): Long running command
             check_exit_status (bool): Check command exit status
+
+        Raises:
+            FanOutError: when executed concurrently and the command fails on any node
         """
         if isinstance(self.ctx, list):
+            if self.workers:
+                return self._fan_out(cmd, sudo, long_running, check_ec)
+
             out = {}
             for ctx in self.ctx:
                 out[ctx.shortname] = ctx.exec_command(
@@ -27,3 +45,50 @@ class Cli:
             )
 
     execute_as_sudo = partialmethod(execute, sudo=True)
+
+    def execute_as_completed(self, cmd, sudo=False, long_running=False, check_ec=False):
+        """Execute the command concurrently and yield the results as nodes complete.
+
+        Args:
+            cmd (str): Command to be execute
+            sudo (bool): Use root access
+            long_running (bool): Long running command
+            check_exit_status (bool): Check command exit status
+
+        Yields:
+            (shortname, result, error) tuple per node, error is the exception raised
+            by the node or None
+        """
+        nodes = self.ctx if isinstance(self.ctx, list) else [self.ctx]
+        with parallel(max_workers=self.workers or DEFAULT_WORKERS) as p:
+            for node in nodes:
+                p.spawn(self._execute_on, node, cmd, sudo, long_running, check_ec)
+
+            for item in p:
+                yield item
+
+    @staticmethod
+    def _execute_on(node, cmd, sudo, long_running, check_ec):
+        try:
+            out = node.exec_command(
+                cmd=cmd, sudo=sudo, long_running=long_running, check_ec=check_ec
+            )
+            return node.shortname, out, None
+        except Exception as err:
+            return node.shortname, None, err
+
+    def _fan_out(self, cmd, sudo, long_running, check_ec):
+        """Execute the command on all nodes concurrently, returns like execute."""
+        results, failures = {}, {}
+        for host, out, err in self.execute_as_completed(
+            cmd, sudo=sudo, long_running=long_running, check_ec=check_ec
+        ):
+            if err:
+                failures[host] = err
+            else:
+                results[host] = out
+
+        if failures:
+            raise FanOutError(failures, results)
+
+        return {ctx.shortname: results[ctx.shortname] for ctx in self.ctx}
@@ -2,8 +2,8 @@ from cli import Cli
 
 
 class Auth(Cli):
-    def __init__(self, nodes, base_cmd):
-        super(Auth, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd, workers=None):
+        super(Auth, self).__init__(nodes, workers)
         self.base_cmd = f"{base_cmd} auth"
 
     def list(self):
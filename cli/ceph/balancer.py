@@ -4,8 +4,8 @@ from cli import Cli
 class Balancer(Cli):
     """This module provides CLI interface to manage the balancer module."""
 
-    def __init__(self, nodes, base_cmd):
-        super(Balancer, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd, workers=None):
+        super(Balancer, self).__init__(nodes, workers)
 
         self.base_cmd = f"{base_cmd} balancer"
 
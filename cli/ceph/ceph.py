@@ -18,23 +18,23 @@ from .smb.smb import Smb
 class Ceph(Cli):
     """This module provides CLI interface for deployment and maintenance of ceph cluster."""
 
-    def __init__(self, nodes, base_cmd=""):
-        super(Ceph, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd="", workers=None):
+        super(Ceph, self).__init__(nodes, workers)
 
         self.base_cmd = f"{base_cmd} ceph" if base_cmd else "ceph"
-        self.auth = Auth(nodes, self.base_cmd)
-        self.mgr = Mgr(nodes, self.base_cmd)
-        self.orch = Orch(nodes, self.base_cmd)
-        self.rgw = Rgw(nodes, self.base_cmd)
-        self.balancer = Balancer(nodes, self.base_cmd)
-        self.config_key = ConfigKey(nodes, self.base_cmd)
-        self.config = Config(nodes, self.base_cmd)
-        self.crash = Crash(nodes, self.base_cmd)
-        self.nfs = Nfs(nodes, self.base_cmd)
-        self.fs = Fs(nodes, self.base_cmd)
-        self.osd = Osd(nodes, self.base_cmd)
-        self.smb = Smb(nodes, self.base_cmd)
-        self.restful = RestFul(nodes, self.base_cmd)
+        self.auth = Auth(nodes, self.base_cmd, workers=workers)
+        self.mgr = Mgr(nodes, self.base_cmd, workers=workers)
+        self.orch = Orch(nodes, self.base_cmd, workers=workers)
+        self.rgw = Rgw(nodes, self.base_cmd, workers=workers)
+        self.balancer = Balancer(nodes, self.base_cmd, workers=workers)
+        self.config_key = ConfigKey(nodes, self.base_cmd, workers=workers)
+        self.config = Config(nodes, self.base_cmd, workers=workers)
+        self.crash = Crash(nodes, self.base_cmd, workers=workers)
+        self.nfs = Nfs(nodes, self.base_cmd, workers=workers)
+        self.fs = Fs(nodes, self.base_cmd, workers=workers)
+        self.osd = Osd(nodes, self.base_cmd, workers=workers)
+        self.smb = Smb(nodes, self.base_cmd, workers=workers)
+        self.restful = RestFul(nodes, self.base_cmd, workers=workers)
 
     def version(self):
         """Get ceph version."""
@@ -4,8 +4,8 @@ from cli import Cli
 class Lvm(Cli):
     """This module provides CLI interface to manage the ceph-volume plugin."""
 
-    def __init__(self, nodes, base_cmd):
-        super(Lvm, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd, workers=None):
+        super(Lvm, self).__init__(nodes, workers)
 
         self.base_cmd = f"{base_cmd} lvm"
 
@@ -5,8 +5,8 @@ from cli.utilities.utils import build_cmd_from_args
 class Config(Cli):
     """This module provides CLI interface to manage the balancer module."""
 
-    def __init__(self, nodes, base_cmd):
-        super(Config, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd, workers=None):
+        super(Config, self).__init__(nodes, workers)
 
         self.base_cmd = f"{base_cmd} config"
 
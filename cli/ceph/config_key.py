@@ -4,8 +4,8 @@ from cli import Cli
 class ConfigKey(Cli):
     """This module provides CLI interface to manage the balancer module."""
 
-    def __init__(self, nodes, base_cmd):
-        super(ConfigKey, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd, workers=None):
+        super(ConfigKey, self).__init__(nodes, workers)
 
         self.base_cmd = f"{base_cmd} config-key"
 
@@ -4,8 +4,8 @@ from cli import Cli
 class Crash(Cli):
     """This module provides CLI interface to manage the crash module."""
 
-    def __init__(self, nodes, base_cmd):
-        super(Crash, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd, workers=None):
+        super(Crash, self).__init__(nodes, workers)
 
         self.base_cmd = f"{base_cmd} crash"
 
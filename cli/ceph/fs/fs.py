@@ -8,12 +8,12 @@ from .volume import Volume
 class Fs(Cli):
     """This module provides CLI interface for FS related operations"""
 
-    def __init__(self, nodes, base_cmd):
-        super(Fs, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd, workers=None):
+        super(Fs, self).__init__(nodes, workers)
         self.base_cmd = f"{base_cmd} fs"
-        self.volume = Volume(nodes, self.base_cmd)
-        self.sub_volume_group = SubVolumeGroup(nodes, self.base_cmd)
-        self.sub_volume = SubVolume(nodes, self.base_cmd)
+        self.volume = Volume(nodes, self.base_cmd, workers=workers)
+        self.sub_volume_group = SubVolumeGroup(nodes, self.base_cmd, workers=workers)
+        self.sub_volume = SubVolume(nodes, self.base_cmd, workers=workers)
 
     def get(self, conf, format=None):
         """
@@ -5,8 +5,8 @@ from cli.utilities.utils import build_cmd_from_args
 class SubVolume(Cli):
     """This module provides CLI interface for FS subvolume related operations"""
 
-    def __init__(self, nodes, base_cmd):
-        super(SubVolume, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd, workers=None):
+        super(SubVolume, self).__init__(nodes, workers)
         self.base_cmd = f"{base_cmd} subvolume"
 
     def create(self, volume, subvolume, **kwargs):
@@ -5,8 +5,8 @@ from cli.utilities.utils import build_cmd_from_args
 class SubVolumeGroup(Cli):
     """This module provides CLI interface for FS subvolume group related operations"""
 
-    def __init__(self, nodes, base_cmd):
-        super(SubVolumeGroup, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd, workers=None):
+        super(SubVolumeGroup, self).__init__(nodes, workers)
         self.base_cmd = f"{base_cmd} subvolumegroup"
 
     def create(self, volume, group, **kwargs):
@@ -4,8 +4,8 @@ from cli import Cli
 class Volume(Cli):
     """This module provides CLI interface for FS volume related operations"""
 
-    def __init__(self, nodes, base_cmd):
-        super(Volume, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd, workers=None):
+        super(Volume, self).__init__(nodes, workers)
         self.base_cmd = f"{base_cmd} volume"
 
     def create(self, volume):
@@ -7,11 +7,11 @@ from .module import Module
 class Mgr(Cli):
     """This module provides CLI interface to manage the MGR service."""
 
-    def __init__(self, nodes, base_cmd):
-        super(Mgr, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd, workers=None):
+        super(Mgr, self).__init__(nodes, workers)
 
         self.base_cmd = f"{base_cmd} mgr"
-        self.module = Module(nodes, self.base_cmd)
+        self.module = Module(nodes, self.base_cmd, workers=workers)
 
     def fail(self, mgr):
         """
@@ -4,8 +4,8 @@ from cli import Cli
 class Module(Cli):
     """This module provides CLI interface for ceph mgr operations"""
 
-    def __init__(self, nodes, base_cmd=""):
-        super(Module, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd="", workers=None):
+        super(Module, self).__init__(nodes, workers)
 
         self.base_cmd = f"{base_cmd} module"
 
@@ -2,8 +2,8 @@ from cli import Cli
 
 
 class Cluster(Cli):
-    def __init__(self, nodes, base_cmd):
-        super(Cluster, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd, workers=None):
+        super(Cluster, self).__init__(nodes, workers)
         self.base_cmd = f"{base_cmd} cluster"
 
     def create(self, name, nfs_server, ha=False, vip=None):
@@ -5,8 +5,8 @@ log = Log(__name__)
 
 
 class Export(Cli):
-    def __init__(self, nodes, base_cmd):
-        super(Export, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd, workers=None):
+        super(Export, self).__init__(nodes, workers)
         self.base_cmd = f"{base_cmd} export"
 
     def create(
@@ -5,10 +5,10 @@ from .daemons.add import Add
 
 
 class Daemon(Cli):
-    def __init__(self, nodes, base_cmd):
-        super(Daemon, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd, workers=None):
+        super(Daemon, self).__init__(nodes, workers)
         self.base_cmd = f"{base_cmd} daemon"
-        self.add = Add(nodes, self.base_cmd)
+        self.add = Add(nodes, self.base_cmd, workers=workers)
 
     def redeploy(self, daemon_name, **kw):
         """
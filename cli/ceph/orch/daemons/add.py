@@ -2,8 +2,8 @@ from cli import Cli
 
 
 class Add(Cli):
-    def __init__(self, nodes, base_cmd):
-        super(Add, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd, workers=None):
+        super(Add, self).__init__(nodes, workers)
         self.base_cmd = f"{base_cmd} add"
 
     def osd(self, hostname, device):
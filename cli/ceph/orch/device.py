@@ -3,8 +3,8 @@ from cli.utilities.utils import build_cmd_from_args
 
 
 class Device(Cli):
-    def __init__(self, nodes, base_cmd):
-        super(Device, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd, workers=None):
+        super(Device, self).__init__(nodes, workers)
         self.base_cmd = f"{base_cmd} device"
 
     def ls(self, **kw):
@@ -5,8 +5,8 @@ log = Log(__name__)
 
 
 class Label(Cli):
-    def __init__(self, nodes, base_cmd):
-        super(Label, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd, workers=None):
+        super(Label, self).__init__(nodes, workers)
         self.base_cmd = f"{base_cmd} host label"
 
     def add(self, node, label):
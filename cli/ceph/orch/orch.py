@@ -18,16 +18,16 @@ class OrchApplyCommandError(Exception):
 
 
 class Orch(Cli):
-    def __init__(self, nodes, base_cmd):
-        super(Orch, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd, workers=None):
+        super(Orch, self).__init__(nodes, workers)
         self.base_cmd = f"{base_cmd} orch"
-        self.tuned_profile = TunedProfile(nodes, self.base_cmd)
-        self.label = Label(nodes, self.base_cmd)
-        self.host = Host(nodes, self.base_cmd)
-        self.daemon = Daemon(nodes, self.base_cmd)
-        self.device = Device(nodes, self.base_cmd)
-        self.osd = Osd(nodes, self.base_cmd)
-        self.upgrade = Upgrade(nodes, self.base_cmd)
+        self.tuned_profile = TunedProfile(nodes, self.base_cmd, workers=workers)
+        self.label = Label(nodes, self.base_cmd, workers=workers)
+        self.host = Host(nodes, self.base_cmd, workers=workers)
+        self.daemon = Daemon(nodes, self.base_cmd, workers=workers)
+        self.device = Device(nodes, self.base_cmd, workers=workers)
+        self.osd = Osd(nodes, self.base_cmd, workers=workers)
+        self.upgrade = Upgrade(nodes, self.base_cmd, workers=workers)
 
     def ls(self, **kw):
         """
@@ -6,8 +6,8 @@ log = Log(__name__)
 
 
 class Osd(Cli):
-    def __init__(self, nodes, base_cmd):
-        super(Osd, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd, workers=None):
+        super(Osd, self).__init__(nodes, workers)
         self.base_cmd = f"{base_cmd} osd"
 
     def rm(self, osd_id=None, status=False, **kw):
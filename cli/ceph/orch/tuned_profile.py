@@ -5,8 +5,8 @@ log = Log(__name__)
 
 
 class TunedProfile(Cli):
-    def __init__(self, nodes, base_cmd):
-        super(TunedProfile, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd, workers=None):
+        super(TunedProfile, self).__init__(nodes, workers)
         self.base_cmd = f"{base_cmd} tuned-profile"
 
     def apply(self, spec_file, check_ec=False):
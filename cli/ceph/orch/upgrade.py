@@ -3,8 +3,8 @@ from cli.utilities.utils import build_cmd_from_args
 
 
 class Upgrade(Cli):
-    def __init__(self, nodes, base_cmd):
-        super(Upgrade, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd, workers=None):
+        super(Upgrade, self).__init__(nodes, workers)
         self.base_cmd = f"{base_cmd} upgrade"
 
     def check(self, **kw):
@@ -4,8 +4,8 @@ from cli import Cli
 class Blocklist(Cli):
     """This module provides CLI interface to manage the Blocklist service."""
 
-    def __init__(self, nodes, base_cmd):
-        super(Blocklist, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd, workers=None):
+        super(Blocklist, self).__init__(nodes, workers)
 
         self.base_cmd = f"{base_cmd} blocklist"
 
@@ -4,8 +4,8 @@ from cli import Cli
 class Crush(Cli):
     """This module provides CLI interface to manage the Crush service."""
 
-    def __init__(self, nodes, base_cmd):
-        super(Crush, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd, workers=None):
+        super(Crush, self).__init__(nodes, workers)
 
         self.base_cmd = f"{base_cmd} crush"
 
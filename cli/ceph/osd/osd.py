@@ -9,12 +9,12 @@ from .pool import Pool
 class Osd(Cli):
     """This module provides CLI interface for OSD related operations"""
 
-    def __init__(self, nodes, base_cmd):
-        super(Osd, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd, workers=None):
+        super(Osd, self).__init__(nodes, workers)
         self.base_cmd = f"{base_cmd} osd"
-        self.pool = Pool(nodes, self.base_cmd)
-        self.crush = Crush(nodes, self.base_cmd)
-        self.blocklist = Blocklist(nodes, self.base_cmd)
+        self.pool = Pool(nodes, self.base_cmd, workers=workers)
+        self.crush = Crush(nodes, self.base_cmd, workers=workers)
+        self.blocklist = Blocklist(nodes, self.base_cmd, workers=workers)
 
     def lspools(self):
         """To list cluster pools"""
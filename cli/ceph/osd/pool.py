@@ -5,8 +5,8 @@ from cli.utilities.utils import build_cmd_from_args
 class Pool(Cli):
     """This module provides CLI interface to manage the MGR service."""
 
-    def __init__(self, nodes, base_cmd):
-        super(Pool, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd, workers=None):
+        super(Pool, self).__init__(nodes, workers)
 
         self.base_cmd = f"{base_cmd} pool"
 
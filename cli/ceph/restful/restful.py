@@ -4,8 +4,8 @@ from cli import Cli
 class RestFul(Cli):
     """This module provides CLI interface for OSD related operations"""
 
-    def __init__(self, nodes, base_cmd):
-        super(RestFul, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd, workers=None):
+        super(RestFul, self).__init__(nodes, workers)
         self.base_cmd = f"{base_cmd} restful"
 
     def create_self_signed_cert(self):
@@ -5,8 +5,8 @@ from cli.utilities.utils import build_cmd_from_args
 class Realm(Cli):
     """This module provides CLI interface to manage the RGW realm operations"""
 
-    def __init__(self, nodes, base_cmd):
-        super(Realm, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd, workers=None):
+        super(Realm, self).__init__(nodes, workers)
 
         self.base_cmd = f"{base_cmd} realm"
 
@@ -4,8 +4,8 @@ from cli import Cli
 class Apply(Cli):
     """This module provides CLI interface for smb cluster related operations"""
 
-    def __init__(self, nodes, base_cmd):
-        super(Apply, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd, workers=None):
+        super(Apply, self).__init__(nodes, workers)
         self.base_cmd = f"{base_cmd} apply"
 
     def apply(self, spec_file):
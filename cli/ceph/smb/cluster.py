@@ -5,8 +5,8 @@ from cli.utilities.utils import build_cmd_from_args
 class Cluster(Cli):
     """This module provides CLI interface for smb cluster related operations"""
 
-    def __init__(self, nodes, base_cmd):
-        super(Cluster, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd, workers=None):
+        super(Cluster, self).__init__(nodes, workers)
         self.base_cmd = f"{base_cmd} cluster"
 
     def create(self, cluster_id, auth_mode, **kw):
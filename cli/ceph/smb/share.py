@@ -5,8 +5,8 @@ from cli.utilities.utils import build_cmd_from_args
 class Share(Cli):
     """This module provides CLI interface for smb share related operations"""
 
-    def __init__(self, nodes, base_cmd):
-        super(Share, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd, workers=None):
+        super(Share, self).__init__(nodes, workers)
         self.base_cmd = f"{base_cmd} share"
 
     def create(self, cluster_id, share_id, cephfs_volume, path, **kw):
@@ -9,12 +9,12 @@ from .share import Share
 class Smb(Cli):
     """This module provides CLI interface for ceph smb operations"""
 
-    def __init__(self, nodes, base_cmd=""):
-        super(Smb, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd="", workers=None):
+        super(Smb, self).__init__(nodes, workers)
         self.base_cmd = f"{base_cmd} smb"
-        self.cluster = Cluster(nodes, self.base_cmd)
-        self.share = Share(nodes, self.base_cmd)
-        self.apply = Apply(nodes, self.base_cmd)
+        self.cluster = Cluster(nodes, self.base_cmd, workers=workers)
+        self.share = Share(nodes, self.base_cmd, workers=workers)
+        self.apply = Apply(nodes, self.base_cmd, workers=workers)
 
     def show(self, resource_names, **kw):
         """
@@ -9,8 +9,8 @@ CEPHADM_INVENTORY_PATH = f"{CEPHADM_ANSIBLE_PATH}/hosts"
 class Ansible(Cli):
     """module to provide CLI interface for cephadm-ansible."""
 
-    def __init__(self, nodes):
-        super(Ansible, self).__init__(nodes)
+    def __init__(self, nodes, workers=None):
+        super(Ansible, self).__init__(nodes, workers)
 
         self.base_cmd = f"cd {CEPHADM_ANSIBLE_PATH}; ansible-playbook -vvvv"
 
@@ -7,8 +7,10 @@ from cli.utilities.utils import build_cmd_from_args
 class CephAdm(Cli):
     """This module provides CLI interface to manage the CephAdm operations"""
 
-    def __init__(self, nodes, src_mount=None, mount=None, base_cmd="cephadm"):
-        super(CephAdm, self).__init__(nodes)
+    def __init__(
+        self, nodes, src_mount=None, mount=None, base_cmd="cephadm", workers=None
+    ):
+        super(CephAdm, self).__init__(nodes, workers)
 
         self.base_cmd = base_cmd
         self.base_shell_cmd = f"{self.base_cmd} shell"
@@ -17,8 +19,8 @@ class CephAdm(Cli):
         elif mount:
             self.base_shell_cmd += f" --mount {mount}:{mount} --"
 
-        self.ceph = Ceph(nodes, self.base_shell_cmd)
-        self.ceph_volume = CephVolume(nodes, self.base_shell_cmd)
+        self.ceph = Ceph(nodes, self.base_shell_cmd, workers=workers)
+        self.ceph_volume = CephVolume(nodes, self.base_shell_cmd, workers=workers)
 
     def shell(self, cmd):
         """Ceph orchestrator shell interface to run ceph commands.
@@ -75,3 +75,21 @@ class OsdOperationError(Exception):
     """
     Custom exception thrown when OSD operation fails
     """
+
+
+class FanOutError(Exception):
+    """
+    Custom exception thrown when a command fails on one or more of the nodes.
+
+    Attributes:
+        failures (dict): exception raised per node shortname
+        results (dict): output per node shortname of the successful executions
+    """
+
+    def __init__(self, failures, results=None):
+        self.failures = failures
+        self.results = results or {}
+        hosts = ", ".join(f"{host}: {err}" for host, err in failures.items())
+        super(FanOutError, self).__init__(
+            f"Command failed on {len(failures)} node(s) - {hosts}"
+        )
@@ -9,7 +9,7 @@ class Config(Cli):
     objects with wrapper for sub-commands.
     """
 
-    def __init__(self, nodes, base_cmd):
-        super(Config, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd, workers=None):
+        super(Config, self).__init__(nodes, workers)
         self.base_cmd = base_cmd + " config"
-        self.image = Image(nodes, self.base_cmd)
+        self.image = Image(nodes, self.base_cmd, workers=workers)
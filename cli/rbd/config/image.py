@@ -9,8 +9,8 @@ class Image(Cli):
     This module provides CLI interface to manage rbd config image commands for images in pool.
     """
 
-    def __init__(self, nodes, base_cmd):
-        super(Image, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd, workers=None):
+        super(Image, self).__init__(nodes, workers)
         self.base_cmd = base_cmd + " image"
 
     def get(self, **kw):
@@ -9,8 +9,8 @@ class Device(Cli):
     This Class provides wrappers for rbd device commands.
     """
 
-    def __init__(self, nodes, base_cmd):
-        super(Device, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd, workers=None):
+        super(Device, self).__init__(nodes, workers)
         self.base_cmd = base_cmd + " device"
 
     def attach(self, **kw):
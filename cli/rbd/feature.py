@@ -9,8 +9,8 @@ class Feature(Cli):
     This module provides CLI interface to manage snapshots from images in pool.
     """
 
-    def __init__(self, nodes, base_cmd):
-        super(Feature, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd, workers=None):
+        super(Feature, self).__init__(nodes, workers)
         self.base_cmd = base_cmd + " feature"
 
     def enable(self, **kw):
@@ -5,8 +5,8 @@ from cli.utilities.utils import build_cmd_from_args
 
 
 class Group(Cli):
-    def __init__(self, nodes, base_cmd):
-        super(Group, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd, workers=None):
+        super(Group, self).__init__(nodes, workers)
         self.base_cmd = base_cmd + " group"
         self.image = self.Image(parent=self, base_cmd=self.base_cmd)
         self.snap = self.Snap(parent=self, base_cmd=self.base_cmd)
@@ -9,8 +9,8 @@ class Image_meta(Cli):
     This module provides CLI interface to manage image metadata for images in pool.
     """
 
-    def __init__(self, nodes, base_cmd):
-        super(Image_meta, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd, workers=None):
+        super(Image_meta, self).__init__(nodes, workers)
         self.base_cmd = base_cmd + " image-meta"
 
     def get(self, **kw):
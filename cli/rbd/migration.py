@@ -7,8 +7,8 @@ log = Log(__name__)
 
 
 class Migration(Cli):
-    def __init__(self, nodes, base_cmd):
-        super(Migration, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd, workers=None):
+        super(Migration, self).__init__(nodes, workers)
         self.base_cmd = base_cmd + " migration"
 
     def prepare(self, **kw):
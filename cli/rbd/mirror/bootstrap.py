@@ -7,8 +7,8 @@ from cli.utilities.utils import build_cmd_from_args
 class Bootstrap(Cli):
     """This module provides CLI interface to manage rbd pool peer bootstrap commands."""
 
-    def __init__(self, nodes, base_cmd):
-        super(Bootstrap, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd, workers=None):
+        super(Bootstrap, self).__init__(nodes, workers)
         self.base_cmd = base_cmd + " bootstrap"
 
     def create(self, **kw):
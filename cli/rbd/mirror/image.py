@@ -7,8 +7,8 @@ from cli.utilities.utils import build_cmd_from_args
 class Image(Cli):
     """This module provides CLI interface to manage rbd mirror image commands."""
 
-    def __init__(self, nodes, base_cmd):
-        super(Image, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd, workers=None):
+        super(Image, self).__init__(nodes, workers)
         self.base_cmd = base_cmd + " image"
 
     def demote(self, **kw):
@@ -11,9 +11,9 @@ class Mirror(Cli):
     objects with wrapper for sub-commands.
     """
 
-    def __init__(self, nodes, base_cmd):
-        super(Mirror, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd, workers=None):
+        super(Mirror, self).__init__(nodes, workers)
         self.base_cmd = base_cmd + " mirror"
-        self.image = Image(nodes, self.base_cmd)
-        self.pool = Pool(nodes, self.base_cmd)
-        self.snapshot = Snapshot(nodes, self.base_cmd)
+        self.image = Image(nodes, self.base_cmd, workers=workers)
+        self.pool = Pool(nodes, self.base_cmd, workers=workers)
+        self.snapshot = Snapshot(nodes, self.base_cmd, workers=workers)
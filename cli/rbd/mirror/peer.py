@@ -8,10 +8,10 @@ from cli.utilities.utils import build_cmd_from_args
 class Peer(Cli):
     """This module provides CLI interface to manage rbd mirror pool commands."""
 
-    def __init__(self, nodes, base_cmd):
-        super(Peer, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd, workers=None):
+        super(Peer, self).__init__(nodes, workers)
         self.base_cmd = base_cmd + " peer"
-        self.bootstrap = Bootstrap(nodes, self.base_cmd)
+        self.bootstrap = Bootstrap(nodes, self.base_cmd, workers=workers)
 
     def add_(self, **kw):
         """Wrapper for rbd mirror pool peer add.
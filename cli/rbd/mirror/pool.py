@@ -8,10 +8,10 @@ from cli.utilities.utils import build_cmd_from_args
 class Pool(Cli):
     """This module provides CLI interface to manage rbd mirror pool commands."""
 
-    def __init__(self, nodes, base_cmd):
-        super(Pool, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd, workers=None):
+        super(Pool, self).__init__(nodes, workers)
         self.base_cmd = base_cmd + " pool"
-        self.peer = Peer(nodes, self.base_cmd)
+        self.peer = Peer(nodes, self.base_cmd, workers=workers)
 
     def demote(self, **kw):
         """Wrapper for rbd mirror pool demote.
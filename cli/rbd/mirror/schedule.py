@@ -9,8 +9,8 @@ class Schedule(Cli):
     This module provides CLI interface to manage the mirror snapshot scheduling.
     """
 
-    def __init__(self, nodes, base_cmd):
-        super(Schedule, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd, workers=None):
+        super(Schedule, self).__init__(nodes, workers)
         self.base_cmd = base_cmd + " schedule"
 
     def add_(self, **kw):
@@ -7,7 +7,7 @@ class Snapshot(Cli):
     This module provides CLI interface to manage the mirror snapshots.
     """
 
-    def __init__(self, nodes, base_cmd):
-        super(Snapshot, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd, workers=None):
+        super(Snapshot, self).__init__(nodes, workers)
         self.base_cmd = base_cmd + " snapshot"
-        self.schedule = Schedule(nodes, self.base_cmd)
+        self.schedule = Schedule(nodes, self.base_cmd, workers=workers)
@@ -3,8 +3,8 @@ from cli.utilities.utils import build_cmd_from_args
 
 
 class Namespace(Cli):
-    def __init__(self, nodes, base_cmd):
-        super(Namespace, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd, workers=None):
+        super(Namespace, self).__init__(nodes, workers)
         self.base_cmd = base_cmd + " namespace"
 
     def create(self, **kw):
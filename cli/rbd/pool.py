@@ -12,8 +12,8 @@ class Pool(Cli):
     This module provides CLI interface to manage pools in rbd via rbd pool command.
     """
 
-    def __init__(self, nodes, base_cmd):
-        super(Pool, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd, workers=None):
+        super(Pool, self).__init__(nodes, workers)
         self.base_cmd = base_cmd + " pool"
 
     def init(self, **kw):
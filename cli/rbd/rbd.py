@@ -16,19 +16,19 @@ from .snap import Snap
 
 
 class Rbd(Cli):
-    def __init__(self, nodes, base_cmd=""):
-        super(Rbd, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd="", workers=None):
+        super(Rbd, self).__init__(nodes, workers)
         self.base_cmd = f"{base_cmd}rbd"
-        self.pool = Pool(nodes, self.base_cmd)
-        self.mirror = Mirror(nodes, self.base_cmd)
-        self.device = Device(nodes, self.base_cmd)
-        self.snap = Snap(nodes, self.base_cmd)
-        self.feature = Feature(nodes, self.base_cmd)
-        self.image_meta = Image_meta(nodes, self.base_cmd)
-        self.config = Config(nodes, self.base_cmd)
-        self.namespace = Namespace(nodes, self.base_cmd)
-        self.group = Group(nodes, self.base_cmd)
-        self.migration = Migration(nodes, self.base_cmd)
+        self.pool = Pool(nodes, self.base_cmd, workers=workers)
+        self.mirror = Mirror(nodes, self.base_cmd, workers=workers)
+        self.device = Device(nodes, self.base_cmd, workers=workers)
+        self.snap = Snap(nodes, self.base_cmd, workers=workers)
+        self.feature = Feature(nodes, self.base_cmd, workers=workers)
+        self.image_meta = Image_meta(nodes, self.base_cmd, workers=workers)
+        self.config = Config(nodes, self.base_cmd, workers=workers)
+        self.namespace = Namespace(nodes, self.base_cmd, workers=workers)
+        self.group = Group(nodes, self.base_cmd, workers=workers)
+        self.migration = Migration(nodes, self.base_cmd, workers=workers)
 
     def create(self, **kw):
         """
@@ -9,8 +9,8 @@ class Snap(Cli):
     This module provides CLI interface to manage snapshots from images in pool.
     """
 
-    def __init__(self, nodes, base_cmd):
-        super(Snap, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd, workers=None):
+        super(Snap, self).__init__(nodes, workers)
         self.base_cmd = base_cmd + " snap"
 
     def create(self, **kw):
@@ -9,8 +9,8 @@ class ContainerRegistryError(Exception):
 class Registry(Cli):
     """This module provides CLI interface for container registry operations"""
 
-    def __init__(self, nodes, package="podman"):
-        super(Registry, self).__init__(nodes)
+    def __init__(self, nodes, package="podman", workers=None):
+        super(Registry, self).__init__(nodes, workers)
         self.base_cmd = package
 
     def login(
@@ -47,8 +47,8 @@ class Registry(Cli):
 class Container(Cli):
     """This module provides CLI interface for container operations"""
 
-    def __init__(self, nodes, package="podman"):
-        super(Container, self).__init__(nodes)
+    def __init__(self, nodes, package="podman", workers=None):
+        super(Container, self).__init__(nodes, workers)
         self.base_cmd = package
 
     def run(
@@ -8,8 +8,8 @@ class MountFailedError(Exception):
 class Mount(Cli):
     """This module provides CLI support for mount operations"""
 
-    def __init__(self, nodes):
-        super(Mount, self).__init__(nodes)
+    def __init__(self, nodes, workers=None):
+        super(Mount, self).__init__(nodes, workers)
         self.base_cmd = "mount"
 
     def nfs(self, mount, version, port, server, export):
@@ -40,8 +40,8 @@ class Mount(Cli):
 
 
 class Unmount(Cli):
-    def __init__(self, nodes):
-        super(Unmount, self).__init__(nodes)
+    def __init__(self, nodes, workers=None):
+        super(Unmount, self).__init__(nodes, workers)
         self.base_cmd = "umount"
 
     def unmount(self, mount, lazy=True):
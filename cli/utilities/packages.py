@@ -26,8 +26,8 @@ class RpmError(Exception):
 class Package(Cli):
     """This module provides CLI interface for yum/dnf operations"""
 
-    def __init__(self, nodes, manager="yum"):
-        super(Package, self).__init__(nodes)
+    def __init__(self, nodes, manager="yum", workers=None):
+        super(Package, self).__init__(nodes, workers)
         self.manager = manager
 
     def info(self, pkg=None):
@@ -170,11 +170,11 @@ class Package(Cli):
 class SubscriptionManager(Cli):
     """This module provides CLI interface for RH Subscription Manager."""
 
-    def __init__(self, nodes):
-        super(SubscriptionManager, self).__init__(nodes)
+    def __init__(self, nodes, workers=None):
+        super(SubscriptionManager, self).__init__(nodes, workers)
 
         self.base_cmd = "subscription-manager"
-        self.repos = Repos(nodes, self.base_cmd)
+        self.repos = Repos(nodes, self.base_cmd, workers=workers)
 
     def register(self, username, password, serverurl=None, baseurl=None, force=False):
         """Register system to the Customer Portal or another subscription management service.
@@ -222,8 +222,8 @@ class SubscriptionManager(Cli):
 class Repos(Cli):
     """This module provides CLI interface to perform subscription manager repo operations."""
 
-    def __init__(self, nodes, base_cmd):
-        super(Repos, self).__init__(nodes)
+    def __init__(self, nodes, base_cmd, workers=None):
+        super(Repos, self).__init__(nodes, workers)
 
         self.base_cmd = f"{base_cmd} repos"
 
@@ -276,8 +276,8 @@ class Repos(Cli):
 class Rpm(Cli):
     """This module provides CLI interface for rpm operations"""
 
-    def __init__(self, nodes):
-        super(Rpm, self).__init__(nodes)
+    def __init__(self, nodes, workers=None):
+        super(Rpm, self).__init__(nodes, workers)
         self.base_cmd = "rpm"
 
     def query(self, pkg):
@@ -7,16 +7,9 @@ from datetime import datetime, timedelta
 from time import sleep
 from typing import Any, Dict, List, Optional
 
-from ibm_cloud_networking_services import DnsSvcsV1
-from ibm_cloud_networking_services.dns_svcs_v1 import (
-    ResourceRecordInputRdataRdataARecord,
-    ResourceRecordInputRdataRdataPtrRecord,
-)
-from ibm_cloud_sdk_core.api_exception import ApiException
-from ibm_cloud_sdk_core.authenticators import IAMAuthenticator
-from ibm_vpc import VpcV1  # noqa
 from requests.exceptions import ReadTimeout
 
+from utility.lazy_import import lazy_import
 from utility.log import Log
 from utility.retry import retry
 
@@ -24,6 +17,12 @@ from .exceptions import NodeDeleteFailure, NodeError, ResourceNotFound
 
 LOG = Log(__name__)
 
+# The IBM Cloud SDKs are slow to import and needed only for IBM Cloud runs
+dns_svcs = lazy_import("ibm_cloud_networking_services.dns_svcs_v1")
+api_exception = lazy_import("ibm_cloud_sdk_core.api_exception")
+authenticators = lazy_import("ibm_cloud_sdk_core.authenticators")
+vpc = lazy_import("ibm_vpc")
+
 
 def get_ibm_service(access_key: str, service_url: str):
     """
@@ -33,9 +32,9 @@ def get_ibm_service(access_key: str, service_url: str):
         access_key (str):   The access key(API key) of the user.
         service_url (str):  VPC endpoint to be used for provisioning.
     """
-    authenticator = IAMAuthenticator(access_key)
+    authenticator = authenticators.IAMAuthenticator(access_key)
 
-    service = VpcV1(authenticator=authenticator)
+    service = vpc.VpcV1(authenticator=authenticator)
     service.set_service_url(service_url=service_url)
 
     return service
@@ -50,9 +49,9 @@ def get_dns_service(
     Args:
         accessKey    The access key(API key) of the user.
     """
-    authenticator = IAMAuthenticator(access_key)
+    authenticator = authenticators.IAMAuthenticator(access_key)
 
-    dnssvc = DnsSvcsV1(authenticator=authenticator)
+    dnssvc = dns_svcs.DnsSvcsV1(authenticator=authenticator)
     dnssvc.set_service_url(service_url=service_url)
 
     return dnssvc
@@ -436,7 +435,7 @@ class CephVMNodeIBM:
                     rdata=records_ip[0]["rdata"],
                 )
 
-            a_record = ResourceRecordInputRdataRdataARecord(
+            a_record = dns_svcs.ResourceRecordInputRdataRdataARecord(
                 self.node["primary_network_interface"]["primary_ipv4_address"]
             )
             self.dns_service.create_resource_record(
@@ -448,7 +447,7 @@ class CephVMNodeIBM:
                 rdata=a_record,
             )
 
-            ptr_record = ResourceRecordInputRdataRdataPtrRecord(
+            ptr_record = dns_svcs.ResourceRecordInputRdataRdataPtrRecord(
                 f"{self.node['name']}.{zone_name}"
             )
             self.dns_service.create_resource_record(
@@ -500,7 +499,7 @@ class CephVMNodeIBM:
                 if resp.get_status_code == 404:
                     LOG.info(f"Successfully removed {node_name}")
                     return
-            except ApiException:
+            except api_exception.ApiException:
                 LOG.info(f"Successfully removed {node_name}")
                 self.remove_dns_records(zone_name)
                 return
@@ -1,16 +1,58 @@
-"""Retrieve and process CephCI suites."""
+"""Retrieve and process CephCI suites.
 
+The resolved suite fragments are cached on disk keyed by the hash of their
+contents, hence a fragment is parsed and merged again only when one of its
+files changes. The cache directory defaults to ~/.cache/cephci and can be set
+using the CEPHCI_SUITE_CACHE environment variable, an empty value disables it.
+
+The suite index summarizes the suites referenced by the pipeline metadata
+(tags, modules and polarion IDs) for quick queries,
+
+    python init_suite.py --rhcephVersion 7.1 --tags tier-1,rbd
+"""
+
+import hashlib
+import json
 import os
+import pickle
+import sys
 from copy import deepcopy
 from glob import glob
-from typing import List
+from typing import Dict, List
 
 import yaml
+from docopt import docopt
 
 from utility.log import Log
 
 log = Log(__name__)
 
+# Use the libyaml based loader when PyYAML is built with it
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+CACHE_DIR = os.environ.get("CEPHCI_SUITE_CACHE", os.path.expanduser("~/.cache/cephci"))
+
+# Bump when the resolution logic changes, invalidating the cached fragments
+CACHE_VERSION = "3"
+
+METADATA_DIR = "pipeline/metadata"
+
+# The suite paths of the pipeline metadata are relative to the repository
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+doc = """
+Query the suite index built from the pipeline metadata.
+
+    Usage:
+        init_suite.py [--rhcephVersion <VER>] [--tags <tags>]
+        init_suite.py (-h | --help)
+
+    Options:
+        -h --help                   Shows the command usage
+        -v --rhcephVersion <VER>    Pipeline metadata version, all when not provided
+        -t --tags <tags>            Comma separated tags the suites must have
+"""
+
 
 def merge_dicts(dict1, dict2):
     """
@@ -47,11 +89,91 @@ def read_yaml(file_name):
     """
     file_path = os.path.abspath(file_name)
     with open(file_path) as fp:
-        data = yaml.safe_load(fp)
+        data = yaml.load(fp, Loader=YAML_LOADER)
+
+    return data
+
+
+def fragment_files(fragment: str) -> List:
+    """Return the files a suite fragment is made of."""
+    if os.path.isdir(fragment):
+        return sorted(glob(os.path.join(fragment, "*")))
+
+    return [fragment]
+
+
+def content_hash(kind: str, files: List) -> str:
+    """Return the hash of the file names and contents along with the kind of data."""
+    digest = hashlib.sha256(f"{CACHE_VERSION}:{kind}".encode())
+    for file_name in files:
+        digest.update(os.path.basename(file_name).encode())
+        with open(file_name, "rb") as fh:
+            digest.update(fh.read())
+
+    return digest.hexdigest()
+
+
+def cached(kind: str, files: List, loader):
+    """
+    Return the data produced by loader from the files, using the on disk cache.
+
+    Args:
+        kind (str):         kind of data, part of the cache key
+        files (List):       files the data is produced from
+        loader (callable):  produces the data when it is not cached
+
+    Returns:
+        data produced by the loader
+    """
+    if not CACHE_DIR:
+        return loader()
+
+    cache_file = os.path.join(
+        CACHE_DIR, "suites", f"{content_hash(kind, files)}.pickle"
+    )
+    try:
+        with open(cache_file, "rb") as fh:
+            return pickle.load(fh)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        pass
+
+    data = loader()
+    try:
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        with open(f"{cache_file}.{os.getpid()}", "wb") as fh:
+            pickle.dump(data, fh)
+        os.replace(f"{cache_file}.{os.getpid()}", cache_file)
+    except OSError as err:
+        log.debug(f"Unable to cache {files}: {err}")
 
     return data
 
 
+def cached_yaml(file_name: str):
+    """read the given yaml using the cache"""
+    return cached("yaml", [file_name], lambda: read_yaml(file_name))
+
+
+def resolve_fragment(fragment: str) -> List:
+    """
+    Returns the tests of a suite fragment using the cache.
+
+    Args:
+        fragment (str):     suite file or directory having overrides
+
+    Returns:
+        List -> tests of the fragment
+    """
+    if os.path.isdir(fragment):
+        return cached(
+            "override", fragment_files(fragment), lambda: process_override(fragment)
+        )
+
+    return cached(
+        "tests", [fragment], lambda: (read_yaml(fragment) or {}).get("tests") or []
+    )
+
+
 def process_override(dir_name: str) -> List:
     """
     Returns a readable dictionary based on the files found in dir_name.
@@ -275,8 +397,7 @@ class Suite:
 
         for suite in self._test_suites:
             if os.path.isfile(suite) and suite.endswith(self.supported_patterns):
-                tests = read_yaml(suite)
-                suites["tests"].extend(tests.get("tests"))
+                suites["tests"].extend(resolve_fragment(suite))
                 continue
 
             if not os.path.isdir(suite):
@@ -284,7 +405,7 @@ class Suite:
                 suites["nan"].append(suite)
                 continue
 
-            suites["tests"].extend(process_override(suite))
+            suites["tests"].extend(resolve_fragment(suite))
 
         return suites
 
@@ -316,3 +437,237 @@ def load_suites(test_suites):
             test_suite_catalogue.append(test_suite)
 
     return Suite(test_suite_catalogue).suites
+
+
+def _signature(files: List) -> Dict:
+    """Return the modification time and size of the files, None when missing."""
+    signature = dict()
+    for file_name in files:
+        try:
+            stat = os.stat(file_name)
+            signature[file_name] = [stat.st_mtime_ns, stat.st_size]
+        except OSError:
+            signature[file_name] = None
+
+    return signature
+
+
+def _suite_files(suite: str) -> List:
+    """Return the suite path, its fragments and their files."""
+    if not os.path.isdir(suite):
+        return [suite]
+
+    files = [suite]
+    for fragment in Directory(suite).fragments:
+        files.append(fragment)
+        if os.path.isdir(fragment):
+            files.extend(fragment_files(fragment))
+
+    return files
+
+
+def summarize_suite(suite: str) -> Dict:
+    """
+    Summarize the tests of the suite.
+
+    Args:
+        suite (str):    suite file or directory
+
+    Returns:
+        Dict -> test names, modules and polarion IDs of the suite
+    """
+    summary = {"files": _signature(_suite_files(suite)), "missing": False}
+    tests = []
+    if os.path.exists(suite):
+        fragments = Directory(suite).fragments if os.path.isdir(suite) else [suite]
+        tests = [test.get("test", {}) for test in Suite(fragments).suites["tests"]]
+    else:
+        summary["missing"] = True
+
+    polarion_ids = set()
+    for test in tests:
+        polarion_ids.update(
+            _id.strip() for _id in str(test.get("polarion-id") or "").split(",") if _id
+        )
+
+    summary.update(
+        {
+            "tests": [test.get("name") for test in tests],
+            "modules": sorted({test["module"] for test in tests if test.get("module")}),
+            "polarion_ids": sorted(polarion_ids),
+        }
+    )
+    return summary
+
+
+def pipeline_suites(content: Dict) -> List:
+    """
+    Return the suites of the pipeline metadata along with their tags.
+
+    The suites are either listed under the suites key with their tags in the
+    metadata key or nested under the pipelines key, in which case the keys
+    leading to the suite like sanity, tier-0 and stage-1 are tags as well.
+
+    Args:
+        content (Dict):     pipeline metadata
+
+    Returns:
+        List -> name, suite, tags and metadata entry of every pipeline suite
+    """
+    suites = []
+
+    def _walk(node, tags):
+        if isinstance(node, dict):
+            for key, value in node.items():
+                _walk(value, tags + [key])
+            return
+
+        for suite in node or []:
+            suites.append(
+                {
+                    "name": suite.get("name"),
+                    "suite": suite.get("suite"),
+                    "tags": tags + (suite.get("metadata") or []),
+                    "entry": suite,
+                }
+            )
+
+    _walk(content.get("suites") or [], [])
+    _walk(content.get("pipelines") or {}, [])
+    return suites
+
+
+class SuiteIndex:
+    """Index of the suites referenced by the pipeline metadata files.
+
+    The index is stored as JSON in the cache directory, the entries whose
+    files were modified, added or removed are rebuilt when it is loaded.
+    """
+
+    def __init__(
+        self,
+        metadata_dir: str = METADATA_DIR,
+        index_file: str = None,
+        root_dir: str = ROOT_DIR,
+    ):
+        self.metadata_dir = metadata_dir
+        self.root_dir = root_dir
+        self.index_file = index_file or (
+            os.path.join(CACHE_DIR, "suite_index.json") if CACHE_DIR else None
+        )
+        self.data = {"version": CACHE_VERSION, "pipelines": dict(), "suites": dict()}
+        self.changed = False
+
+    def load(self):
+        """Load the stored index and refresh its stale entries."""
+        if self.index_file and os.path.exists(self.index_file):
+            try:
+                with open(self.index_file) as fh:
+                    data = json.load(fh)
+                if data.get("version") == CACHE_VERSION:
+                    self.data = data
+            except ValueError:
+                log.debug(f"Ignoring the corrupted suite index {self.index_file}")
+
+        self.refresh()
+        return self
+
+    def refresh(self):
+        """Rebuild the entries of the modified metadata files and suites."""
+        metadata_files = sorted(glob(os.path.join(self.metadata_dir, "*.yaml")))
+        pipelines = dict()
+        for metadata_file in metadata_files:
+            version = os.path.splitext(os.path.basename(metadata_file))[0]
+            entry = self.data["pipelines"].get(version)
+            signature = _signature([metadata_file])
+            if not entry or entry["files"] != signature:
+                content = cached_yaml(metadata_file) or {}
+                entry = {
+                    "files": signature,
+                    "overrides": content.get("overrides") or dict(),
+                    "suites": pipeline_suites(content),
+                }
+                self.changed = True
+            pipelines[version] = entry
+
+        suites = dict()
+        for entry in pipelines.values():
+            for pipeline_suite in entry["suites"]:
+                path = pipeline_suite["suite"]
+                if not path or path in suites:
+                    continue
+
+                suite = os.path.join(self.root_dir, path)
+                summary = self.data["suites"].get(path)
+                if not summary or summary["files"] != _signature(_suite_files(suite)):
+                    summary = summarize_suite(suite)
+                    self.changed = True
+                suites[path] = summary
+
+        if set(suites) != set(self.data["suites"]) or set(pipelines) != set(
+            self.data["pipelines"]
+        ):
+            self.changed = True
+
+        self.data = {"version": CACHE_VERSION, "pipelines": pipelines, "suites": suites}
+        if self.changed:
+            self.save()
+
+    def save(self):
+        """Store the index in the cache directory."""
+        if not self.index_file:
+            return
+
+        try:
+            os.makedirs(os.path.dirname(self.index_file), exist_ok=True)
+            with open(f"{self.index_file}.{os.getpid()}", "w") as fh:
+                json.dump(self.data, fh)
+            os.replace(f"{self.index_file}.{os.getpid()}", self.index_file)
+            self.changed = False
+        except OSError as err:
+            log.debug(f"Unable to store the suite index: {err}")
+
+    def overrides(self, version: str) -> Dict:
+        """Return the overrides of the pipeline metadata version."""
+        return self.data["pipelines"].get(version, {}).get("overrides", {})
+
+    def query(self, version: str = None, tags: List = None) -> List:
+        """
+        Return the pipeline suites having all the given tags.
+
+        Args:
+            version (str):  metadata version like 7.1, all versions when None
+            tags (List):    tags the suites must have
+
+        Returns:
+            List -> pipeline suites along with their test summary
+        """
+        tags = set(tags or [])
+        results = []
+        for _version, entry in self.data["pipelines"].items():
+            if version and _version != version:
+                continue
+
+            for pipeline_suite in entry["suites"]:
+                if not tags.issubset(pipeline_suite["tags"]):
+                    continue
+
+                summary = self.data["suites"].get(pipeline_suite["suite"], {})
+                result = dict(pipeline_suite, version=_version)
+                result.update(
+                    {
+                        key: summary.get(key)
+                        for key in ("tests", "modules", "polarion_ids", "missing")
+                    }
+                )
+                results.append(result)
+
+        return results
+
+
+if __name__ == "__main__":
+    args = docopt(doc)
+    tags = args.get("--tags")
+    index = SuiteIndex().load()
+    results = index.query(args.get("--rhcephVersion"), tags.split(",") if tags else [])
+    sys.stdout.write(json.dumps(results, indent=2))
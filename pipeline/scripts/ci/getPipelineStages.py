@@ -4,10 +4,17 @@ import os
 import random
 import string
 import sys
+from copy import deepcopy
 
 import yaml
 from docopt import docopt
 
+# init_suite is a module at the root of the repository
+sys.path.insert(0, os.path.abspath(f"{os.path.abspath(__file__)}/../../../.."))
+
+from init_suite import SuiteIndex
+from utility.stage_scheduler import load_history, load_plan, plan_waves, save_plan
+
 log = logging.getLogger(__name__)
 doc = """
 This script fetches all the tests to be run for a pipeline based on the RHCS version and overrides
@@ -15,6 +22,11 @@ This script fetches all the tests to be run for a pipeline based on the RHCS ver
     Usage:
         getPipelineStages.py --rhcephVersion <VER> --tags <tags>
                   [--overrides <str>]
+                  [--history <path>]...
+                  [--max-nodes <int>]
+                  [--max-vcpus <int>]
+                  [--node-vcpus <int>]
+                  [--plan <file>]
 
         getPipelineStages.py (-h | --help)
 
@@ -23,6 +35,15 @@ This script fetches all the tests to be run for a pipeline based on the RHCS ver
         -v --rhcephVersion VER     The rhcephVersion for which test stages need to be fetched
         -t --tags <str>    tags to be used for filtering test scripts
         -o --overrides <str>       Overrides to be considered for execution
+        --history <path>           Results directory of the past runs used to
+                                   estimate the suite durations
+        --max-nodes <int>          Schedule the suites in waves of at most the
+                                   given number of VMs, the stage tag selects the wave
+        --max-vcpus <int>          Schedule the suites in waves of at most the
+                                   given number of vCPUs
+        --node-vcpus <int>         vCPUs of a node not specifying them [default: 4]
+        --plan <file>              Waves planned by the first stage, read by the
+                                   later stages instead of planning them again
 """
 
 
@@ -62,38 +83,64 @@ def fetch_stages(args):
     """
     final_stage = False
     next_stage_data = []
+    waves = []
     current_dir = os.path.dirname(os.path.abspath(__file__))
     metadata_dir = os.path.abspath(f"{current_dir}/../../metadata")
-    metadata_file = f"{metadata_dir}/{args['rhcephVersion']}.yaml"
-    metadata_content = yaml.safe_load(open(metadata_file, "r"))
-    metadata_overrides = metadata_content.get("overrides", {})
+    version = args["rhcephVersion"]
+    if not os.path.exists(f"{metadata_dir}/{version}.yaml"):
+        raise FileNotFoundError(f"No pipeline metadata found for {version}")
+
+    # The suites are queried from the suite index, which parses only the
+    # metadata files modified since the previous stage.
+    index = SuiteIndex(metadata_dir).load()
+
+    def query(tags):
+        return [deepcopy(suite["entry"]) for suite in index.query(version, tags)]
+
+    metadata_overrides = deepcopy(index.overrides(version))
     cloud_overrides = {
         "ibmc": metadata_overrides.pop("ibmc", {}),
         "openstack": metadata_overrides.pop("openstack", {}),
     }
-    data = metadata_content.get("suites")
     tags = args["tags"].split(",")
     tags_next = args["tags"].split(",")
     overrides = json.loads(args.get("overrides", {}))
     cloud_type = "openstack"
 
     # filter metadata file for test suites based on tags provided
-    filtered_data = filter(lambda d: all(tag in d["metadata"] for tag in tags), data)
+    filtered_data = query(tags)
     # Incrementing stage value to fetch next stage
     stage = [i for i in tags_next if i.startswith("stage-")]
-    if stage:
+    if args.get("max_nodes") or args.get("max_vcpus"):
+        # The stages are planned using the suite durations instead of the
+        # stage tags, stage-N fetches the Nth wave.
+        suites = query([tag for tag in tags if not tag.startswith("stage-")])
+        plan_file = args.get("plan")
+        if plan_file and os.path.exists(plan_file):
+            waves = load_plan(plan_file, suites)
+        else:
+            waves = plan_waves(
+                suites,
+                load_history(args.get("history") or []),
+                max_nodes=int(args.get("max_nodes") or 0),
+                max_vcpus=int(args.get("max_vcpus") or 0),
+                node_vcpus=int(args.get("node_vcpus") or 0),
+            )
+            if plan_file:
+                save_plan(plan_file, waves)
+
+        wave = int(stage[0].split("-")[1]) - 1 if stage else 0
+        filtered_data = waves[wave] if wave < len(waves) else []
+        final_stage = wave >= len(waves) - 1
+    elif stage:
         stage_index = tags_next.index("".join(stage))
         stage_value = tags_next[stage_index].split("-")
         increment_stage = int(stage_value[1]) + 1
         stage_level = stage_value[0] + "-" + str(increment_stage)
         tags_next[stage_index] = stage_level
-        next_stage_data = list(
-            filter(
-                lambda d: all(tag_next in d["metadata"] for tag_next in tags_next), data
-            )
-        )
+        next_stage_data = query(tags_next)
 
-    if not next_stage_data:
+    if not (next_stage_data or waves):
         final_stage = True
 
     test_scripts = dict()
@@ -102,6 +149,7 @@ def fetch_stages(args):
     for script in filtered_data:
         script_name = script.pop("name")
         del script["metadata"]
+        script.pop("execution_time", None)
         instances_name = f"ci-{generate_random_string(5)}"
         cleanup_cli = ".venv/bin/python run.py --osp-cred $HOME/osp-cred-ci-2.yaml"
         cleanup_cli += f" --cleanup {instances_name}"
@@ -156,6 +204,11 @@ if __name__ == "__main__":
         "tags": cli_args.get("--tags"),
         "overrides": cli_args.get("--overrides"),
         "metadata": cli_args.get("--metadata"),
+        "history": cli_args.get("--history"),
+        "max_nodes": cli_args.get("--max-nodes"),
+        "max_vcpus": cli_args.get("--max-vcpus"),
+        "node_vcpus": cli_args.get("--node-vcpus"),
+        "plan": cli_args.get("--plan"),
     }
     try:
         testStages = fetch_stages(arguments)
@@ -4,16 +4,22 @@ Python module for initiating and executing commands via REST API.
 
 import json
 import time
+from functools import partial
 
 import requests
 from dotenv import dotenv_values
 
 from rest.common.config.config import Config
 from rest.common.utils.exceptions import CommandExecutionError, HTTPError
+from utility.http_session import DEFAULT_RETRIES, batch, request
 from utility.log import Log
 
 log = Log(__name__)
 
+# Auth tokens keyed by the base URI and credentials, shared by the REST objects
+# created with cache_token
+TOKENS = {}
+
 
 def rest():
     """
@@ -55,6 +61,12 @@ class REST(object):
           port(int,optional): Port to connect for sending REST calls. Default: 9440.
           base_uri(str,optional): URI for sending REST calls to.
             Default: Prism gateway URI.
+          token(str,optional): Auth token, the user logs in when not provided.
+          cache_token(bool,optional): Reuse the token of the user cached by
+            the previous REST objects instead of logging in. Default: False.
+          retries(int,optional): Retries on connection failures. Default: 3.
+          refresh_auth(bool,optional): Login again once when a request is
+            unauthorized, e.g. the token expired. Default: False.
 
         Returns
           Returns REST object instance.
@@ -74,14 +86,25 @@ class REST(object):
         base_url = f"https://{self._ip}:{self._port}"
         self._base_uri = kwargs.get("base_uri", base_url)
 
+        self._retries = kwargs.get("retries", DEFAULT_RETRIES)
+        self._refresh_auth = kwargs.get("refresh_auth", False)
+        self._cache_token = kwargs.get("cache_token", False)
+
         # Disable HTTPS certificate warning.
         requests.packages.urllib3.disable_warnings()
         auth_token = kwargs.get("token", None)
-        if auth_token is None:
+        cached_token = TOKENS.get(self._token_key) if self._cache_token else None
+        if auth_token is None and cached_token:
+            self.headers.update({"Authorization": f"Bearer {cached_token}"})
+        elif auth_token is None:
             self.auth()
         else:
             self.check_auth(auth_token)
 
+    @property
+    def _token_key(self):
+        return self._base_uri, self._username, self._password
+
     def check_auth(self, token):
         """
         checks the authentication for the given token
@@ -117,10 +140,51 @@ class REST(object):
         ]
         _data = {"username": self._username, "password": self._password}
         auth_res = self.post(
-            relative_url=auth_relative_endpoint, headers=self.headers, data=_data
+            relative_url=auth_relative_endpoint,
+            headers=self.headers,
+            data=_data,
+            refresh_auth=False,
         )
+        if self._cache_token:
+            TOKENS[self._token_key] = auth_res["token"]
         self.headers.update({"Authorization": f"Bearer {auth_res['token']}"})
 
+    def logout(self):
+        """
+        Logs out the user, the cached token of the user is dropped
+        """
+        logout_relative_endpoint = self._config.get_config()["endpoints"]["common"][
+            "LOGOUT"
+        ]
+        TOKENS.pop(self._token_key, None)
+        try:
+            return self.post(
+                relative_url=logout_relative_endpoint,
+                headers=self.headers,
+                refresh_auth=False,
+            )
+        finally:
+            self.headers.pop("Authorization", None)
+
+    def batch(self, calls, max_workers=None):
+        """This routine is used to invoke independent REST calls concurrently.
+
+        Args:
+          calls(list): tuples of operation, relative URL and kwargs of the call,
+            like (REST.GET, "/api/pool", {}).
+          max_workers(int, optional): Maximum number of calls in flight.
+
+        Returns:
+          list: responses in the order of the calls.
+        """
+        return batch(
+            [
+                partial(getattr(self, operation), relative_url, **kwargs)
+                for operation, relative_url, kwargs in calls
+            ],
+            max_workers=max_workers,
+        )
+
     def delete(self, relative_url, **kwargs):
         """This routine is used to invoke DELETE call for REST API.
 
@@ -236,13 +300,15 @@ class REST(object):
             auth=auth,
             max_retries=max_retries,
             raw_response=raw_response,
+            refresh_auth=kwargs.get("refresh_auth", self._refresh_auth),
         )
         return response
 
     def __send_request(self, **kwargs):
         """
         Private Method which can be used to send any kind of
-        HTTP request with custom retries
+        HTTP request with custom retries, the auth token is refreshed
+        once when the request is unauthorized and refresh_auth is set.
         """
         req_type = kwargs.pop("req_type", None)
         if not req_type:
@@ -261,14 +327,31 @@ class REST(object):
         verify = kwargs.pop("verify", False)
         timeout = kwargs.pop("timeout", 60)
         interval = kwargs.pop("interval", 5)
+        refresh_auth = kwargs.pop("refresh_auth", False)
 
         retry_count = 1
         log.info(f"REST call Details {req_type.upper()}: {main_uri}, {headers}, {data}")
         while retry_count <= max_retries:
-            method_to_call = getattr(requests, req_type)
-            response = method_to_call(
-                main_uri, headers=headers, verify=verify, data=data, timeout=timeout
+            response = request(
+                req_type,
+                main_uri,
+                retries=self._retries,
+                headers=headers,
+                verify=verify,
+                data=data,
+                timeout=timeout,
             )
+            if (
+                response.status_code == requests.codes.UNAUTHORIZED
+                and refresh_auth
+                and "Authorization" in headers
+            ):
+                log.debug("Auth token is rejected, refreshing it")
+                refresh_auth = False
+                self.auth()
+                headers["Authorization"] = self.headers["Authorization"]
+                continue
+
             if raw_response:
                 return response
 
@@ -5,14 +5,19 @@ from gevent import monkey
 
 monkey.patch_all()
 
+import sys
+
+# Record the import cost of the modules imported from here on.
+if "--profile-startup" in sys.argv:
+    from utility.import_profiler import import_profiler
+
+    import_profiler.start()
+
 import datetime
-import importlib
 import json
 import os
 import pickle
 import re
-import sys
-import time
 import traceback
 from copy import deepcopy
 from getpass import getuser
@@ -25,23 +30,27 @@ from libcloud.common.types import LibcloudError
 import init_suite
 from ceph.ceph import Ceph, CephNode
 from ceph.clients import WinNode
+from ceph.parallel import parallel
 from ceph.utils import (
     cleanup_ceph_nodes,
     cleanup_ibmc_ceph_nodes,
     create_baremetal_ceph_nodes,
     create_ceph_nodes,
     create_ibmc_ceph_nodes,
+    wait_for_ssh,
 )
-from cephci.cluster_info import get_ceph_var_logs
 from cli.performance.memory_and_cpu_utils import (
     start_logging_processes,
     stop_logging_process,
     upload_mem_and_cpu_logger_script,
 )
-from utility import sosreport
-from utility.log import Log
-from utility.polarion import post_to_polarion
+from utility.log import Log, test_context
+from utility.log_collector import collect_logs
+from utility.module_resolver import ModuleResolver
+from utility.polarion import polarion_records
+from utility.publisher import ResultPublisher
 from utility.retry import retry
+from utility.suite_scheduler import SuiteScheduler, build_graph
 from utility.utils import (  # ReportPortal,
     check_build_overrides,
     create_run_dir,
@@ -50,7 +59,6 @@ from utility.utils import (  # ReportPortal,
     fetch_build_artifacts,
     generate_unique_id,
     magna_url,
-    setup_cluster_access,
     validate_conf,
     validate_image,
 )
@@ -98,8 +106,11 @@ A simple test suite wrapper that executes tests based on yaml test configuration
         [--skip-tc <items>]
         [--monitor-performance]
         [--disable-console-log]
+        [--test-concurrency <count>]
+        [--profile-startup]
   run.py --cleanup=name --osp-cred <file> [--cloud <str>]
         [--log-level <LEVEL>]
+        [--profile-startup]
 
 Options:
   -h --help                         show this screen
@@ -163,6 +174,10 @@ Options:
                                     for every test and collects data to specified dir
   --disable-console-log             To stopping logging to console
                                     [default: false]
+  --test-concurrency <count>        Maximum number of independent suite tests run
+                                    at a time, see utility/suite_scheduler.py
+                                    [default: 4]
+  --profile-startup                 Report the time taken to import the modules
 """
 log = Log()
 test_names = []
@@ -269,16 +284,16 @@ def create_nodes(
 
     # TODO: refactor cluster dict to cluster list
     log.info("Done creating osp instances")
-    log.info("Waiting for Floating IPs to be available")
-    log.info("Sleeping 15 Seconds")
-    time.sleep(15)
+    log.info("Waiting for the nodes to be reachable over SSH")
+    with parallel() as p:
+        for cluster in ceph_cluster_dict.values():
+            for instance in cluster:
+                p.spawn(wait_for_ssh, instance.ip_address)
 
-    for cluster_name, cluster in ceph_cluster_dict.items():
-        for instance in cluster:
-            try:
-                instance.connect()
-            except BaseException:
-                raise
+    with parallel() as p:
+        for cluster in ceph_cluster_dict.values():
+            for instance in cluster:
+                p.spawn(instance.connect)
 
     return ceph_cluster_dict, clients
 
@@ -487,6 +502,7 @@ def run(args):
     custom_config = args.get("--custom-config")
     custom_config_file = args.get("--custom-config-file")
     xunit_results = args.get("--xunit-results")
+    test_concurrency = int(args.get("--test-concurrency") or 1)
 
     enable_eus = args.get("--enable-eus")
     skip_enabling_rhel_rpms = args.get("--skip-enabling-rhel-rpms")
@@ -665,30 +681,11 @@ def run(args):
             os.makedirs(os.path.dirname(ceph_clusters_file))
         store_cluster_state(ceph_cluster_dict, ceph_clusters_file)
 
-    sys.path.append(os.path.abspath("tests"))
-    sys.path.append(os.path.abspath("tests/rados"))
-    sys.path.append(os.path.abspath("tests/cephadm"))
-    sys.path.append(os.path.abspath("tests/rbd"))
-    sys.path.append(os.path.abspath("tests/rbd/rest"))
-    sys.path.append(os.path.abspath("tests/rbd_mirror"))
-    sys.path.append(os.path.abspath("tests/cephfs"))
-    sys.path.append(os.path.abspath("tests/iscsi"))
-    sys.path.append(os.path.abspath("tests/rgw"))
-    sys.path.append(os.path.abspath("tests/ceph_ansible"))
-    sys.path.append(os.path.abspath("tests/ceph_installer"))
-    sys.path.append(os.path.abspath("tests/mgr"))
-    sys.path.append(os.path.abspath("tests/dashboard"))
-    sys.path.append(os.path.abspath("tests/misc_env"))
-    sys.path.append(os.path.abspath("tests/parallel"))
-    sys.path.append(os.path.abspath("tests/upgrades"))
-    sys.path.append(os.path.abspath("tests/ceph_volume"))
-    sys.path.append(os.path.abspath("tests/nvmeof"))
-    sys.path.append(os.path.abspath("tests/nvmeof/rest"))
-    sys.path.append(os.path.abspath("tests/nfs"))
-    sys.path.append(os.path.abspath("tests/smb"))
+    # Test modules and their siblings are imported by name from the test dirs
+    module_resolver = ModuleResolver()
+    module_resolver.install()
 
     tests = suite.get("tests")
-    tcs = []
     jenkins_rc = 0
     _rhcs_version = rhbuild[:3]
     # use ceph_test_data to pass around dynamic data between tests
@@ -696,257 +693,303 @@ def run(args):
     ceph_test_data["custom-config"] = custom_config
     ceph_test_data["custom-config-file"] = custom_config_file
 
-    # Initialize test return code
-    rc = 0
     run_config = {
         "log_dir": run_dir,
         "run_id": run_id,
     }
     download_path = run_dir if not log_directory else log_directory
     cluster_info = []
+    publisher = ResultPublisher(os.path.join(run_dir, "publish_queue"))
 
-    for test in tests:
-        test = test.get("test")
+    suite_tests = [test.get("test") for test in tests]
+    test_details = []
+    for test in suite_tests:
         tc = fetch_test_details(test)
-        do_not_skip_test = test.get("do-not-skip-tc", False)
-        test_file = tc["file"]
         unique_test_name = create_unique_test_name(tc["name"], test_names)
         test_names.append(unique_test_name)
+        test_details.append((tc, unique_test_name))
 
-        tc["log-link"] = log.configure_logger(
-            unique_test_name, run_dir, disable_console_log
-        )
-        run_config.update({"test_name": unique_test_name, "log_link": tc["log-link"]})
-        mod_file_name = os.path.splitext(test_file)[0]
-        test_mod = importlib.import_module(mod_file_name)
-        print("\nRunning test: {test_name}".format(test_name=tc["name"]))
-
-        if tc.get("log-link"):
-            print("Test logfile location: {log_url}".format(log_url=tc["log-link"]))
-
-        log.info(f"Running test {test_file}")
-        start = datetime.datetime.now()
-
-        for cluster_name in test.get("clusters", ceph_cluster_dict):
-            # Add cluster names
-            if cluster_name not in cluster_info:
-                cluster_info.append(cluster_name)
-
-            # If Performance and CPU usage monitoring is enabled, perform pre-reqs
-            if enable_perf_mon:
-                if not upload_mem_and_cpu_logger_script(
-                    ceph_cluster_dict[cluster_name]
-                ):
-                    log.error(
-                        "Failed to upload Memory and CPU monitoring scripts to nodes. "
-                        "The tests will proceed without monitoring"
-                    )
-                    enable_perf_mon = False
-
-            if test.get("clusters"):
-                config = test.get("clusters").get(cluster_name).get("config", {})
-            else:
-                config = test.get("config", {})
-            parallel = test.get("parallel", [])
-
-            if not config.get("base_url"):
-                config["base_url"] = base_url
-
-            config["rhbuild"] = f"{rhbuild}-{platform}"
-            config["cloud-type"] = cloud_type
-            if "ubuntu_repo" in locals():
-                config["ubuntu_repo"] = ubuntu_repo
-
-            if skip_setup is True:
-                config["skip_setup"] = True
-
-            if skip_subscription is True:
-                config["skip_subscription"] = True
-
-            if config.get("skip_version_compare"):
-                skip_version_compare = config.get("skip_version_compare")
-
-            if args.get("--add-repo"):
-                repo = args.get("--add-repo")
-                if repo.startswith("http"):
-                    config["add-repo"] = repo
-
-            config["build_type"] = build
-            config["enable_eus"] = enable_eus
-            config["skip_enabling_rhel_rpms"] = skip_enabling_rhel_rpms
-            config["docker-insecure-registry"] = docker_insecure_registry
-            config["skip_version_compare"] = skip_version_compare
-            config["container_image"] = "%s/%s:%s" % (
-                docker_registry,
-                docker_image,
-                docker_tag,
-            )
-
-            if custom_config:
-                for _config in custom_config:
-                    if "ibm-build=" in _config:
-                        config["ibm_build"] = bool(_config.split("=")[1])
-
-                    if "enable-fips-mode=" in _config:
-                        config["enable_fips_mode"] = bool(_config.split("=")[1])
-
-            config["ceph_docker_registry"] = docker_registry
-            config["ceph_docker_image"] = docker_image
-            config["ceph_docker_image_tag"] = docker_tag
+    def cluster_resources(test):
+        """Tests not declaring their resources hold the clusters they run on."""
+        return [f"cluster:{name}" for name in test.get("clusters", ceph_cluster_dict)]
 
-            if filestore:
-                config["filestore"] = filestore
+    results = dict()
 
-            if ec_pool_vals:
-                config["ec-pool-k-m"] = ec_pool_vals
+    def execute_test(node):
+        """Run the suite test of the node and return its rc."""
+        nonlocal enable_perf_mon, skip_version_compare, _rhcs_version
+        nonlocal ceph_cluster_dict, clients, jenkins_rc
 
-            if args.get("--hotfix-repo"):
-                hotfix_repo = args.get("--hotfix-repo")
-                if hotfix_repo.startswith("http"):
-                    config["hotfix_repo"] = hotfix_repo
-
-            if kernel_repo is not None:
-                config["kernel-repo"] = kernel_repo
-
-            if osp_cred:
-                config["osp_cred"] = osp_cred
-
-            # if Kernel Repo is defined in ENV then set the value in config
-            if os.environ.get("KERNEL-REPO-URL") is not None:
-                config["kernel-repo"] = os.environ.get("KERNEL-REPO-URL")
+        test = suite_tests[node.index]
+        tc, unique_test_name = test_details[node.index]
+        do_not_skip_test = test.get("do-not-skip-tc", False)
+        test_file = tc["file"]
 
-            # Start performance and Cpu usage monitoring
-            if enable_perf_mon:
-                logging_process, tracker = start_logging_processes(
-                    ceph_cluster_dict[cluster_name], unique_test_name
-                )
-            try:
-                if "build" in config.keys():
-                    _rhcs_version = config["build"]
-
-                # Initialize the cluster with the expected rhcs_version
-                ceph_cluster_dict[cluster_name].rhcs_version = _rhcs_version
-                if mod_file_name not in skip_tc_list or do_not_skip_test:
-                    rc = test_mod.run(
-                        ceph_cluster=ceph_cluster_dict[cluster_name],
-                        ceph_nodes=ceph_cluster_dict[cluster_name],
-                        config=config,
-                        parallel=parallel,
-                        test_data=ceph_test_data,
-                        ceph_cluster_dict=ceph_cluster_dict,
-                        clients=clients,
-                        run_config=run_config,
+        # Initialize test return code
+        rc = 0
+        tc["log-link"], log_handlers = log.configure_test_logger(
+            unique_test_name, run_dir, disable_console_log
+        )
+        test_run_config = dict(
+            run_config, test_name=unique_test_name, log_link=tc["log-link"]
+        )
+        try:
+            with test_context(unique_test_name):
+                mod_file_name = os.path.splitext(test_file)[0]
+                test_mod = module_resolver.load(test_file)
+                print("\nRunning test: {test_name}".format(test_name=tc["name"]))
+
+                if tc.get("log-link"):
+                    print(
+                        "Test logfile location: {log_url}".format(
+                            log_url=tc["log-link"]
+                        )
                     )
 
-                else:
-                    rc = -1
-
-            except BaseException as be:  # noqa
-                # Log exception to stdout
-                log.exception(be)
-
-                # Set failure details
-                tc["err_type"] = "exception"
-                tc["err_msg"] = str(be)
-                tc["err_text"] = traceback.format_exc()
-
-                # Set return code to 1
-                rc = 1
-
-            finally:
-                # Stop performance and Cpu usage monitoring
-                if enable_perf_mon:
-                    stop_logging_process(
-                        ceph_cluster_dict[cluster_name],
-                        logging_process,
-                        download_path,
-                        tracker,
+                log.info(f"Running test {test_file}")
+                start = datetime.datetime.now()
+
+                for cluster_name in test.get("clusters", ceph_cluster_dict):
+                    # Add cluster names
+                    if cluster_name not in cluster_info:
+                        cluster_info.append(cluster_name)
+
+                    # If Performance and CPU usage monitoring is enabled, perform pre-reqs
+                    if enable_perf_mon:
+                        if not upload_mem_and_cpu_logger_script(
+                            ceph_cluster_dict[cluster_name]
+                        ):
+                            log.error(
+                                "Failed to upload Memory and CPU monitoring scripts to nodes. "
+                                "The tests will proceed without monitoring"
+                            )
+                            enable_perf_mon = False
+
+                    # A copy, the suite is not changed by the concurrent tests
+                    if test.get("clusters"):
+                        config = deepcopy(
+                            test.get("clusters").get(cluster_name).get("config", {})
+                        )
+                    else:
+                        config = deepcopy(test.get("config", {}))
+                    parallel = test.get("parallel", [])
+
+                    if not config.get("base_url"):
+                        config["base_url"] = base_url
+
+                    config["rhbuild"] = f"{rhbuild}-{platform}"
+                    config["cloud-type"] = cloud_type
+                    if "ubuntu_repo" in locals():
+                        config["ubuntu_repo"] = ubuntu_repo
+
+                    if skip_setup is True:
+                        config["skip_setup"] = True
+
+                    if skip_subscription is True:
+                        config["skip_subscription"] = True
+
+                    if config.get("skip_version_compare"):
+                        skip_version_compare = config.get("skip_version_compare")
+
+                    if args.get("--add-repo"):
+                        repo = args.get("--add-repo")
+                        if repo.startswith("http"):
+                            config["add-repo"] = repo
+
+                    config["build_type"] = build
+                    config["enable_eus"] = enable_eus
+                    config["skip_enabling_rhel_rpms"] = skip_enabling_rhel_rpms
+                    config["docker-insecure-registry"] = docker_insecure_registry
+                    config["skip_version_compare"] = skip_version_compare
+                    config["container_image"] = "%s/%s:%s" % (
+                        docker_registry,
+                        docker_image,
+                        docker_tag,
                     )
-                collect_recipe(ceph_cluster_dict[cluster_name])
-                if store:
-                    store_cluster_state(ceph_cluster_dict, ceph_clusters_file)
-
-                # Artifacts from test appended to comments
-                if config.get("artifacts"):
-                    tc["comments"] += f"\n{config['artifacts']}"
-
-            # Check for Log object
-            _objects, _object = vars(test_mod), None
-            for k in _objects.keys():
-                if type(_objects.get(k)) is Log:
-                    _object = _objects.get(k)
-                    break
-
-            if rc != 0:
-                # Check if err_type is set for exception
-                if _object and not (tc.get("err_type") == "exception"):
-                    tc["err_type"], tc["err_msg"] = "error", ""
-
-                    # Get error messages
-                    tc["err_msg"] = "\n".join(map(str, _object._log_errors))
-
-                break
-
-        # Calculate test execution time
-        elapsed = datetime.datetime.now() - start
-        tc["duration"] = elapsed
 
-        # Reset errors list
-        if _object:
-            _object._log_errors = []
+                    if custom_config:
+                        for _config in custom_config:
+                            if "ibm-build=" in _config:
+                                config["ibm_build"] = bool(_config.split("=")[1])
+
+                            if "enable-fips-mode=" in _config:
+                                config["enable_fips_mode"] = bool(_config.split("=")[1])
+
+                    config["ceph_docker_registry"] = docker_registry
+                    config["ceph_docker_image"] = docker_image
+                    config["ceph_docker_image_tag"] = docker_tag
+
+                    if filestore:
+                        config["filestore"] = filestore
+
+                    if ec_pool_vals:
+                        config["ec-pool-k-m"] = ec_pool_vals
+
+                    if args.get("--hotfix-repo"):
+                        hotfix_repo = args.get("--hotfix-repo")
+                        if hotfix_repo.startswith("http"):
+                            config["hotfix_repo"] = hotfix_repo
+
+                    if kernel_repo is not None:
+                        config["kernel-repo"] = kernel_repo
+
+                    if osp_cred:
+                        config["osp_cred"] = osp_cred
+
+                    # if Kernel Repo is defined in ENV then set the value in config
+                    if os.environ.get("KERNEL-REPO-URL") is not None:
+                        config["kernel-repo"] = os.environ.get("KERNEL-REPO-URL")
+
+                    # Start performance and Cpu usage monitoring
+                    if enable_perf_mon:
+                        logging_process, tracker = start_logging_processes(
+                            ceph_cluster_dict[cluster_name], unique_test_name
+                        )
+                    try:
+                        if "build" in config.keys():
+                            _rhcs_version = config["build"]
+
+                        # Initialize the cluster with the expected rhcs_version
+                        ceph_cluster_dict[cluster_name].rhcs_version = _rhcs_version
+                        if mod_file_name not in skip_tc_list or do_not_skip_test:
+                            rc = test_mod.run(
+                                ceph_cluster=ceph_cluster_dict[cluster_name],
+                                ceph_nodes=ceph_cluster_dict[cluster_name],
+                                config=config,
+                                parallel=parallel,
+                                test_data=ceph_test_data,
+                                ceph_cluster_dict=ceph_cluster_dict,
+                                clients=clients,
+                                run_config=test_run_config,
+                            )
+
+                        else:
+                            rc = -1
+
+                    except BaseException as be:  # noqa
+                        # Log exception to stdout
+                        log.exception(be)
+
+                        # Set failure details
+                        tc["err_type"] = "exception"
+                        tc["err_msg"] = str(be)
+                        tc["err_text"] = traceback.format_exc()
+
+                        # Set return code to 1
+                        rc = 1
+
+                    finally:
+                        # Stop performance and Cpu usage monitoring
+                        if enable_perf_mon:
+                            stop_logging_process(
+                                ceph_cluster_dict[cluster_name],
+                                logging_process,
+                                download_path,
+                                tracker,
+                            )
+                        collect_recipe(ceph_cluster_dict[cluster_name])
+                        if store:
+                            store_cluster_state(ceph_cluster_dict, ceph_clusters_file)
+
+                        # Artifacts from test appended to comments
+                        if config.get("artifacts"):
+                            tc["comments"] += f"\n{config['artifacts']}"
+
+                    # Check for Log object
+                    _objects, _object = vars(test_mod), None
+                    for k in _objects.keys():
+                        if type(_objects.get(k)) is Log:
+                            _object = _objects.get(k)
+                            break
+
+                    if rc != 0:
+                        # Check if err_type is set for exception
+                        if _object and not (tc.get("err_type") == "exception"):
+                            tc["err_type"], tc["err_msg"] = "error", ""
+
+                            # Get error messages
+                            tc["err_msg"] = "\n".join(map(str, _object._log_errors))
+
+                        break
+
+                # Calculate test execution time
+                elapsed = datetime.datetime.now() - start
+                tc["duration"] = elapsed
+
+                # Reset errors list
+                if _object:
+                    _object._log_errors = []
+
+                if rc == 0:
+                    tc["status"] = "Pass"
+                    msg = "Test {} passed".format(test_mod)
+                    log.info(msg)
+                    print(msg)
+
+                    if post_results:
+                        publisher.publish("polarion", polarion_records(tc))
+
+                elif rc == -1:
+                    tc["status"] = "Skipped"
+                    msg = "Test {} Skipped".format(test_mod)
+                    log.info(msg)
+                    print(msg)
+
+                    if post_results:
+                        publisher.publish("polarion", polarion_records(tc))
 
-        if rc == 0:
-            tc["status"] = "Pass"
-            msg = "Test {} passed".format(test_mod)
-            log.info(msg)
-            print(msg)
-
-            if post_results:
-                post_to_polarion(tc=tc)
-
-        elif rc == -1:
-            tc["status"] = "Skipped"
-            msg = "Test {} Skipped".format(test_mod)
-            log.info(msg)
-            print(msg)
-
-            if post_results:
-                post_to_polarion(tc=tc)
-
-        else:
-            tc["status"] = "Failed"
-            msg = "Test {} failed".format(test_mod)
-            log.info(msg)
-            print(msg)
-            jenkins_rc = 1
-
-            if post_results:
-                post_to_polarion(tc=tc)
-
-            if test.get("abort-on-fail", False):
-                log.info("Aborting on test failure")
-                tcs.append(tc)
-                break
-
-        if test.get("destroy-cluster") is True:
-            if cloud_type == "openstack":
-                cleanup_ceph_nodes(osp_cred, instances_name)
-            elif cloud_type == "ibmc":
-                cleanup_ibmc_ceph_nodes(osp_cred, instances_name)
-
-        if test.get("recreate-cluster") is True:
-            ceph_cluster_dict, clients = create_nodes(
-                conf,
-                inventory,
-                osp_cred,
-                run_id,
-                cloud_type,
-                service,
-                instances_name,
-                enable_eus=enable_eus,
-            )
+                else:
+                    tc["status"] = "Failed"
+                    msg = "Test {} failed".format(test_mod)
+                    log.info(msg)
+                    print(msg)
+                    jenkins_rc = 1
+
+                    if post_results:
+                        publisher.publish("polarion", polarion_records(tc))
+
+                    if test.get("abort-on-fail", False):
+                        log.info("Aborting on test failure")
+                        results[node.index] = tc
+                        return rc
+
+                if test.get("destroy-cluster") is True:
+                    if cloud_type == "openstack":
+                        cleanup_ceph_nodes(osp_cred, instances_name)
+                    elif cloud_type == "ibmc":
+                        cleanup_ibmc_ceph_nodes(osp_cred, instances_name)
+
+                if test.get("recreate-cluster") is True:
+                    ceph_cluster_dict, clients = create_nodes(
+                        conf,
+                        inventory,
+                        osp_cred,
+                        run_id,
+                        cloud_type,
+                        service,
+                        instances_name,
+                        enable_eus=enable_eus,
+                    )
 
-        tcs.append(tc)
+                results[node.index] = tc
+                return rc
+        finally:
+            log.remove_handlers(log_handlers)
+
+    # Independent tests run concurrently, the rest in the suite order
+    scheduler = SuiteScheduler(
+        build_graph(
+            suite_tests,
+            [name for _, name in test_details],
+            default_resources=cluster_resources,
+        ),
+        max_workers=test_concurrency,
+    )
+    # The tests log to their own files from here on
+    log.close_and_remove_filehandlers()
+    scheduler.run(execute_test)
+    log.configure_logger("teardown", run_dir, disable_console_log)
+    tcs = [results[index] for index in sorted(results)]
 
     url_base = (
         magna_url + run_dir.split("/")[-1]
@@ -955,8 +998,6 @@ def run(args):
     )
     log.info("\nAll test logs located here: {base}".format(base=url_base))
 
-    log.close_and_remove_filehandlers()
-
     test_run_metadata = {
         "jenkin-url": jenkin_job_url,
         "build": rhbuild,
@@ -992,8 +1033,18 @@ def run(args):
         "total": f"{int(duration[0])} mins, {int(duration[1])} secs",
     }
     info = {"status": "Pass"}
+    run_summary.update(
+        {
+            "suite": suite_name,
+            "global-conf": glb_file,
+            "duration": (run_end_time - run_start_time).total_seconds(),
+            "nodes": sum(len(cluster) for cluster in ceph_cluster_dict.values()),
+            "status": "Fail" if jenkins_rc else "Pass",
+        }
+    )
     with open(f"{run_dir}/run_summary.json", "w", encoding="utf-8") as f:
         json.dump(run_summary, f, ensure_ascii=False, indent=4)
+    store_command_stats(ceph_cluster_dict, run_dir)
     test_res = {
         "result": tcs,
         "run_id": run_id,
@@ -1006,22 +1057,17 @@ def run(args):
         "prefix": instances_name,
     }
 
-    email_results(test_result=test_res)
+    publisher.publish("email", test_res)
 
     if jenkins_rc and not skip_sos_report:
         log.info(
             "\n\nGenerating sosreports for all the nodes due to failures in testcase"
         )
-        for cluster in ceph_cluster_dict.keys():
-            log.info(f"Installing Ceph-common on {cluster} nodes to gather Sos report")
-            for node in ceph_cluster_dict[cluster].get_nodes():
-                setup_cluster_access(ceph_cluster_dict[cluster], node)
-            installer = ceph_cluster_dict[cluster].get_nodes(role="installer")[0]
-            sosreport.run(installer.ip_address, "cephuser", "cephuser", run_dir)
-            # This can be Removed as sos report will have this details as well
-            get_ceph_var_logs(ceph_cluster_dict[cluster], run_dir)
+        collect_logs(ceph_cluster_dict, run_dir)
         log.info(f"Generated sosreports location : {url_base}/sosreports\n")
 
+    publisher.close()
+    log.close_and_remove_filehandlers()
     return jenkins_rc
 
 
@@ -1032,6 +1078,21 @@ def store_cluster_state(ceph_cluster_object, ceph_clusters_file_name):
     log.info("ceph_clusters_file %s", ceph_clusters_file_name)
 
 
+def store_command_stats(ceph_cluster_dict, run_dir):
+    """Write the per node remote command latency counters to the run directory."""
+    command_stats = dict()
+    for cluster_name, cluster in ceph_cluster_dict.items():
+        command_stats[cluster_name] = {
+            node.shortname: node.command_stats
+            for node in cluster
+            if hasattr(node, "shortname")
+        }
+
+    with open(f"{run_dir}/command_stats.json", "w", encoding="utf-8") as f:
+        json.dump(command_stats, f, indent=4)
+    log.info(f"Remote command statistics written to {run_dir}/command_stats.json")
+
+
 def collect_recipe(ceph_cluster):
     """
     Gather the system under test details.
@@ -1080,6 +1141,9 @@ def collect_recipe(ceph_cluster):
 
 if __name__ == "__main__":
     args = docopt(doc)
+    if args.get("--profile-startup"):
+        sys.stderr.write(import_profiler.report() + "\n")
+
     rc = run(args)
     log.info("final rc of test run %d" % rc)
     sys.exit(rc)
@@ -7,6 +7,7 @@ It installs all the pre-requisites on client nodes
 
 import argparse
 import datetime
+import hashlib
 import itertools
 import json
 import os
@@ -32,6 +33,11 @@ from utility.retry import retry
 
 log = Log(__name__)
 
+# Helper performing bulk file operations on the clients, pushed when the copy
+# on the client is missing or differs
+BULK_DATA_SCRIPT = "tests/cephfs/utilities/bulk_data.py"
+BULK_DATA_DST = "/root/bulk_data.py"
+
 
 def function_execution_time(func):
     """
@@ -2486,16 +2492,70 @@ os.system('sudo systemctl start  network')
         :param directory:
         :return:
         """
-        out, rc = client.exec_command(
-            sudo=True, cmd=f"cd {directory};ls -lrt |  awk {{'print $9'}}"
+        return self.bulk_checksum(client, directory)["files"]
+
+    def push_bulk_data_helper(self, client):
+        """
+        Uploads the bulk data helper to the client, unless the client has the same copy.
+        Args:
+            client: client node
+        Returns:
+            remote path of the helper
+        """
+        with open(BULK_DATA_SCRIPT, "rb") as fh:
+            digest = hashlib.sha256(fh.read()).hexdigest()
+
+        out, _ = client.exec_command(
+            sudo=True, cmd=f"sha256sum {BULK_DATA_DST}", check_ec=False
         )
-        file_list = out.strip().split()
-        file_dict = {}
-        for file in file_list:
-            out, rc = client.exec_command(sudo=True, cmd=f"md5sum {directory}/{file}")
-            md5sum = out.strip().split()
-            file_dict[file] = md5sum[0]
-        return file_dict
+        if out.split()[:1] != [digest]:
+            client.upload_file(sudo=True, src=BULK_DATA_SCRIPT, dst=BULK_DATA_DST)
+
+        return BULK_DATA_DST
+
+    def bulk_checksum(self, client, path, algo="md5", recursive=False, workers=None):
+        """
+        Checksums all the files of the directory in a single remote invocation.
+        Args:
+            client: client node
+            path: directory having the files
+            algo: md5, sha1 or xxhash (requires python3-xxhash on the client)
+            recursive: include the files of the sub directories
+            workers: number of files checksummed in parallel, twice the cpus by default
+        Returns:
+            manifest dict, {"algo": algo, "files": {<relative path>: <digest>}}
+        """
+        helper = self.push_bulk_data_helper(client)
+        cmd = f"python3 {helper} checksum --path {path} --algo {algo}"
+        if recursive:
+            cmd += " --recursive"
+        if workers:
+            cmd += f" --workers {workers}"
+
+        out, _ = client.exec_command(sudo=True, cmd=cmd, timeout=3600)
+        return json.loads(out)
+
+    @staticmethod
+    def diff_manifests(expected, actual):
+        """
+        Compares two manifests returned by bulk_checksum or create_files_in_path.
+        Args:
+            expected: manifest taken first
+            actual: manifest to be verified
+        Returns:
+            dict having the missing, unexpected and mismatched file names,
+            all the lists are empty when the manifests match
+        """
+        expected, actual = expected["files"], actual["files"]
+        return {
+            "missing": sorted(set(expected) - set(actual)),
+            "unexpected": sorted(set(actual) - set(expected)),
+            "mismatched": sorted(
+                name
+                for name in set(expected) & set(actual)
+                if expected[name] != actual[name]
+            ),
+        }
 
     def set_xattrs(
         self,
@@ -4376,21 +4436,25 @@ os.system('sudo systemctl start  network')
             log.error(f"An unexpected error occurred: {e}")
             return {"error": "An unexpected error occurred"}
 
-    def create_files_in_path(self, clients, path, num_of_files, batch_size):
+    def create_files_in_path(
+        self, clients, path, num_of_files, batch_size, checksum=False, algo="md5"
+    ):
         """
         Creates a specified number of files in the given path on the client.
 
         This method ensures the specified directory exists and then creates the
-        desired number of files in batches to avoid overwhelming the filesystem.
+        desired number of files using the bulk data helper in a single remote invocation.
 
         Args:
             clients (object): The client object used to execute commands.
             path (str): The directory where files will be created.
             num_of_files (int): The total number of files to create.
-            batch_size (int): The number of files to create per batch to avoid overwhelming the filesystem.
+            batch_size (int): The number of files after which the progress is reported.
+            checksum (bool): Checksum the created files in the same invocation.
+            algo (str): Checksum algorithm, md5, sha1 or xxhash.
 
         Returns:
-            None
+            Manifest of the created files, the digests are None unless checksum is set
 
         Raises:
             Exception: If an error occurs during file creation.
@@ -4411,16 +4475,17 @@ os.system('sudo systemctl start  network')
 
             log.info(f"Path exists or created successfully: {path}")
 
-            for i in range(0, num_of_files, batch_size):
-                batch_end = min(i + batch_size, num_of_files)
-                for j in range(i, batch_end):
-                    file_path = os.path.join(path, f"file_{j}.txt")
-                    create_file_cmd = (
-                        f"echo 'Created files {j}' | sudo tee {file_path} > /dev/null"
-                    )
-                    clients.exec_command(sudo=True, cmd=create_file_cmd)
-                log.info(f"Created files {i} to {batch_end - 1}")
+            helper = self.push_bulk_data_helper(clients)
+            cmd = (
+                f"python3 {helper} create --path {path} --count {num_of_files} "
+                f"--batch-size {batch_size}"
+            )
+            if checksum:
+                cmd += f" --checksum --algo {algo}"
+
+            out, _ = clients.exec_command(sudo=True, cmd=cmd, timeout=3600)
             log.info(f"Successfully created {num_of_files} files in {path}")
+            return json.loads(out)
         except Exception as e:
             log.error(f"An error occurred: {e}")
 
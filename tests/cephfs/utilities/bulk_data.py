@@ -0,0 +1,144 @@
+"""
+A tool to create and checksum files in bulk on a CephFS client.
+
+The tool is pushed to the client once and a single invocation handles any
+number of files, the manifest of the processed files is written to stdout
+as JSON, i.e. {"algo": "md5", "files": {"<relative path>": "<digest>"}}
+
+Usage:
+    python3 bulk_data.py create --path /mnt/cephfs/dir --count 100000
+    python3 bulk_data.py checksum --path /mnt/cephfs/dir --algo xxhash --recursive
+"""
+
+from __future__ import print_function
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+CHUNK_SIZE = 1024 * 1024
+DEFAULT_CONTENT = "Created files {index}\n"
+
+
+def hasher(algo):
+    """Return a new hash object of the given algorithm."""
+    if algo == "xxhash":
+        import xxhash
+
+        return xxhash.xxh64()
+
+    return hashlib.new(algo)
+
+
+def checksum_file(path, algo):
+    """Return the hex digest of the file."""
+    digest = hasher(algo)
+    with open(path, "rb") as fh:
+        for chunk in iter(lambda: fh.read(CHUNK_SIZE), b""):
+            digest.update(chunk)
+
+    return digest.hexdigest()
+
+
+def list_files(path, recursive=False):
+    """
+    Return the relative paths of the regular files in the directory.
+
+    Hidden files and directories are skipped like ls does, e.g. the .snap
+    directory or the temporary files of an editor.
+    """
+    if not recursive:
+        return sorted(
+            name
+            for name in os.listdir(path)
+            if not name.startswith(".") and os.path.isfile(os.path.join(path, name))
+        )
+
+    files = []
+    for root, dirs, names in os.walk(path):
+        dirs[:] = [name for name in dirs if not name.startswith(".")]
+        for name in names:
+            if not name.startswith("."):
+                files.append(os.path.relpath(os.path.join(root, name), path))
+
+    return sorted(files)
+
+
+def checksum(path, files, algo, workers):
+    """Return the manifest of the given files, checksummed concurrently."""
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        digests = executor.map(
+            lambda name: checksum_file(os.path.join(path, name), algo), files
+        )
+        return {"algo": algo, "files": dict(zip(files, digests))}
+
+
+def create(path, count, start, prefix, size, content, batch_size):
+    """Create the files and return their names."""
+    os.makedirs(path, exist_ok=True)
+    files = []
+    for index in range(start, start + count):
+        name = "{}{}.txt".format(prefix, index)
+        data = content.format(index=index).encode()
+        if size:
+            data = (data * (size // max(len(data), 1) + 1))[:size]
+
+        with open(os.path.join(path, name), "wb") as fh:
+            fh.write(data)
+        files.append(name)
+
+        if batch_size and len(files) % batch_size == 0:
+            print("Created {} files".format(len(files)), file=sys.stderr)
+
+    return files
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    subparsers = parser.add_subparsers(dest="action")
+
+    create_parser = subparsers.add_parser("create", help="create files")
+    create_parser.add_argument("--count", type=int, required=True)
+    create_parser.add_argument("--start", type=int, default=0)
+    create_parser.add_argument("--prefix", default="file_")
+    create_parser.add_argument("--size", type=int, default=0)
+    create_parser.add_argument("--content", default=DEFAULT_CONTENT)
+    create_parser.add_argument("--batch-size", type=int, default=0)
+    create_parser.add_argument("--checksum", action="store_true")
+
+    checksum_parser = subparsers.add_parser("checksum", help="checksum files")
+    checksum_parser.add_argument("--recursive", action="store_true")
+
+    for sub in (create_parser, checksum_parser):
+        sub.add_argument("--path", required=True)
+        sub.add_argument("--algo", default="md5", choices=["md5", "sha1", "xxhash"])
+        sub.add_argument("--workers", type=int, default=(os.cpu_count() or 1) * 2)
+
+    args = parser.parse_args()
+    if args.action == "create":
+        files = create(
+            args.path,
+            args.count,
+            args.start,
+            args.prefix,
+            args.size,
+            args.content,
+            args.batch_size,
+        )
+        manifest = {"algo": args.algo, "files": dict.fromkeys(files)}
+        if args.checksum:
+            manifest = checksum(args.path, files, args.algo, args.workers)
+    elif args.action == "checksum":
+        files = list_files(args.path, args.recursive)
+        manifest = checksum(args.path, files, args.algo, args.workers)
+    else:
+        parser.error("action is required")
+
+    json.dump(manifest, sys.stdout, separators=(",", ":"))
+
+
+if __name__ == "__main__":
+    main()
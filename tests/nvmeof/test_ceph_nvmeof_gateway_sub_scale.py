@@ -139,25 +139,33 @@ def configure_namespaces(
         name = generate_unique_id(length=4)
         LOG.info(sub_num)
         LOG.info(subsystems)
+        subnqn = f"nqn.2016-06.io.spdk:cnode{sub_num}{f'.{group}' if group is not None else ''}"
 
+        items = []
         for num in range(1, namespaces_sub + 1):
             rbd_obj.create_image(pool, f"{name}-image{num}", image_size)
+            items.append(
+                {
+                    "base_cmd_args": {"format": "json"},
+                    "args": {
+                        "rbd-image": f"{name}-image{num}",
+                        "rbd-pool": pool,
+                        "subsystem": subnqn,
+                    },
+                }
+            )
+
+        # The namespaces of the subsystem are added using one request stream
+        namespace_func = fetch_method(_cls, f"{command}_bulk")
+        results = namespace_func(items)
+        failed = [result for result in results if result["rc"] != 0]
+        if failed:
+            raise Exception(f"Failed to {command} namespaces of {subnqn}: {failed}")
+
+        for num, result in enumerate(results, start=1):
             LOG.info(num)
             LOG.info(namespaces)
-            config["args"].clear()
-            subnqn = f"nqn.2016-06.io.spdk:cnode{sub_num}{f'.{group}' if group is not None else ''}"
-            config = {
-                "base_cmd_args": {"format": "json"},
-                "args": {
-                    "rbd-image": f"{name}-image{num}",
-                    "rbd-pool": pool,
-                    "subsystem": subnqn,
-                },
-            }
-
-            namespace_func = fetch_method(_cls, command)
-            _, namespaces = namespace_func(**config)
-            nsid = json.loads(namespaces)["nsid"]
+            nsid = json.loads(result["stderr"])["nsid"]
 
             _config = {
                 "base_cmd_args": {"format": "json"},
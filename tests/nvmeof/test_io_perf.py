@@ -22,6 +22,7 @@ from tests.nvmeof.test_ceph_nvmeof_gateway import (
 from tests.nvmeof.workflows.nvme_utils import deploy_nvme_service
 from tests.rbd.rbd_utils import initial_rbd_config
 from utility.io.fio_profiles import IO_Profiles
+from utility.io.fio_results import FioResults
 from utility.log import Log
 from utility.utils import create_run_dir, generate_unique_id, run_fio
 
@@ -36,7 +37,7 @@ METRICS = [
 ]
 
 results = {}
-csv_op = []
+fio_results = FioResults()
 
 RBD_MAP = "rbd map {pool}/{image}"
 RBD_UNMAP = "rbd unmap {device}"
@@ -46,13 +47,7 @@ cli_image = str()
 
 def initialize():
     """Initialize the reports."""
-    _results = {}
-    _csv_op = [
-        "name,protocol,io_type,image,iteration,read_iops,read_bandwidth,read_slat_avg_ns,read_clat_avg_ns,"
-        "read_lat_avg_ns,write_iops,write_bandwidth,write_slat_avg_ns,write_clat_avg_ns,"
-        "write_lat_avg_ns"
-    ]
-    return _results, _csv_op
+    return {}, FioResults()
 
 
 def calculate_average(data):
@@ -264,82 +259,40 @@ def parse_fio_output(node, op_file):
     Returns:
         parsed_op
     """
-    _csv_op = []
-    _file = node.remote_file(file_name=op_file, file_mode="r")
-    data = json.loads(_file.read())
-    _file.close()
-
-    job = data["jobs"][0]
-    # FIO_WRITE_BS_4k_IODepth8_LIBAIO-TIEA-0-_dev_rbd17-librbd
-    name, _, iteration, protocol, image = job["jobname"].split("-")
-    io_type = job["job options"]["rw"]
-    io_information = data["global options"] | job["job options"]
-    _csv_op += [name, protocol, io_type, image, iteration]
-
-    if io_type not in results:
-        results[io_type] = {}
-
-    if protocol not in results[io_type]:
-        results[io_type][protocol] = {
-            "name": name,
-            "protocol": protocol,
-            "io_type": io_type,
-            "io_information": io_information,
-        }
+    records = fio_results.load(node, op_file)
+    for record in records:
+        # FIO_WRITE_BS_4k_IODepth8_LIBAIO-TIEA-0-_dev_rbd17-librbd
+        name, _, iteration, protocol, image = record["jobname"].split("-")
+        record.update(
+            {"name": name, "protocol": protocol, "image": image, "iteration": iteration}
+        )
+        io_type = record["rw"]
 
-    results[io_type][protocol]["num_of_iterations"] = iteration
-    if job["job options"]["rw"] in ["read", "randread", "rw", "readwrite"]:
-        read = job["read"]
-        if "read" not in results[io_type][protocol]:
-            results[io_type][protocol]["read"] = []
+        if io_type not in results:
+            results[io_type] = {}
 
-        results[io_type][protocol]["read"].append(
-            {
-                "iteration": iteration,
-                "image": image,
-                "iops": read["iops"],
-                "bandwidth": read["bw_mean"],
-                "submission_latency_in_nanoseconds": read["slat_ns"]["mean"],
-                "completion_latency_in_nanoseconds": read["clat_ns"]["mean"],
-                "overall_latency_in_nanoseconds": read["lat_ns"]["mean"],
+        if protocol not in results[io_type]:
+            results[io_type][protocol] = {
+                "name": name,
+                "protocol": protocol,
+                "io_type": io_type,
+                "io_information": record["options"],
             }
-        )
 
-        _csv_op += [
-            read["iops"],
-            read["bw_mean"],
-            read["slat_ns"]["mean"],
-            read["clat_ns"]["mean"],
-            read["lat_ns"]["mean"],
-        ]
-    else:
-        _csv_op += ["", "", "", "", ""]
-
-    if job["job options"]["rw"] in ["write", "randwrite", "rw", "readwrite"]:
-        write = job["write"]
-        if "write" not in results[io_type][protocol]:
-            results[io_type][protocol]["write"] = []
-
-        results[io_type][protocol]["write"].append(
+        results[io_type][protocol]["num_of_iterations"] = iteration
+        results[io_type][protocol].setdefault(record["direction"], []).append(
             {
                 "iteration": iteration,
-                "iops": write["iops"],
                 "image": image,
-                "bandwidth": write["bw_mean"],
-                "submission_latency_in_nanoseconds": write["slat_ns"]["mean"],
-                "completion_latency_in_nanoseconds": write["clat_ns"]["mean"],
-                "overall_latency_in_nanoseconds": write["lat_ns"]["mean"],
+                "iops": record["iops"],
+                "bandwidth": record["bw_mean_kib"],
+                "submission_latency_in_nanoseconds": record["slat_mean_ns"],
+                "completion_latency_in_nanoseconds": record["clat_mean_ns"],
+                "overall_latency_in_nanoseconds": record["lat_mean_ns"],
             }
         )
-        _csv_op += [
-            write["iops"],
-            write["bw_mean"],
-            write["slat_ns"]["mean"],
-            write["clat_ns"]["mean"],
-            write["lat_ns"]["mean"],
-        ]
 
-    csv_op.append(",".join([op if isinstance(op, str) else str(op) for op in _csv_op]))
+    return records
 
 
 def librbd(ceph_cluster, **args):
@@ -585,8 +538,8 @@ def run(ceph_cluster: Ceph, **kwargs) -> int:
                       gw_node: node6
                       initiator_node: node7
     """
-    global results, csv_op, cli_image
-    results, csv_op = initialize()
+    global results, fio_results, cli_image
+    results, fio_results = initialize()
 
     config = kwargs["config"]
     LOG.info(f"Test IO Performance : {config}")
@@ -630,11 +583,13 @@ def run(ceph_cluster: Ceph, **kwargs) -> int:
             "artifacts"
         ] = f"Artifacts - {run_cfg['log_link'].rsplit('.', 1)[0]}"
 
-        csv_file = f"{test_dir}/run.csv"
+        fio_results.write(f"{test_dir}/run.csv")
+        fio_results.write_summary(
+            f"{test_dir}/run_summary.csv",
+            group_by=("name", "protocol", "rw", "direction"),
+        )
         json_file = f"{test_dir}/run.json"
-        with open(csv_file, "w+") as _csv, open(json_file, "w+") as _json:
-            _csv.write("\n".join(csv_op))
-            LOG.info(f"CSV file located here: {csv_file}")
+        with open(json_file, "w+") as _json:
             _json.write(json.dumps(results, indent=2))
             LOG.info(f"Json file located here: {json_file}")
 
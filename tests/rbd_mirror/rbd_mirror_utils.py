@@ -9,6 +9,7 @@ from typing import List
 
 from ceph.ceph import CommandFailed
 from ceph.parallel import parallel
+from ceph.rbd.workflows.image_compare import compare_image_data
 from ceph.utils import get_node_by_id
 from tests.rbd.exceptions import IOonSecondaryError
 from utility.log import Log
@@ -669,24 +670,22 @@ class RbdMirror:
         peercluster.wait_for_status(imagespec=imagespec, state_pattern="up+replaying")
         if self.get_mirror_mode(imagespec) != "snapshot":
             peercluster.wait_for_replay_complete(imagespec)
-        export_path = "/home/cephuser/image.export_" + self.random_string()
-        self.export_image(imagespec=imagespec, path=export_path)
-        peercluster.export_image(imagespec=imagespec, path=export_path)
-        local_md5 = self.exec_cmd(
-            ceph_args=False, output=True, cmd="md5sum {}".format(export_path)
-        )
-        rmt_md5 = peercluster.exec_cmd(
-            ceph_args=False, output=True, cmd="md5sum {}".format(export_path)
-        )
-        log.info(local_md5)
-        log.info(rmt_md5)
-        if local_md5 == rmt_md5:
-            log.info("Data is consistent")
-            self.exec_cmd(ceph_args=False, cmd="rm -f {}".format(export_path))
-            peercluster.exec_cmd(ceph_args=False, cmd="rm -f {}".format(export_path))
-            return 0
-        else:
+        data_check = {
+            "first": {
+                "image_spec": imagespec,
+                "client": self.ceph_client,
+                "cluster": self.cluster_name,
+            },
+            "second": {
+                "image_spec": imagespec,
+                "client": peercluster.ceph_client,
+                "cluster": peercluster.cluster_name,
+            },
+        }
+        if compare_image_data(**data_check):
             raise Exception("Data Inconsistency found")
+        log.info("Data is consistent")
+        return 0
 
     # CLIs
     def benchwrite(self, **kw):
@@ -0,0 +1,86 @@
+"""Test the cephadm install served from the installer node mirror."""
+
+from ceph.ceph_admin import MIRROR_DIR, MIRROR_PORT, CephAdmin
+
+
+class FakeNode:
+    def __init__(self, shortname, outputs=None):
+        self.shortname = shortname
+        self.ip_address = f"203.0.113.{len(shortname)}"
+        self.internal_ip = "10.0.0.1"
+        self.outputs = outputs or {}
+        self.cmds = []
+
+    def exec_command(self, cmd, **kw):
+        self.cmds.append(cmd)
+        for key, out in self.outputs.items():
+            if key in cmd:
+                return out, ""
+        return "", ""
+
+
+class FakeInstaller(FakeNode):
+    def __init__(self):
+        super(FakeInstaller, self).__init__(
+            "installer",
+            {
+                f"ls {MIRROR_DIR}": "cephadm-18.2.1.noarch.rpm\npython3-foo.rpm\n",
+                "echo $!": "4242\n",
+            },
+        )
+        self.node = self
+
+
+class FakeCluster:
+    def __init__(self, installer, nodes):
+        self.installer = installer
+        self.nodes = nodes
+
+    def get_ceph_object(self, role):
+        return self.installer
+
+    def get_nodes(self, ignore=None):
+        return self.nodes
+
+
+def test_install_from_mirror():
+    installer = FakeInstaller()
+    nodes = [FakeNode("node1"), FakeNode("node2")]
+    cephadm = CephAdmin(FakeCluster(installer, nodes), package_mirror=True)
+    cephadm.install()
+
+    url = f"http://10.0.0.1:{MIRROR_PORT}"
+    for node in nodes:
+        assert node.cmds[0] == (
+            f"yum install -y --nogpgcheck {url}/cephadm-18.2.1.noarch.rpm "
+            f"{url}/python3-foo.rpm"
+        )
+
+    assert "dnf download --resolve" in installer.cmds[0]
+    assert "kill 4242" in installer.cmds
+    assert not any("pkill" in cmd for cmd in installer.cmds)
+    assert cephadm.mirror_pid is None
+
+
+def test_mirror_falls_back_to_the_ip_address():
+    installer = FakeInstaller()
+    installer.internal_ip = ""
+    cephadm = CephAdmin(FakeCluster(installer, []))
+
+    urls = cephadm.start_package_mirror(["cephadm"])
+    assert urls[0].startswith(f"http://{installer.ip_address}:{MIRROR_PORT}/")
+    assert cephadm.mirror_pid == "4242"
+
+
+def test_install_without_mirror():
+    installer = FakeInstaller()
+    nodes = [FakeNode("node1")]
+    CephAdmin(FakeCluster(installer, nodes)).install(upgrade=True)
+
+    assert nodes[0].cmds == [
+        "yum install cephadm -y --nogpgcheck",
+        "yum update metadata",
+        "yum update -y cephadm",
+        "rpm -qa | grep cephadm",
+    ]
+    assert installer.cmds == []
@@ -0,0 +1,84 @@
+"""Test the cephadm shell session."""
+
+import pytest
+
+from ceph.ceph_admin import shell
+from ceph.ceph_admin.shell import PODMAN_EXEC_ERROR, ShellSession
+
+
+class FakeInstaller:
+    def __init__(self, exec_rcs=None, crash=True):
+        self.cmds = []
+        self.containers = []
+        self.running = False
+        self.exec_rcs = list(exec_rcs or [])
+        self.crash = crash
+
+    def exec_command(self, cmd, **kw):
+        self.cmds.append(cmd)
+        if cmd.startswith("nohup"):
+            self.containers.append(f"c{len(self.containers)}")
+            self.running = True
+        elif cmd.startswith("podman ps"):
+            return f"{self.containers[-1]}\n", ""
+        elif cmd.startswith("podman inspect"):
+            return "true\n" if self.running else "false\n", ""
+        elif cmd.startswith("podman rm"):
+            self.running = False
+        elif cmd.startswith("podman exec"):
+            rc = self.exec_rcs.pop(0) if self.exec_rcs else 0
+            if rc == PODMAN_EXEC_ERROR and self.crash:
+                self.running = False
+            return "out", "err", rc, 0.1
+        return "", ""
+
+
+@pytest.fixture(autouse=True)
+def sessions():
+    yield shell.SHELL_SESSIONS
+    shell.SHELL_SESSIONS.clear()
+
+
+def test_start_and_exec():
+    installer = FakeInstaller()
+    session = ShellSession(installer, shell_args="--name osd.1")
+
+    assert session.exec_command("ceph -s") == ("out", "err", 0, 0.1)
+    assert session.container == "c0"
+    assert "cephadm shell --name osd.1 -e CEPHCI_SHELL=" in installer.cmds[0]
+    assert installer.cmds[-1] == "podman exec c0 ceph -s"
+
+    session.exec_command("ceph health")
+    assert len(installer.containers) == 1
+
+
+def test_respawn_on_missing_container():
+    installer = FakeInstaller(exec_rcs=[PODMAN_EXEC_ERROR])
+    session = ShellSession(installer)
+
+    assert session.exec_command("ceph -s")[2] == 0
+    assert session.container == "c1"
+    assert installer.cmds[-1] == "podman exec c1 ceph -s"
+
+
+def test_failed_command_is_not_retried():
+    installer = FakeInstaller(exec_rcs=[PODMAN_EXEC_ERROR], crash=False)
+    session = ShellSession(installer)
+
+    assert session.exec_command("ceph orch ls --bad")[2] == PODMAN_EXEC_ERROR
+    assert len(installer.containers) == 1
+    assert sum(cmd.startswith("podman exec") for cmd in installer.cmds) == 1
+
+
+def test_stop_sessions(sessions):
+    installers = [FakeInstaller(), FakeInstaller()]
+    for index, installer in enumerate(installers):
+        sessions[index] = ShellSession(installer)
+        sessions[index].start()
+
+    shell.stop_shell_sessions()
+
+    assert not sessions
+    for installer in installers:
+        assert installer.cmds[-1] == "podman rm -f c0"
+        assert not installer.running
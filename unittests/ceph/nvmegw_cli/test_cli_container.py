@@ -0,0 +1,101 @@
+"""Test the NVMe CLI commands executed in the long running container."""
+
+import ast
+import io
+import json
+import subprocess
+import sys
+
+import pytest
+
+from ceph.nvmegw_cli import cli_container
+from ceph.nvmegw_cli.cli_container import BATCH_SCRIPT
+from ceph.nvmegw_cli.namespace import Namespace
+
+
+class FakeNode:
+    ip_address = "10.0.0.1"
+    hostname = "gw-node"
+
+    def __init__(self):
+        self.cmds = []
+        self.files = {}
+
+    def remote_file(self, file_name, **kw):
+        node = self
+
+        class _File(io.StringIO):
+            def close(self):
+                node.files[file_name] = self.getvalue()
+                super().close()
+
+        return _File()
+
+    def exec_command(self, cmd, **kw):
+        self.cmds.append(cmd)
+        if "image inspect" in cmd:
+            return '["python3","-m","control.cli"]\n', ""
+        if "python3 - <" in cmd:
+            count = len(_commands(self.files))
+            return json.dumps([{"rc": 0, "stdout": "", "stderr": "{}"}] * count), ""
+        return "", '{"status": 0}'
+
+
+def _commands(files):
+    script = list(files.values())[-1]
+    line = next(line for line in script.splitlines() if line.startswith("COMMANDS"))
+    return json.loads(ast.literal_eval(line.split("json.loads(", 1)[1][:-1]))
+
+
+@pytest.fixture(autouse=True)
+def clear_containers():
+    yield
+    cli_container.CONTAINERS.clear()
+
+
+def test_batch_script_runs_every_command():
+    script = BATCH_SCRIPT.format(
+        commands=json.dumps([["namespace", "list"], ["subsystem", "add"]]),
+        entrypoint=json.dumps(["echo"]),
+    )
+    proc = subprocess.run(
+        [sys.executable, "-"], input=script, capture_output=True, text=True
+    )
+    results = json.loads(proc.stdout)
+
+    assert [result["rc"] for result in results] == [0, 0]
+    assert results[1]["stdout"] == "subsystem add\n"
+
+
+def test_commands_share_one_container():
+    node = FakeNode()
+    namespace = Namespace(node, 5500)
+
+    namespace.list(args={"subsystem": "nqn1"})
+    namespace.list(args={"subsystem": "nqn2"})
+
+    runs = [cmd for cmd in node.cmds if cmd.startswith("podman run")]
+    execs = [cmd for cmd in node.cmds if cmd.startswith("podman exec")]
+    assert len(runs) == 1 and "--entrypoint sleep" in runs[0]
+    assert len(execs) == 2
+    assert "python3 -m control.cli" in execs[0]
+    assert "--server-address 10.0.0.1 --server-port 5500 namespace list" in execs[0]
+    assert "--subsystem nqn2" in execs[1]
+
+
+def test_add_bulk():
+    node = FakeNode()
+    namespace = Namespace(node, 5500)
+    items = [
+        {"args": {"subsystem": "nqn1", "rbd-pool": "rbd", "rbd-image": f"image{num}"}}
+        for num in range(3)
+    ]
+
+    results = namespace.add_bulk(items)
+
+    assert len([cmd for cmd in node.cmds if "python3 - <" in cmd]) == 1
+    assert [result["args"]["rbd-image"] for result in results] == [
+        "image0",
+        "image1",
+        "image2",
+    ]
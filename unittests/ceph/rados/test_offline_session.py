@@ -0,0 +1,106 @@
+"""Test the batched execution of the offline OSD tools."""
+
+import io
+
+import pytest
+
+from ceph.ceph import CommandFailed
+from ceph.rados.objectstoretool_workflows import objectstoreToolWorkflows
+from ceph.rados.offline_session import MARKER, OfflineOsdSession
+
+
+class FakeFile(io.StringIO):
+    def __init__(self, node, name):
+        super().__init__()
+        self.node, self.name = node, name
+
+    def close(self):
+        self.node.files[self.name] = self.getvalue()
+        super().close()
+
+
+class FakeNode:
+    """Runs the batch scripts by answering every podman exec using rcs."""
+
+    def __init__(self, rcs=None):
+        self.rcs = rcs or {}
+        self.cmds = []
+        self.files = {}
+
+    def remote_file(self, file_name, **kw):
+        return FakeFile(self, file_name)
+
+    def exec_command(self, cmd, **kw):
+        self.cmds.append(cmd)
+        if "podman ps" in cmd:
+            return "cid\n", ""
+
+        if not cmd.startswith("bash "):
+            return "", ""
+
+        out = []
+        script = self.files[cmd.split()[1]].splitlines()
+        for index, line in enumerate(x for x in script if x.startswith("podman")):
+            tool_cmd = line.split("cid ", 1)[1].split(" 2>")[0]
+            rc = self.rcs.get(tool_cmd, 0)
+            out += [f"{MARKER} op {index}>>>", f"ran {tool_cmd}"]
+            out += [f"{MARKER} rc {index} {rc}>>>", f"{MARKER} end {index}>>>"]
+        return "\n".join(out) + "\n", ""
+
+
+class FakeRados:
+    def __init__(self, node):
+        self.node = node
+        self.states = []
+
+    def fetch_host_node(self, **kw):
+        return self.node
+
+    def change_osd_state(self, action, target):
+        self.states.append((action, target))
+
+
+def test_session_batches_commands():
+    node = FakeNode(rcs={"tool b": 1})
+    rados = FakeRados(node)
+    registry = {}
+
+    with OfflineOsdSession(rados, 3, lambda cmd: f"tool {cmd}", registry=registry) as s:
+        assert registry == {3: s}
+        s.add("a")
+        s.add("b", env={"env": "X=1"})
+        results = s.execute()
+        assert s.run("c") == "ran tool c\n"
+        with pytest.raises(CommandFailed):
+            s.run("b")
+
+    assert [(r["cmd"], r["rc"], r["out"]) for r in results] == [
+        ("a", 0, "ran tool a\n"),
+        ("b", 1, "ran tool b\n"),
+    ]
+    assert (
+        "podman exec -i --env X=1 cid tool b"
+        in node.files[[name for name in node.files if name.endswith(".sh")][0]]
+    )
+    # The OSD is bounced once and the container removed at the end
+    assert rados.states == [("stop", 3), ("start", 3)]
+    assert "podman rm -f cid" in node.cmds
+    assert registry == {}
+
+
+def test_cot_command_checks_the_session_mount():
+    node = FakeNode()
+    rados = FakeRados(node)
+    cot = objectstoreToolWorkflows.__new__(objectstoreToolWorkflows)
+    cot.rados_obj, cot.sessions = rados, {}
+
+    with cot.offline_session(osd_id=3):
+        assert cot.help(osd_id=3).startswith("ran ceph-objectstore-tool")
+        with pytest.raises(ValueError, match="without mount"):
+            cot.run_cot_command(cmd="--op export", osd_id=3, mount=True, start=False)
+
+    with cot.offline_session(osd_id=3, mount=True):
+        cot.run_cot_command(cmd="--op export", osd_id=3, mount=True, start=False)
+        cot.help(osd_id=3)
+
+    assert rados.states == [("stop", 3), ("start", 3)] * 2
@@ -0,0 +1,91 @@
+"""Test the columnar PG and OSD dump tables."""
+
+import json
+
+import numpy as np
+
+from ceph.rados.pg_table import OsdTable, PgTable, iter_array
+
+
+def _pg(pgid, state, acting, scrub="2026-10-18T10:00:00.123456+0000"):
+    return {
+        "pgid": pgid,
+        "state": state,
+        "up": acting,
+        "acting": acting,
+        "up_primary": acting[0],
+        "acting_primary": acting[0],
+        "last_scrub_stamp": scrub,
+        "last_deep_scrub_stamp": scrub,
+        "stat_sum": {"num_objects": 2, "num_bytes": 8192},
+    }
+
+
+PG_DUMP = json.dumps(
+    {
+        "pg_ready": True,
+        "pg_stats": [
+            _pg("1.0", "active+clean", [0, 1, 2]),
+            _pg("1.1", "active+clean+scrubbing+deep", [1, 2, 0]),
+            _pg("2.0", "active+undersized+degraded", [2, 0]),
+            _pg("2.1", "active+clean+laggy_new", [0, 2, 1], "0.000000"),
+        ],
+    },
+    indent=4,
+)
+
+
+def test_iter_array():
+    assert [pg["pgid"] for pg in iter_array(PG_DUMP, "pg_stats")] == [
+        "1.0",
+        "1.1",
+        "2.0",
+        "2.1",
+    ]
+    assert list(iter_array('{"osds": []}', "osds")) == []
+    assert list(iter_array("{}", "osds")) == []
+
+
+def test_pg_table_queries():
+    table = PgTable(PG_DUMP)
+
+    assert len(table) == 4
+    assert table.pgids(table.in_state("degraded")) == ["2.0"]
+    assert table.pgids(~table.in_state("active", "clean", match="all")) == ["2.0"]
+    assert table.pgids(table.in_state("active", "clean", match="exact")) == ["1.0"]
+    assert table.pgids(table.in_state("laggy_new")) == ["2.1"]
+    assert table.pgids(table.in_state("not_a_state")) == []
+    assert table.states(table.pgid == "1.1") == ["active+clean+scrubbing+deep"]
+    assert table.states(table.in_pool(2)) == [
+        "active+undersized+degraded",
+        "active+clean+laggy_new",
+    ]
+    assert len(table.state_names) == 4
+    assert table.pgids(table.in_pool(2)) == ["2.0", "2.1"]
+    assert table.pgids(table.on_osd(1)) == ["1.0", "1.1", "2.1"]
+    assert table.pgids(table.on_osd(1, primary=True)) == ["1.1"]
+    assert table.pgs_per_osd() == {0: 4, 1: 3, 2: 4}
+    assert table.acting[2].tolist() == [2, 0, -1]
+    assert int(table.num_bytes.sum()) == 4 * 8192
+
+    now = np.datetime64("2026-10-18T11:00:00")
+    assert table.pgids(table.scrub_older_than(7200, now=now)) == ["2.1"]
+    assert len(table.pgids(table.scrub_older_than(60, deep=True, now=now))) == 4
+
+
+def test_osd_table():
+    osd_dump = json.dumps(
+        {
+            "epoch": 10,
+            "osds": [
+                {"osd": 0, "up": 1, "in": 1, "weight": 1.0},
+                {"osd": 1, "up": 0, "in": 1, "weight": 1.0},
+                {"osd": 2, "up": 0, "in": 0, "weight": 0.0},
+            ],
+        }
+    )
+    table = OsdTable(osd_dump)
+
+    assert len(table) == 3
+    assert table.osds(table.down()) == [1, 2]
+    assert table.osds(table.out()) == [2]
@@ -0,0 +1,92 @@
+"""Test the offline PG placement analysis."""
+
+import json
+
+from ceph.rados.placement_simulator import (
+    PgMappings,
+    PlacementSimulator,
+    distribution_stats,
+    parse_upmap_items,
+    parse_upmap_primaries,
+)
+
+PGS_DUMP = """\
+1.0 raw ([0,1,2], p0) up ([0,1,2], p0) acting ([0,1,2], p0)
+1.1 raw ([0,2,1], p0) up ([0,2,1], p0) acting ([0,2,1], p0)
+1.2 raw ([0,1,3], p0) up ([0,1,3], p0) acting ([0,1,3], p0)
+1.3 raw ([1,2,3], p1) up ([1,2,3], p1) acting ([1,2,3], p1)
+2.0 raw ([3,2147483647,1], p3) up ([3,2147483647,1], p3) acting ([3,2147483647,1], p3)
+"""
+
+OSDMAP = {
+    "epoch": 42,
+    "pools": [
+        {"pool": 1, "pool_name": "rbd", "erasure_code_profile": ""},
+        {"pool": 2, "pool_name": "ec", "erasure_code_profile": "default"},
+    ],
+    "osds": [{"osd": osd, "up": 1, "in": 1, "weight": 1.0} for osd in range(4)],
+}
+
+
+class FakeClient:
+    def __init__(self, outputs):
+        self.outputs = outputs
+        self.cmds = []
+
+    def exec_command(self, cmd, **kw):
+        self.cmds.append(cmd)
+        for key, out in self.outputs.items():
+            if key in cmd:
+                return out, ""
+        return "", ""
+
+
+def test_pg_mappings():
+    mappings = PgMappings.from_dump(PGS_DUMP)
+
+    assert len(mappings) == 5
+    assert mappings.acting[4].tolist() == [3, -1, 1]
+    assert mappings.pg_counts(4).tolist() == [3, 5, 3, 3]
+    assert mappings.primary_counts(4).tolist() == [3, 1, 0, 1]
+
+    pool = mappings.select(1)
+    assert pool.read_score(4) == 3.0
+
+    moved = pool.apply_upmap_items({"1.0": [(0, 3)], "1.3": [(2, 0)]})
+    assert moved.acting[0].tolist() == [3, 1, 2]
+    assert moved.acting_primary.tolist() == [3, 0, 0, 1]
+    assert pool.acting[0].tolist() == [0, 1, 2]
+
+    balanced = pool.apply_upmap_primaries({"1.1": 2, "1.2": 3, "1.3": 9})
+    assert balanced.acting_primary.tolist() == [0, 2, 3, 1]
+    assert balanced.read_score(4) == 1.0
+
+
+def test_parsers_and_stats():
+    assert parse_upmap_items("ceph osd pg-upmap-items 1.7 3 5 0 2\n") == {
+        "1.7": [(3, 5), (0, 2)]
+    }
+    assert parse_upmap_primaries("ceph osd pg-upmap-primary 1.a 2\n") == {"1.a": 2}
+
+    stats = distribution_stats([4, 2, 0], weights=[1.0, 1.0, 0.0])
+    assert stats["min"] == 2 and stats["max"] == 4
+    assert stats["max_deviation"] == 1.0
+
+
+def test_simulator():
+    client = FakeClient(
+        {
+            "--dump json": json.dumps(OSDMAP),
+            "--test-map-pgs-dump-all": PGS_DUMP,
+            "--show-mappings": "CRUSH rule 0 x 0 [0,1,2]\nCRUSH rule 0 x 1 [3,1]\n",
+            "--read ": "ceph osd pg-upmap-primary 1.1 2\nceph osd pg-upmap-primary 1.2 3\n",
+        }
+    )
+    simulator = PlacementSimulator(client)
+    simulator.fetch()
+
+    assert simulator.num_osds == 4
+    assert simulator.read_scores() == {"rbd": 3.0}
+    assert simulator.expected_read_score("rbd") == 1.0
+    assert simulator.crush_utilization(rule=0, num_rep=3, max_x=1)["bad_mappings"] == 1
+    assert any("ceph osd getmap" in cmd for cmd in client.cmds)
@@ -0,0 +1,74 @@
+import json
+
+from ceph.rados.snapshot_cache import SnapshotCache, is_read_only
+
+
+class FakeCluster:
+    def __init__(self):
+        self.epoch = 10
+        self.calls = []
+
+    def run(self, cmd):
+        self.calls.append(cmd)
+        if cmd.startswith("ceph osd stat"):
+            return json.dumps({"epoch": self.epoch})
+        return json.dumps({"cmd": cmd, "epoch": self.epoch})
+
+
+def test_is_read_only():
+    assert is_read_only("ceph osd dump -f json")
+    assert is_read_only("sudo ceph osd pool get rbd size")
+    assert is_read_only("ceph -s")
+    assert not is_read_only("ceph osd out 3")
+    assert not is_read_only("ceph config set osd osd_max_backfills 2")
+    assert not is_read_only("rados -p rbd put obj /tmp/file")
+    # names of pools or objects matching a read only verb
+    assert not is_read_only("ceph osd pool delete stats stats --yes-i-really-mean-it")
+    assert not is_read_only("ceph osd pool create ls 16")
+    assert not is_read_only("ceph osd pool set get size 2")
+
+
+def test_map_of():
+    assert SnapshotCache.map_of("ceph osd dump -f json") == "osdmap"
+    assert SnapshotCache.map_of("ceph osd df tree -f json") == "pgmap"
+    assert SnapshotCache.map_of("ceph osd dumpx") is None
+    assert SnapshotCache.map_of("ceph health detail") is None
+
+
+def test_hits_within_ttl():
+    cluster = FakeCluster()
+    cache = SnapshotCache(cluster.run, ttl=60)
+    for _ in range(5):
+        cache.get("ceph pg dump -f json", lambda: cluster.run("ceph pg dump"))
+
+    assert cluster.calls == ["ceph pg dump"]
+    assert cache.summary()["hits"] == 4
+
+
+def test_osdmap_queries_revalidated_by_epoch():
+    cluster = FakeCluster()
+    cache = SnapshotCache(cluster.run, ttl=0)
+    fetch = lambda: cluster.run("ceph osd dump")  # noqa: E731
+
+    cache.get("ceph osd dump -f json", fetch)
+    cache.get("ceph osd dump -f json", fetch)
+    assert cluster.calls.count("ceph osd dump") == 1
+
+    cluster.epoch += 1
+    assert json.loads(cache.get("ceph osd dump -f json", fetch))["epoch"] == 11
+    assert cluster.calls.count("ceph osd dump") == 2
+
+
+def test_mutating_command_invalidates():
+    cluster = FakeCluster()
+    cache = SnapshotCache(cluster.run, ttl=60)
+    fetch = lambda: cluster.run("ceph osd tree")  # noqa: E731
+
+    cache.get("ceph osd tree -f json", fetch)
+    cache.observe("ceph osd tree -f json")
+    cache.get("ceph osd tree -f json", fetch)
+    cache.observe("ceph osd out 1")
+    cache.get("ceph osd tree -f json", fetch)
+
+    assert cluster.calls.count("ceph osd tree") == 2
+    assert cache.summary()["invalidations"] == 1
@@ -0,0 +1,76 @@
+"""Test the extent aware comparison of the RBD images."""
+
+import hashlib
+import io
+import json
+
+from ceph.rbd.workflows.image_compare import compare_image_data, find_first_mismatch
+
+ZERO = hashlib.md5(bytes(4)).hexdigest()
+
+
+def _hashes(size, hashes):
+    return {"size": size, "chunk_size": 4, "hashes": hashes}
+
+
+class FakeClient:
+    """Returns the given chunk hashes for the hash script."""
+
+    def __init__(self, result):
+        self.result = result
+        self.cmds = []
+
+    def remote_file(self, **kw):
+        return io.StringIO()
+
+    def exec_command(self, cmd, **kw):
+        self.cmds.append(cmd)
+        return json.dumps(self.result), ""
+
+
+def test_find_first_mismatch():
+    first = _hashes(16, {0: "a", 2: "b"})
+
+    assert find_first_mismatch(first, _hashes(16, {0: "a", 2: "b"})) is None
+    assert find_first_mismatch(first, _hashes(16, {0: "a", 2: "c"})) == 8
+    assert find_first_mismatch(first, _hashes(16, {2: "b"})) == 0
+    # zero filled chunk allocated on one side only
+    assert find_first_mismatch(_hashes(16, {1: ZERO}), _hashes(16, {})) is None
+    assert find_first_mismatch(first, _hashes(20, {0: "a", 2: "b"})) == 16
+
+
+def test_compare_image_data():
+    first = FakeClient(_hashes(16, {"0": "a", "3": "b"}))
+    second = FakeClient(_hashes(16, {"0": "a", "3": "b"}))
+    spec = {"image_spec": "pool/image"}
+
+    assert (
+        compare_image_data(
+            first=dict(spec, client=first), second=dict(spec, client=second)
+        )
+        == 0
+    )
+    assert "pool/image ceph" in first.cmds[0]
+
+    second.result = _hashes(16, {"0": "a"})
+    assert (
+        compare_image_data(
+            first=dict(spec, client=first), second=dict(spec, client=second)
+        )
+        == 1
+    )
+
+
+def test_same_client_uses_unique_scripts():
+    client = FakeClient(_hashes(16, {"0": "a"}))
+    spec = {"image_spec": "pool/image", "client": client}
+
+    assert (
+        compare_image_data(first=spec, second=dict(spec, image_spec="pool/clone")) == 0
+    )
+
+    scripts = [cmd.split()[1] for cmd in client.cmds if cmd.startswith("python3")]
+    assert len(set(scripts)) == 2
+    assert sorted(f"rm -f {path}" for path in scripts) == sorted(
+        cmd for cmd in client.cmds if cmd.startswith("rm")
+    )
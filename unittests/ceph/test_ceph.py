@@ -0,0 +1,224 @@
+import io
+import os
+from types import SimpleNamespace
+
+import pytest
+
+from ceph.ceph import (
+    CephNode,
+    ChannelStdout,
+    CommandFailed,
+    CommandStats,
+    StreamReader,
+    parse_node_facts,
+)
+
+
+class TestCommandStats:
+    def test_key_ignores_sudo(self):
+        stats = CommandStats()
+        assert stats.key("sudo ceph osd dump -f json") == "ceph osd dump"
+        assert stats.key("uptime") == "uptime"
+
+    def test_record_and_summary(self):
+        stats = CommandStats()
+        stats.record("ceph osd tree", 0.5)
+        stats.record("ceph osd tree -f json", 1.5)
+        stats.record("uptime", 0.1)
+
+        summary = stats.summary()
+        assert summary["ceph osd tree"] == {
+            "count": 2,
+            "total": 2.0,
+            "min": 0.5,
+            "max": 1.5,
+            "avg": 1.0,
+        }
+        assert summary["uptime"]["count"] == 1
+
+    def test_reset(self):
+        stats = CommandStats()
+        stats.record("uptime", 0.1)
+        stats.reset()
+        assert stats.summary() == {}
+
+
+class FakeChannel:
+    def __init__(self, chunks):
+        self.chunks = list(chunks)
+        self.windows = []
+
+    def recv_ready(self):
+        return bool(self.chunks)
+
+    def recv(self, size):
+        self.windows.append(size)
+        return self.chunks.pop(0) if self.chunks else b""
+
+    recv_stderr_ready = recv_ready
+    recv_stderr = recv
+
+
+class TestStreamReader:
+    def test_multibyte_split_across_reads(self):
+        data = "ceph ✓ healthy\n".encode("utf-8")
+        channel = FakeChannel([data[:6], data[6:]])
+        reader = StreamReader(channel, log=False)
+        reader.read(None, None, until_eof=True)
+        reader.close()
+        assert reader.output == "ceph ✓ healthy\n"
+
+    def test_read_only_available_data(self):
+        channel = FakeChannel([b"a", b"b"])
+        reader = StreamReader(channel, log=False)
+        reader.read(None, None)
+        assert reader.output == "ab"
+        assert channel.windows == [StreamReader.min_window] * 2
+
+    def test_window_grows_when_filled(self):
+        size = StreamReader.min_window
+        channel = FakeChannel([b"x" * size, b"x" * size * 2, b"x"])
+        reader = StreamReader(channel, log=False)
+        reader.read(None, None, until_eof=True)
+        assert channel.windows[:3] == [size, size * 2, size * 4]
+
+    def test_callback_receives_lines(self):
+        lines = []
+        channel = FakeChannel([b"one\ntw", b"o\r\nthree"])
+        reader = StreamReader(channel, log=False, callback=lines.append)
+        reader.read(None, None, until_eof=True)
+        reader.close()
+        assert lines == ["one", "two", "three"]
+        assert reader.output == ""
+
+    def test_spool(self):
+        spool = io.StringIO()
+        channel = FakeChannel([b"line-1\n", b"line-2\n"])
+        reader = StreamReader(channel, log=False, spool=spool)
+        reader.read(None, None, until_eof=True)
+        reader.close()
+        assert spool.getvalue() == "line-1\nline-2\n"
+        assert reader.output == ""
+
+    def test_callback_stops_reading(self):
+        channel = FakeChannel([b"starting\nHEALTH_OK\nmore\n", b"never read\n"])
+        reader = StreamReader(
+            channel, log=False, callback=lambda line: line == "HEALTH_OK"
+        )
+        reader.read(None, None, until_eof=True)
+        assert reader.stopped
+        assert channel.chunks == [b"never read\n"]
+
+
+class StalledChannel:
+    """Channel delivering stdout only once the pending stderr is read."""
+
+    def __init__(self, stdout, stderr):
+        self.stdout = list(stdout)
+        self.stderr = list(stderr)
+        self.eof_received = False
+        self._read_fd, write_fd = os.pipe()
+        os.write(write_fd, b"x")
+        os.close(write_fd)
+
+    def fileno(self):
+        return self._read_fd
+
+    def recv_ready(self):
+        return bool(self.stdout) and not self.stderr
+
+    def recv(self, size):
+        assert not self.stderr, "stdout read while stderr is pending"
+        data = self.stdout.pop(0) if self.stdout else b""
+        self.eof_received = not self.stdout
+        return data
+
+    def recv_stderr_ready(self):
+        return bool(self.stderr)
+
+    def recv_stderr(self, size):
+        return self.stderr.pop(0) if self.stderr else b""
+
+
+def test_channel_stdout_drains_stderr():
+    channel = StalledChannel([b"\x1f\x8b", b"\x00data"], [b"tar: warning\n"] * 3)
+    stdout = ChannelStdout(channel, None, None)
+
+    with io.BufferedReader(stdout) as reader:
+        assert reader.read(2) == b"\x1f\x8b"
+
+    stdout.drain()
+    assert channel.stdout == []
+    assert stdout.read_stderr() == "tar: warning\n" * 3
+    os.close(channel.fileno())
+
+
+def test_parse_node_facts():
+    output = """\
+ 10:00:01 up 2 days,  3:04,  1 user,  load average: 0.00, 0.01, 0.05
+Sun Oct 18 10:00:01 UTC 2026
+Last login: Sun Oct 18 09:59:58 2026 from 10.0.0.10
+LANG=en_US.UTF-8
+CEPHCI_FACT hostname=ceph-node1.example.com
+CEPHCI_FACT internal_ip=10.0.0.11
+CEPHCI_FACT pkg_type=rpm
+"""
+    assert parse_node_facts(output) == {
+        "hostname": "ceph-node1.example.com",
+        "internal_ip": "10.0.0.11",
+        "pkg_type": "rpm",
+    }
+    assert parse_node_facts("CEPHCI_FACT internal_ip=\nhostname=x\n") == {
+        "internal_ip": ""
+    }
+
+
+class FakeStdin:
+    def __init__(self):
+        self.data = ""
+        self.channel = SimpleNamespace(shutdown_write=lambda: None)
+
+    def write(self, data):
+        self.data += data
+
+
+def fake_node(facts):
+    """Return a CephNode which records the commands instead of running them."""
+    node = CephNode.__new__(CephNode)
+    node.vmname = "node1"
+    node.ip_address = "10.0.0.1"
+    node.username = "cephuser"
+    node.password = "secret"
+    node.root_passwd = "rootsecret"
+    node.vm_node = SimpleNamespace(node_type="openstack")
+    node.stdin = FakeStdin()
+    node.logged = []
+
+    def rssh():
+        return SimpleNamespace(
+            exec_command=lambda cmd: (node.stdin, io.StringIO(""), io.StringIO(""))
+        )
+
+    def exec_command(cmd, **kw):
+        node.logged.append(cmd)
+        return (facts if "CEPHCI_FACT" in cmd else ""), ""
+
+    node.rssh = rssh
+    node.exec_command = exec_command
+    return node
+
+
+def test_connect_keeps_passwords_off_the_logged_commands():
+    node = fake_node("CEPHCI_FACT hostname=node1.example.com\n")
+    node.connect()
+
+    assert node.stdin.data == "cephuser:secret\nroot:rootsecret\n"
+    assert not any("secret" in cmd for cmd in node.logged)
+    assert node.shortname == "node1"
+    assert node.pkg_type == "deb"
+
+
+def test_connect_fails_without_facts():
+    node = fake_node("Last login: Sun Oct 18\n")
+    with pytest.raises(CommandFailed, match="Last login"):
+        node.connect()
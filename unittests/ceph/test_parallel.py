@@ -0,0 +1,90 @@
+import os
+import time
+
+import gevent
+import pytest
+
+from ceph.parallel import TaskTimeout, parallel
+
+
+def square(value):
+    gevent.sleep(0.01)
+    return value * value
+
+
+def fail(value):
+    raise ValueError(f"failed {value}")
+
+
+class TestParallel:
+    def test_results(self):
+        with parallel() as p:
+            for i in range(5):
+                p.spawn(square, i)
+            results = sorted(p)
+
+        assert results == [0, 1, 4, 9, 16]
+        assert len(p.stats) == 5
+
+    def test_raises_on_failure(self):
+        with pytest.raises(ValueError):
+            with parallel() as p:
+                p.spawn(square, 1)
+                p.spawn(fail, 2)
+
+    def test_max_workers(self):
+        running = []
+        peak = []
+
+        def task():
+            running.append(1)
+            peak.append(len(running))
+            gevent.sleep(0.01)
+            running.pop()
+
+        with parallel(max_workers=2) as p:
+            for _ in range(6):
+                p.spawn(task)
+
+        assert max(peak) == 2
+
+    def test_collect_errors(self):
+        with parallel(collect_errors=True) as p:
+            p.spawn(fail, 1)
+            p.spawn(square, 3)
+            p.spawn(fail, 2)
+            results = list(p)
+
+        assert results == [9]
+        assert sorted(str(e) for e in p.errors) == ["failed 1", "failed 2"]
+        assert sorted(s["status"] for s in p.stats) == ["fail", "fail", "pass"]
+
+    def test_timeout(self):
+        with parallel(timeout=0.05, collect_errors=True) as p:
+            p.spawn(gevent.sleep, 5)
+
+        assert isinstance(p.errors[0], TaskTimeout)
+
+    def test_thread_backend(self):
+        start = time.time()
+        with parallel(backend="thread", max_workers=4) as p:
+            for _ in range(4):
+                p.spawn(time.sleep, 0.2)
+
+        assert time.time() - start < 0.6
+
+    def test_process_backend(self):
+        with parallel(backend="process", max_workers=2, collect_errors=True) as p:
+            for i in range(4):
+                p.spawn(square, i)
+            p.spawn(os.getpid)
+            p.spawn(fail, 1)
+            results = list(p)
+
+        assert os.getpid() not in results
+        assert sorted(results)[:4] == [0, 1, 4, 9]
+        assert [str(e) for e in p.errors] == ["failed 1"]
+
+    def test_unknown_backend(self):
+        with pytest.raises(ValueError):
+            parallel(backend="fork")
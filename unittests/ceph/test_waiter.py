@@ -0,0 +1,76 @@
+import time
+
+from ceph.ceph import pgmap_clean
+from ceph.waiter import Backoff, watch_stream
+
+CEPH_W = """\
+  cluster:
+    health: HEALTH_WARN
+  data:
+    pgs:     32 active+clean
+             1  peering
+2026-10-18T10:00:01 mgr.a (mgr.4100) 41 : cluster [DBG] pgmap v41: 33 pgs: \
+32 active+clean, 1 peering; 449 KiB data, 80 MiB used
+2026-10-18T10:00:03 mgr.a (mgr.4100) 42 : cluster [DBG] pgmap v42: 33 pgs: \
+33 active+clean; 449 KiB data, 80 MiB used
+2026-10-18T10:00:05 mgr.a (mgr.4100) 43 : cluster [DBG] pgmap v43: 33 pgs: \
+33 active+clean; 449 KiB data, 80 MiB used
+"""
+
+
+class StreamingNode:
+    """Node which streams the output lines till the callback stops it."""
+
+    def __init__(self, output):
+        self.output = output
+        self.commands = []
+        self.read = []
+
+    def exec_command(self, cmd, output_callback, **kw):
+        self.commands.append(cmd)
+        for line in self.output.splitlines(keepends=True):
+            self.read.append(line)
+            if output_callback(line):
+                return "", "", -1
+        return "", "", 124
+
+
+def test_backoff_first_attempt_is_immediate():
+    start = time.time()
+    next(iter(Backoff(timeout=10, initial=5)))
+    assert time.time() - start < 0.1
+
+
+def test_backoff_grows_and_expires():
+    waits = []
+    last = time.time()
+    backoff = Backoff(timeout=0.5, initial=0.05, maximum=0.2, jitter=0)
+    for _ in backoff:
+        now = time.time()
+        waits.append(now - last)
+        last = now
+
+    assert backoff.expired
+    assert waits[2] > waits[1] > 0.04
+    assert max(waits) < 0.25
+
+
+def test_watch_stream_stops_at_the_match():
+    node = StreamingNode(CEPH_W)
+    line = watch_stream(node, "ceph -w --watch-debug", pgmap_clean, timeout=60)
+
+    assert "pgmap v42" in line
+    assert node.commands == ["timeout 60 ceph -w --watch-debug"]
+    assert "pgmap v43" not in "".join(node.read)
+
+
+def test_watch_stream_timeout():
+    node = StreamingNode(CEPH_W.replace("33 active+clean;", "33 peering;"))
+    assert watch_stream(node, "ceph -w", pgmap_clean, timeout=60) is None
+
+
+def test_pgmap_clean():
+    assert not pgmap_clean("    pgs:     32 active+clean")
+    assert not pgmap_clean("pgmap v7: 33 pgs: 32 active+clean, 1 peering; 0 B data")
+    assert not pgmap_clean("pgmap v7: 33 pgs: 32 active+clean; 0 B data")
+    assert pgmap_clean("pgmap v7: 33 pgs: 33 active+clean; 0 B data")
@@ -0,0 +1,71 @@
+"""Test the execution of the CLI commands on a list of nodes."""
+
+import gevent
+import pytest
+
+from ceph.ceph import CommandFailed
+from cli import Cli
+from cli.ceph.ceph import Ceph
+from cli.exceptions import FanOutError
+from cli.utilities.packages import Package
+
+
+class FakeNode:
+    def __init__(self, shortname, delay=0.0, fail=False):
+        self.shortname = shortname
+        self.delay = delay
+        self.fail = fail
+        self.cmds = []
+
+    def exec_command(self, cmd, **kw):
+        gevent.sleep(self.delay)
+        self.cmds.append(cmd)
+        if self.fail:
+            raise CommandFailed(f"{cmd} failed on {self.shortname}")
+        return f"{self.shortname}: {cmd}", ""
+
+
+def test_workers_reach_the_wrappers():
+    assert Package([], workers=8).workers == 8
+    assert Ceph([], workers=8).osd.pool.workers == 8
+    assert Ceph([]).osd.pool.workers is None
+
+
+def test_fan_out_keeps_node_order():
+    nodes = [FakeNode(f"node{i}", delay=0.03 - i * 0.01) for i in range(3)]
+    out = Cli(nodes, workers=3).execute("uptime")
+
+    assert list(out) == ["node0", "node1", "node2"]
+    assert out["node2"] == ("node2: uptime", "")
+
+
+def test_fan_out_aggregates_failures():
+    nodes = [FakeNode("node0"), FakeNode("node1", fail=True), FakeNode("node2")]
+    with pytest.raises(FanOutError) as err:
+        Package(nodes, workers=2).execute(cmd="yum install -y podman", sudo=True)
+
+    assert list(err.value.failures) == ["node1"]
+    assert isinstance(err.value.failures["node1"], CommandFailed)
+    assert sorted(err.value.results) == ["node0", "node2"]
+    assert "1 node(s)" in str(err.value)
+    assert all(node.cmds == ["yum install -y podman"] for node in nodes)
+
+
+def test_execute_as_completed():
+    nodes = [FakeNode("slow", delay=0.05), FakeNode("fast"), FakeNode("bad", fail=True)]
+    results = list(Cli(nodes).execute_as_completed("hostname"))
+
+    assert [host for host, _, _ in results][-1] == "slow"
+    assert {host: err is None for host, _, err in results} == {
+        "slow": True,
+        "fast": True,
+        "bad": False,
+    }
+
+
+def test_sequential_without_workers():
+    nodes = [FakeNode("node0"), FakeNode("node1", fail=True)]
+    with pytest.raises(CommandFailed):
+        Cli(nodes).execute("hostname")
+
+    assert nodes[0].cmds == ["hostname"]
@@ -0,0 +1,72 @@
+import json
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+
+import pytest
+
+from rest.common.utils.rest import REST, TOKENS
+
+
+class DashboardHandler(BaseHTTPRequestHandler):
+    logins = 0
+    tokens = set()
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.path == "/api/auth":
+            DashboardHandler.logins += 1
+            token = f"token-{DashboardHandler.logins}"
+            DashboardHandler.tokens.add(token)
+            self.reply(201, {"token": token})
+        elif self.path == "/api/auth/logout":
+            DashboardHandler.tokens.discard(self.token())
+            self.reply(200, {})
+        elif self.token() in DashboardHandler.tokens:
+            self.reply(200, {"pool": "rbd"})
+        else:
+            self.reply(401, {"detail": "Not authenticated"})
+
+    def token(self):
+        return self.headers.get("Authorization", "").replace("Bearer ", "")
+
+    def reply(self, status, body):
+        data = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def dashboard():
+    DashboardHandler.logins = 0
+    DashboardHandler.tokens = set()
+    server = ThreadingHTTPServer(("127.0.0.1", 0), DashboardHandler)
+    Thread(target=server.serve_forever, daemon=True).start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+    TOKENS.clear()
+
+
+def test_login_per_object(dashboard):
+    REST(ip="127.0.0.1", base_uri=dashboard).logout()
+    rest = REST(ip="127.0.0.1", base_uri=dashboard)
+
+    assert DashboardHandler.logins == 2
+    assert rest.post("/api/pool", max_retires=1) == {"pool": "rbd"}
+
+
+def test_cached_token_dropped_on_logout(dashboard):
+    REST(ip="127.0.0.1", base_uri=dashboard, cache_token=True)
+    rest = REST(ip="127.0.0.1", base_uri=dashboard, cache_token=True)
+    assert DashboardHandler.logins == 1
+
+    rest.logout()
+    assert not TOKENS
+    rest = REST(ip="127.0.0.1", base_uri=dashboard, cache_token=True)
+    assert DashboardHandler.logins == 2
+    assert rest.post("/api/pool", max_retires=1) == {"pool": "rbd"}
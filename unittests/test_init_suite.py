@@ -0,0 +1,83 @@
+"""Test the suite resolution cache and the suite index."""
+
+import pytest
+
+import init_suite
+from init_suite import SuiteIndex, load_suites, pipeline_suites
+
+SUITE = """
+tests:
+  - test:
+      name: install
+      module: install_prereq.py
+      polarion-id: CEPH-1,CEPH-2
+  - test:
+      name: deploy
+      module: test_cephadm.py
+"""
+
+METADATA = """
+pipelines:
+  sanity:
+    tier-0:
+      stage-1:
+        - name: smoke
+          suite: {suite}
+          metadata:
+            - rbd
+"""
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(init_suite, "CACHE_DIR", str(tmp_path / "cache"))
+    return tmp_path / "cache"
+
+
+def test_load_suites_cache(tmp_path, cache_dir):
+    suite = tmp_path / "suite.yaml"
+    suite.write_text(SUITE)
+
+    tests = load_suites([str(suite)])["tests"]
+    assert [t["test"]["name"] for t in tests] == ["install", "deploy"]
+    assert len(list((cache_dir / "suites").iterdir())) == 1
+
+    # Modifying the fragment invalidates its cached result
+    suite.write_text(SUITE.replace("deploy", "redeploy"))
+    tests = load_suites([str(suite)])["tests"]
+    assert [t["test"]["name"] for t in tests] == ["install", "redeploy"]
+
+
+def test_pipeline_suites_tags():
+    suites = pipeline_suites(
+        {"suites": [{"name": "a", "suite": "a.yaml", "metadata": ["tier-1"]}]}
+    )
+    assert suites == [
+        {
+            "name": "a",
+            "suite": "a.yaml",
+            "tags": ["tier-1"],
+            "entry": {"name": "a", "suite": "a.yaml", "metadata": ["tier-1"]},
+        }
+    ]
+
+
+def test_suite_index(tmp_path, cache_dir):
+    suite = tmp_path / "suite.yaml"
+    suite.write_text(SUITE)
+    metadata_dir = tmp_path / "metadata"
+    metadata_dir.mkdir()
+    (metadata_dir / "7.1.yaml").write_text(METADATA.format(suite=suite))
+
+    index = SuiteIndex(str(metadata_dir)).load()
+    (result,) = index.query("7.1", ["tier-0", "rbd"])
+    assert result["modules"] == ["install_prereq.py", "test_cephadm.py"]
+    assert result["polarion_ids"] == ["CEPH-1", "CEPH-2"]
+    assert index.query("7.1", ["tier-1"]) == []
+
+    # A stored index is reused as is till a fragment changes
+    index = SuiteIndex(str(metadata_dir)).load()
+    assert not index.changed
+    suite.write_text(SUITE.replace("CEPH-2", "CEPH-30"))
+    index = SuiteIndex(str(metadata_dir)).load()
+    assert index.query("7.1")[0]["polarion_ids"] == ["CEPH-1", "CEPH-30"]
@@ -0,0 +1,89 @@
+"""Test the bulk data helper of the CephFS tests."""
+
+import hashlib
+import os
+
+from tests.cephfs.cephfs_utilsV1 import BULK_DATA_DST, BULK_DATA_SCRIPT, FsUtils
+from tests.cephfs.utilities.bulk_data import checksum, create, list_files
+
+
+def test_list_files(tmp_path):
+    create(str(tmp_path), 3, 0, "file_", 0, "data {index}\n", 0)
+    (tmp_path / ".hidden").write_text("skipped")
+    (tmp_path / "dir").mkdir()
+    (tmp_path / "dir" / "nested.txt").write_text("nested")
+    (tmp_path / ".snap").mkdir()
+    (tmp_path / ".snap" / "file_0.txt").write_text("skipped")
+
+    assert list_files(str(tmp_path)) == ["file_0.txt", "file_1.txt", "file_2.txt"]
+    assert list_files(str(tmp_path), recursive=True) == [
+        "dir/nested.txt",
+        "file_0.txt",
+        "file_1.txt",
+        "file_2.txt",
+    ]
+
+
+def test_checksum_manifest(tmp_path):
+    files = create(str(tmp_path), 2, 5, "f", 10, "ab", 0)
+    assert files == ["f5.txt", "f6.txt"]
+    assert (tmp_path / "f5.txt").read_bytes() == b"ababababab"
+
+    manifest = checksum(str(tmp_path), files, "md5", workers=2)
+    digest = hashlib.md5(b"ababababab").hexdigest()
+    assert manifest == {"algo": "md5", "files": {"f5.txt": digest, "f6.txt": digest}}
+
+
+def test_diff_manifests():
+    expected = {"algo": "md5", "files": {"a": "1", "b": "2", "c": "3"}}
+    actual = {"algo": "md5", "files": {"a": "1", "b": "0", "d": "4"}}
+
+    assert FsUtils.diff_manifests(expected, expected) == {
+        "missing": [],
+        "unexpected": [],
+        "mismatched": [],
+    }
+    assert FsUtils.diff_manifests(expected, actual) == {
+        "missing": ["c"],
+        "unexpected": ["d"],
+        "mismatched": ["b"],
+    }
+
+
+class FakeClient:
+    """Client keeping the uploaded files in memory."""
+
+    def __init__(self):
+        self.files = dict()
+        self.uploads = 0
+
+    def exec_command(self, cmd, **kw):
+        path = cmd.split()[-1]
+        if path not in self.files:
+            return "", f"sha256sum: {path}: No such file or directory"
+        return f"{hashlib.sha256(self.files[path]).hexdigest()}  {path}\n", ""
+
+    def upload_file(self, src, dst, **kw):
+        with open(src, "rb") as fh:
+            self.files[dst] = fh.read()
+        self.uploads += 1
+
+
+def test_push_bulk_data_helper(monkeypatch):
+    # The helper path is relative to the repository, like in the test runs
+    monkeypatch.chdir(os.path.dirname(os.path.abspath(__file__)) + "/../../..")
+    fs_util = FsUtils.__new__(FsUtils)
+    client = FakeClient()
+
+    assert fs_util.push_bulk_data_helper(client) == BULK_DATA_DST
+    fs_util.push_bulk_data_helper(client)
+    assert client.uploads == 1
+
+    # The helper is pushed again when removed or modified on the client
+    del client.files[BULK_DATA_DST]
+    fs_util.push_bulk_data_helper(client)
+    client.files[BULK_DATA_DST] = b"stale"
+    fs_util.push_bulk_data_helper(client)
+    assert client.uploads == 3
+    with open(BULK_DATA_SCRIPT, "rb") as fh:
+        assert client.files[BULK_DATA_DST] == fh.read()
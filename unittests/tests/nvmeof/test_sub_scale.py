@@ -0,0 +1,60 @@
+"""Test the namespace configuration of the NVMe-oF scale test."""
+
+import json
+
+from tests.nvmeof import test_ceph_nvmeof_gateway_sub_scale as sub_scale
+
+
+class FakeNamespace:
+    def __init__(self):
+        self.bulk = []
+
+    def add_bulk(self, items):
+        self.bulk.append(items)
+        return [
+            {
+                "args": item["args"],
+                "rc": 0,
+                "stdout": "",
+                "stderr": json.dumps({"nsid": nsid}),
+            }
+            for nsid, item in enumerate(items, start=1)
+        ]
+
+    def list(self, **kwargs):
+        nsid = kwargs["args"]["nsid"]
+        return "", json.dumps({"namespaces": [{"uuid": f"uuid-{nsid}"}]})
+
+
+class FakeNode:
+    def exec_command(self, **kw):
+        return "", ""
+
+
+class FakeRbd:
+    def __init__(self):
+        self.images = []
+
+    def create_image(self, pool, image, size):
+        self.images.append(f"{pool}/{image}")
+
+
+def test_namespaces_added_in_bulk(monkeypatch):
+    io_runs = []
+    monkeypatch.setattr(sub_scale, "initiators", lambda *args: None)
+    monkeypatch.setattr(
+        sub_scale, "run_io", lambda cluster, uuid, io: io_runs.append(uuid)
+    )
+    namespace, rbd = FakeNamespace(), FakeRbd()
+    config = {
+        "args": {"subsystems": 2, "namespaces": 6, "image_size": "1G", "pool": "rbd"}
+    }
+
+    sub_scale.configure_namespaces(
+        config, namespace, "add", None, FakeNode(), {}, rbd, [{"node": "node1"}]
+    )
+
+    assert [len(items) for items in namespace.bulk] == [3, 3]
+    assert namespace.bulk[1][0]["args"]["subsystem"] == "nqn.2016-06.io.spdk:cnode2"
+    assert len(rbd.images) == 6
+    assert io_runs == ["uuid-1", "uuid-2", "uuid-3"] * 2
@@ -0,0 +1,46 @@
+from utility.io.fio_orchestrator import fio_job_file
+from utility.io.fio_results import FioResults
+from utility.utils import build_fio_args
+
+
+def test_fio_job_file_from_run_fio_args():
+    args = build_fio_args(
+        test_name="FIO_WRITE",
+        device_name="/dev/nvme0n1",
+        io_type="randwrite",
+        run_time=60,
+        output_format="json",
+    )
+    job = fio_job_file("FIO_WRITE-client1", args).splitlines()
+
+    assert job[0] == "[FIO_WRITE-client1]"
+    assert "filename=/dev/nvme0n1" in job
+    assert "rw=randwrite" in job
+    assert "time_based" in job
+    assert not [line for line in job if line.startswith(("output", "name="))]
+
+
+def test_client_stats_records_per_server():
+    def stats(jobname, hostname, iops):
+        return {
+            "jobname": jobname,
+            "hostname": hostname,
+            "job options": {"rw": "write"},
+            "write": {"io_bytes": 1, "iops": iops, "bw": 4 * iops, "runtime": 1},
+        }
+
+    results = FioResults()
+    results.add(
+        {
+            "client_stats": [
+                stats("job-c1", "c1", 100),
+                stats("job-c2", "c2", 150),
+                stats("All clients", "", 250),
+            ]
+        },
+        iteration=0,
+    )
+
+    assert [r["client"] for r in results.records] == ["c1", "c2"]
+    (row,) = results.aggregate(group_by=("rw",))
+    assert row["clients"] == 2 and row["iops_mean"] == 250
@@ -0,0 +1,77 @@
+import csv
+
+from utility.io.fio_results import FioResults, histogram_percentiles
+
+
+def fio_output(jobname, iops, bins=None):
+    clat = {"mean": 1000.0, "percentile": {"99.000000": 4000, "50.000000": 900}}
+    if bins:
+        clat["bins"] = bins
+
+    return {
+        "global options": {"bs": "4k", "iodepth": "8"},
+        "jobs": [
+            {
+                "jobname": jobname,
+                "job options": {"rw": "randwrite", "numjobs": "1"},
+                "read": {"io_bytes": 0},
+                "write": {
+                    "io_bytes": 4096 * iops,
+                    "iops": iops,
+                    "bw": iops * 4,
+                    "bw_mean": iops * 4.5,
+                    "runtime": 1000,
+                    "slat_ns": {"mean": 10.0},
+                    "clat_ns": clat,
+                    "lat_ns": {"mean": 1010.0, "max": 9000},
+                },
+            }
+        ],
+    }
+
+
+def test_parse_skips_idle_directions():
+    results = FioResults()
+    records = results.add(fio_output("job", 100), client="c1", iteration=0)
+
+    assert len(records) == 1
+    assert records[0]["direction"] == "write"
+    assert records[0]["bs"] == "4k"
+    assert records[0]["bw_kib"] == 400
+    assert records[0]["bw_mean_kib"] == 450
+    assert records[0]["clat_p99_ns"] == 4000
+    assert records[0]["clat_p99.9_ns"] is None
+
+
+def test_aggregate_across_clients_and_iterations():
+    results = FioResults()
+    for iteration, iops in enumerate((100, 300)):
+        results.add(fio_output("job", iops), client="c1", iteration=iteration)
+        results.add(fio_output("job", iops), client="c2", iteration=iteration)
+
+    (row,) = results.aggregate()
+    assert row["clients"] == 2 and row["iterations"] == 2
+    assert row["iops_mean"] == 400
+    assert row["iops_min"] == 200 and row["iops_max"] == 600
+    assert row["clat_mean_ns"] == 1000
+    assert row["clat_p99_ns"] == 4000
+
+
+def test_histogram_percentiles_merged():
+    merged = histogram_percentiles(
+        [{"100": 50, "200": 40}, {"200": 5, "1000": 5}], percentiles=("50", "99")
+    )
+    assert merged == {"50": 100, "99": 1000}
+
+
+def test_write_csv(tmp_path):
+    results = FioResults()
+    results.add(fio_output("job", 100, bins={"900": 10}), client="c1")
+    path = results.write(str(tmp_path / "run.csv"))
+
+    with open(path) as fh:
+        rows = list(csv.DictReader(fh))
+
+    assert rows[0]["client"] == "c1"
+    assert rows[0]["iops"] == "100"
+    assert "clat_bins" not in rows[0]
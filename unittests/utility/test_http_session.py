@@ -0,0 +1,58 @@
+from http.server import BaseHTTPRequestHandler, HTTPServer
+from threading import Thread
+
+import gevent
+
+from utility.http_session import LatencyStats, batch, get_session, request
+
+
+def test_session_shared_per_endpoint():
+    session = get_session("https://10.0.0.1:8443/api/auth")
+    assert get_session("https://10.0.0.1:8443/api/pool?stats=true") is session
+    assert get_session("https://10.0.0.2:8443/api/auth") is not session
+
+
+class LoginHandler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header("Set-Cookie", "token=secret; Path=/")
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"ok")
+
+    def log_message(self, *args):
+        pass
+
+
+def test_session_rejects_cookies():
+    server = HTTPServer(("127.0.0.1", 0), LoginHandler)
+    Thread(target=server.handle_request, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_port}/api/auth"
+    try:
+        response = request("get", url, timeout=10)
+    finally:
+        server.server_close()
+
+    assert response.status_code == 200
+    assert response.headers["Set-Cookie"] == "token=secret; Path=/"
+    assert not get_session(url).cookies
+
+
+def test_latency_histogram():
+    stats = LatencyStats()
+    stats.record("get", "https://10.0.0.1:8443/api/pool?stats=true", 0.02)
+    stats.record("GET", "https://10.0.0.1:8443/api/pool", 0.3)
+
+    summary = stats.summary()["GET /api/pool"]
+    assert summary["count"] == 2
+    assert summary["buckets"] == {"0.05": 1, "0.5": 1}
+    assert summary["avg"] == 0.16
+
+
+def test_batch_returns_results_in_order():
+    def call(value, delay):
+        gevent.sleep(delay)
+        return value
+
+    calls = [lambda v=v: call(v, 0.05 - v * 0.01) for v in range(5)]
+    assert batch(calls) == list(range(5))
@@ -0,0 +1,28 @@
+"""Test the deferred imports and the import profiler."""
+
+import sys
+
+from utility.import_profiler import ImportProfiler
+from utility.lazy_import import lazy_import
+
+
+def test_lazy_import_on_attribute_access():
+    sys.modules.pop("colorsys", None)
+    colorsys = lazy_import("colorsys")
+    assert "colorsys" not in sys.modules
+
+    assert colorsys.rgb_to_hsv(1, 0, 0) == (0, 1, 1)
+    assert "colorsys" in sys.modules
+
+
+def test_import_profiler_records_modules():
+    sys.modules.pop("fractions", None)
+    profiler = ImportProfiler()
+    profiler.start()
+    try:
+        import fractions  # noqa
+    finally:
+        profiler.stop()
+
+    assert profiler.timings["fractions"]["cumulative"] >= 0
+    assert "fractions" in profiler.report()
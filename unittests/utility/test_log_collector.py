@@ -0,0 +1,22 @@
+import io
+import os
+
+from utility.log_collector import Deduplicator
+
+
+def test_deduplicator_links_identical_files(tmp_path):
+    dedup = Deduplicator()
+    paths = [tmp_path / name for name in ("a.log", "b.log", "c.log")]
+
+    dedup.store(io.BytesIO(b"same content"), str(paths[0]))
+    dedup.store(io.BytesIO(b"same content"), str(paths[1]))
+    dedup.store(io.BytesIO(b"other content"), str(paths[2]))
+
+    assert [p.read_bytes() for p in paths] == [
+        b"same content",
+        b"same content",
+        b"other content",
+    ]
+    assert os.path.samefile(paths[0], paths[1])
+    assert not os.path.samefile(paths[0], paths[2])
+    assert dedup.saved_bytes == len(b"same content")
@@ -0,0 +1,103 @@
+"""Test the resolution of the suite test modules."""
+
+import glob
+import os
+import re
+import sys
+from importlib.machinery import PathFinder
+
+import pytest
+
+from utility.module_resolver import TEST_DIRS, ModuleResolver
+
+MODULE_PATTERN = re.compile(r"^\s*module:\s*['\"]?([^\s'\"#]+)", re.M)
+
+
+@pytest.fixture
+def resolver(tmp_path):
+    for test_dir in ("tests/first", "tests/second"):
+        (tmp_path / test_dir).mkdir(parents=True)
+
+    (tmp_path / "tests/first/resolver_helper.py").write_text("VALUE = 'first'\n")
+    (tmp_path / "tests/second/resolver_helper.py").write_text("VALUE = 'second'\n")
+    (tmp_path / "tests/second/test_resolver_mod.py").write_text(
+        "from resolver_helper import VALUE\n\n\ndef run(**kw):\n    return VALUE\n"
+    )
+
+    resolver = ModuleResolver(["tests/first", "tests/second"], base_dir=tmp_path)
+    yield resolver
+
+    resolver.uninstall()
+    for name in ("resolver_helper", "test_resolver_mod"):
+        sys.modules.pop(name, None)
+
+
+def test_resolve_in_directory_order(resolver, tmp_path):
+    assert resolver.resolve("resolver_helper.py") == str(
+        tmp_path / "tests/first/resolver_helper.py"
+    )
+    assert resolver.resolve("missing.py") is None
+
+
+def test_load_with_sibling_import(resolver):
+    test_mod = resolver.load("test_resolver_mod.py")
+    assert test_mod.run() == "first"
+
+
+def test_namespace_package(tmp_path):
+    (tmp_path / "tests/first/ns_suite").mkdir(parents=True)
+    (tmp_path / "tests/first/ns_suite/ns_test_mod.py").write_text("VALUE = 'ns'\n")
+    resolver = ModuleResolver(["tests/first"], base_dir=tmp_path)
+
+    assert resolver.resolve("ns_suite.ns_test_mod.py") == str(
+        tmp_path / "tests/first/ns_suite/ns_test_mod.py"
+    )
+    try:
+        assert resolver.load("ns_suite.ns_test_mod.py").VALUE == "ns"
+    finally:
+        resolver.uninstall()
+        for name in ("ns_suite", "ns_suite.ns_test_mod"):
+            sys.modules.pop(name, None)
+
+
+def _path_finder_location(module, paths):
+    """Return the file found by the sys.path based lookup used earlier."""
+    top, *parts = os.path.splitext(module)[0].split(".")
+    spec = PathFinder.find_spec(top, paths)
+    if spec is None:
+        return None
+
+    locations = list(spec.submodule_search_locations or [spec.origin])
+    for location in locations:
+        if spec.submodule_search_locations and location == spec.origin:
+            location = os.path.dirname(location)
+        path = os.path.join(location, *parts)
+        if not parts:
+            return location
+        if os.path.isdir(path):
+            return path
+        if os.path.isfile(f"{path}.py"):
+            return f"{path}.py"
+
+    return None
+
+
+def test_suite_modules_resolve():
+    base_dir = os.path.dirname(os.path.dirname(os.path.dirname(__file__)))
+    resolver = ModuleResolver(base_dir=base_dir)
+    paths = [os.path.join(base_dir, test_dir) for test_dir in TEST_DIRS]
+
+    modules = set()
+    for suite in glob.glob(os.path.join(base_dir, "suites/**/*.yaml"), recursive=True):
+        with open(suite, errors="ignore") as _file:
+            modules.update(MODULE_PATTERN.findall(_file.read()))
+    assert modules
+
+    # modules missing from the tree are not resolved by either lookup
+    expected = {module: _path_finder_location(module, paths) for module in modules}
+    unresolved = [
+        module
+        for module, location in expected.items()
+        if location and resolver.resolve(module) is None
+    ]
+    assert not unresolved
@@ -0,0 +1,44 @@
+import json
+import os
+import threading
+
+from utility.publisher import ResultPublisher
+
+
+def test_publisher_batches_records(tmp_path):
+    batches = []
+    release = threading.Event()
+
+    def handler(payloads):
+        release.wait(5)
+        batches.append(payloads)
+
+    publisher = ResultPublisher(str(tmp_path), handlers={"polarion": handler})
+    for idx in range(5):
+        publisher.publish("polarion", {"id": idx})
+    release.set()
+    publisher.close()
+
+    assert [p["id"] for batch in batches for p in batch] == list(range(5))
+    assert len(batches) < 5
+    assert os.listdir(tmp_path) == []
+
+
+def test_publisher_retries_and_keeps_failed_records(tmp_path):
+    calls = []
+
+    def handler(payloads):
+        calls.append(payloads)
+        raise RuntimeError("service unavailable")
+
+    publisher = ResultPublisher(
+        str(tmp_path), handlers={"email": handler}, tries=3, delay=0.01
+    )
+    publisher.publish("email", {"run_id": "abc"})
+    publisher.close()
+
+    assert len(calls) == 3
+    assert publisher.stats["failed"] == 1
+    (name,) = os.listdir(tmp_path)
+    with open(tmp_path / name) as fh:
+        assert json.load(fh) == {"kind": "email", "payload": {"run_id": "abc"}}
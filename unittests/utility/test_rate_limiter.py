@@ -0,0 +1,24 @@
+import pytest
+
+from utility.rate_limiter import TokenBucket
+
+
+def test_burst_is_available_immediately():
+    bucket = TokenBucket(rate=1, burst=3)
+    assert all(bucket.try_acquire() for _ in range(3))
+    assert not bucket.try_acquire()
+
+
+def test_acquire_waits_for_refill():
+    bucket = TokenBucket(rate=20, burst=1)
+    assert bucket.acquire() < 0.01
+    waited = bucket.acquire()
+    assert 0.03 < waited < 0.2
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        TokenBucket(rate=0)
+
+    with pytest.raises(ValueError):
+        TokenBucket(rate=1, burst=0)
@@ -0,0 +1,100 @@
+"""Test the planning of the pipeline stages."""
+
+import json
+
+from utility.stage_scheduler import (
+    DEFAULT_DURATION,
+    estimate_duration,
+    load_history,
+    load_plan,
+    parse_duration,
+    plan_waves,
+    save_plan,
+)
+
+XUNIT = """\
+<testsuites>
+  <testsuite name="tier-1_rbd">
+    <testcase name="a" time="60.5"/>
+    <testcase name="b" time="39.5"/>
+  </testsuite>
+</testsuites>
+"""
+
+CONF = """\
+globals:
+  - ceph-cluster:
+      name: ceph
+      node1:
+        role: [mon]
+        cpu: 8
+      node2:
+        role: [osd]
+"""
+
+
+def test_parse_duration():
+    assert parse_duration(90) == 90.0
+    assert parse_duration("1h 26m 32s") == 5192.0
+    assert parse_duration("45m") == 2700.0
+    assert parse_duration("unknown") is None
+    assert parse_duration(None) is None
+
+
+def test_load_history(tmp_path):
+    run = tmp_path / "run-1"
+    run.mkdir()
+    (run / "run_summary.json").write_text(
+        json.dumps({"suite": "suites/squid/rbd/tier-1_rbd.yaml", "duration": 300})
+    )
+    (run / "xunit.xml").write_text(XUNIT)
+    (tmp_path / "broken").mkdir()
+    (tmp_path / "broken" / "run_summary.json").write_text("{")
+
+    history = load_history([str(tmp_path)])
+    assert history == {"tier-1_rbd": [300.0, 100.0]}
+
+    suite = {"suite": "suites/squid/rbd/tier-1_rbd.yaml"}
+    assert estimate_duration(suite, history) == 200.0
+    assert estimate_duration({"suite": "other.yaml"}, {}) == DEFAULT_DURATION
+
+
+def test_plan_waves(tmp_path):
+    conf = tmp_path / "conf.yaml"
+    conf.write_text(CONF)
+
+    def suite(name, minutes, conf_file=None):
+        return {
+            "name": name,
+            "suite": f"suites/{name}.yaml",
+            "global-conf": conf_file,
+            "execution_time": f"{minutes}m",
+        }
+
+    suites = [
+        suite("short", 10),
+        suite("long", 90, str(conf)),
+        suite("medium", 30, str(conf)),
+        suite("tiny", 5),
+    ]
+    waves = plan_waves(suites, {}, max_nodes=3)
+    assert [[s["name"] for s in wave] for wave in waves] == [
+        ["long", "short"],
+        ["medium", "tiny"],
+    ]
+
+    waves = plan_waves(suites, {}, max_vcpus=14)
+    assert [[s["name"] for s in wave] for wave in waves] == [
+        ["long"],
+        ["medium"],
+        ["short", "tiny"],
+    ]
+
+
+def test_saved_plan(tmp_path):
+    suites = [{"name": name} for name in ("a", "b", "c")]
+    plan = tmp_path / "plan.json"
+    save_plan(str(plan), [[suites[2]], [suites[0], suites[1]]])
+
+    waves = load_plan(str(plan), suites[:2])
+    assert waves == [[], [suites[0], suites[1]]]
@@ -0,0 +1,83 @@
+"""Test the dependency aware execution of the suite tests."""
+
+import gevent
+import pytest
+
+from utility.suite_scheduler import EXCLUSIVE, SuiteScheduler, build_graph
+
+
+def _graph(tests):
+    return build_graph(tests, [f"{test['name']}_0" for test in tests])
+
+
+def _runner(rcs=None, events=None):
+    events = events if events is not None else []
+
+    def execute(node):
+        events.append(("start", node.name))
+        gevent.sleep(0.01)
+        events.append(("end", node.name))
+        return (rcs or {}).get(node.name, 0)
+
+    return execute, events
+
+
+def test_sequential_by_default():
+    nodes = _graph([{"name": "a"}, {"name": "b"}, {"name": "c"}])
+    assert [node.depends_on for node in nodes] == [[], ["a_0"], ["b_0"]]
+    assert all(node.resources == {EXCLUSIVE} for node in nodes)
+
+    execute, events = _runner()
+    SuiteScheduler(nodes, max_workers=4).run(execute)
+    assert [name for event, name in events if event == "start"] == [
+        "a_0",
+        "b_0",
+        "c_0",
+    ]
+    assert events[1] == ("end", "a_0")
+
+
+def test_independent_tests_run_concurrently():
+    nodes = _graph(
+        [
+            {"name": "setup", "id": "setup"},
+            {"name": "rbd", "depends-on": "setup", "resources": ["pool:rbd"]},
+            {"name": "rgw", "depends-on": ["setup"], "resources": ["pool:rgw"]},
+            {"name": "rbd2", "depends-on": ["setup"], "resources": ["pool:rbd"]},
+        ]
+    )
+    execute, events = _runner()
+    SuiteScheduler(nodes, max_workers=4).run(execute)
+
+    assert events[2:4] == [("start", "rbd_0"), ("start", "rgw_0")]
+    # rbd2 shares the pool with rbd, hence waits for it
+    assert events.index(("start", "rbd2_0")) > events.index(("end", "rbd_0"))
+
+
+def test_abort_on_fail_stops_dependents_only():
+    nodes = _graph(
+        [
+            {"name": "a", "depends-on": [], "resources": ["x"], "abort-on-fail": True},
+            {"name": "b", "depends-on": ["a"], "resources": ["x"]},
+            {"name": "c", "depends-on": [], "resources": ["y"]},
+            {"name": "d"},
+        ]
+    )
+    execute, events = _runner(rcs={"a_0": 1})
+    SuiteScheduler(nodes, max_workers=2).run(execute)
+
+    status = {node.name: node.status for node in nodes}
+    assert status == {"a_0": "aborted", "b_0": "blocked", "c_0": "done", "d_0": "done"}
+    assert ("start", "b_0") not in events
+
+
+def test_invalid_dependencies():
+    with pytest.raises(ValueError, match="unknown"):
+        SuiteScheduler(_graph([{"name": "a", "depends-on": ["z"]}]))
+
+    with pytest.raises(ValueError, match="Cyclic"):
+        SuiteScheduler(
+            _graph(
+                [{"name": "a", "depends-on": ["b"]}, {"name": "b", "depends-on": ["a"]}]
+            )
+        )
@@ -3,7 +3,7 @@ from unittest import mock
 
 import pytest
 
-from utility.utils import custom_ceph_config, get_cephci_config
+from utility.utils import custom_ceph_config, email_results, get_cephci_config
 
 suite_config = {
     "global": {
@@ -149,3 +149,12 @@ def test_get_cephci_config_raises(mock_expanduser):
     except IOError as exception:
         assert mock_expanduser.call_count == 1
         assert exception.errno == 2
+
+
+def test_email_results_missing_keys(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    result = [{"suite-name": "suite", "compose-id": "compose", "status": "Pass"}]
+
+    assert email_results(test_result={"result": result}) is None
+    assert email_results(test_result={"run_id": "abc", "result": result}) is None
+    assert not os.path.exists(tmp_path / "result.props")
@@ -0,0 +1,162 @@
+"""Shared HTTP sessions for the REST clients.
+
+Creating a new connection for every request costs a TCP and TLS handshake,
+hence the clients in api/ and rest/ use the connection pooled sessions of
+this module,
+
+1. A single keep-alive session is shared per endpoint (scheme, host, port).
+   The sessions reject cookies, the clients authenticate every request
+   using their own headers, so no login leaks across users or tests.
+2. Connection failures are retried by the transport with backoff.
+3. The latency of every request is recorded in a per endpoint histogram.
+4. Independent requests can be issued concurrently using batch.
+
+  Typical usage example:
+
+    response = request("get", "https://10.0.0.1:8443/api/health/minimal")
+    statuses = batch([partial(client.get, "/api/pool"), partial(client.get, "/api/osd")])
+"""
+
+from http.cookiejar import DefaultCookiePolicy
+from threading import Lock
+from time import time
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from ceph.parallel import parallel
+from utility.log import Log
+
+log = Log(__name__)
+
+# Connections kept open per endpoint
+POOL_SIZE = 32
+
+# Transport level retries of connection failures
+DEFAULT_RETRIES = 3
+BACKOFF_FACTOR = 0.5
+
+# Upper bounds in seconds of the latency histogram buckets
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, float("inf"))
+
+_sessions = {}
+_lock = Lock()
+
+
+def endpoint(url):
+    """Return the scheme://host:port part of the url."""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def get_session(url, retries=DEFAULT_RETRIES):
+    """
+    Return the shared session of the endpoint serving the given url.
+
+    Args:
+        url: request url
+        retries: number of retries on connection failures
+    """
+    key = (endpoint(url), retries)
+    with _lock:
+        if key not in _sessions:
+            session = requests.Session()
+            session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+            adapter = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=POOL_SIZE,
+                max_retries=Retry(
+                    total=retries,
+                    connect=retries,
+                    read=0,
+                    status=0,
+                    backoff_factor=BACKOFF_FACTOR,
+                    allowed_methods=None,
+                ),
+            )
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _sessions[key] = session
+
+        return _sessions[key]
+
+
+class LatencyStats:
+    """Histogram of the request latencies keyed by method and url path."""
+
+    def __init__(self):
+        self.endpoints = dict()
+
+    def record(self, method, url, duration):
+        """Count the request duration in its latency bucket."""
+        key = f"{method.upper()} {urlsplit(url).path}"
+        stats = self.endpoints.setdefault(
+            key, {"count": 0, "total": 0.0, "max": 0.0, "buckets": {}}
+        )
+        bucket = next(str(b) for b in LATENCY_BUCKETS if duration <= b)
+        stats["count"] += 1
+        stats["total"] += duration
+        stats["max"] = max(stats["max"], duration)
+        stats["buckets"][bucket] = stats["buckets"].get(bucket, 0) + 1
+
+    def summary(self):
+        """Return the histogram along with the average latency per endpoint."""
+        return {
+            key: dict(stats, avg=round(stats["total"] / stats["count"], 4))
+            for key, stats in self.endpoints.items()
+        }
+
+    def reset(self):
+        self.endpoints.clear()
+
+
+latency_stats = LatencyStats()
+
+
+def request(method, url, retries=DEFAULT_RETRIES, **kwargs):
+    """
+    Send the request using the shared session of the endpoint.
+
+    Args:
+        method: HTTP method like get or post
+        url: request url
+        retries: number of retries on connection failures
+        kwargs: arguments supported by requests.Session.request
+
+    Returns:
+        requests.Response
+    """
+    start = time()
+    try:
+        return get_session(url, retries).request(method.upper(), url, **kwargs)
+    finally:
+        latency_stats.record(method, url, time() - start)
+
+
+def batch(calls, max_workers=None):
+    """
+    Invoke the independent calls concurrently and return their results in order.
+
+    Args:
+        calls: callables taking no arguments, like functools.partial objects
+        max_workers: maximum number of calls in flight
+
+    Returns:
+        list of the call results
+
+    Raises:
+        the first exception raised by any of the calls
+    """
+
+    def _call(index, method):
+        return index, method()
+
+    with parallel(max_workers=max_workers) as p:
+        for index, method in enumerate(calls):
+            p.spawn(_call, index, method)
+
+        results = dict(p)
+
+    return [results[index] for index in range(len(calls))]
@@ -0,0 +1,92 @@
+"""Import time profiler used by run.py --profile-startup.
+
+The profiler wraps the loader of every module imported after it is started
+and records the time taken to execute the module, both including (cumulative)
+and excluding (self) the modules it imported in turn, like python -X importtime.
+"""
+
+import sys
+from importlib.abc import MetaPathFinder
+from time import perf_counter
+
+
+class _TimedLoader:
+    """Loader recording the execution time of the module."""
+
+    def __init__(self, loader, profiler):
+        self._loader = loader
+        self._profiler = profiler
+
+    def create_module(self, spec):
+        return self._loader.create_module(spec)
+
+    def exec_module(self, module):
+        self._profiler.enter()
+        try:
+            self._loader.exec_module(module)
+        finally:
+            self._profiler.exit(module.__name__)
+
+    def __getattr__(self, attr):
+        return getattr(self._loader, attr)
+
+
+class ImportProfiler(MetaPathFinder):
+    """Meta path finder timing the modules found by the other finders."""
+
+    def __init__(self):
+        self.timings = dict()
+        self._stack = []
+
+    def start(self):
+        if self not in sys.meta_path:
+            sys.meta_path.insert(0, self)
+
+    def stop(self):
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, fullname, path, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+
+            if spec.loader is not None and hasattr(spec.loader, "exec_module"):
+                spec.loader = _TimedLoader(spec.loader, self)
+            return spec
+
+        return None
+
+    def enter(self):
+        self._stack.append([perf_counter(), 0.0])
+
+    def exit(self, name):
+        start, children = self._stack.pop()
+        cumulative = perf_counter() - start
+        self.timings[name] = {"self": cumulative - children, "cumulative": cumulative}
+        if self._stack:
+            self._stack[-1][1] += cumulative
+
+    def report(self, limit=30):
+        """Return the modules taking the most time to import, as a table."""
+        rows = sorted(
+            self.timings.items(), key=lambda item: item[1]["cumulative"], reverse=True
+        )
+        total = sum(timing["self"] for timing in self.timings.values())
+        lines = [
+            f"Imported {len(self.timings)} modules in {total:.3f}s",
+            f"{'cumulative(s)':>14} {'self(s)':>10}  module",
+        ]
+        for name, timing in rows[:limit]:
+            lines.append(
+                f"{timing['cumulative']:>14.4f} {timing['self']:>10.4f}  {name}"
+            )
+
+        return "\n".join(lines)
+
+
+import_profiler = ImportProfiler()
@@ -0,0 +1,155 @@
+"""Synchronized FIO runs across multiple clients.
+
+Launching run_fio on the clients one after the other staggers the load, so
+the aggregate throughput depends on how quickly the commands were issued.
+This module uses the client/server mode of fio instead,
+
+1. ``fio --server`` is started on every client.
+2. The controller sends the job of every client to its server and fio starts
+   the jobs of all the servers together.
+3. The merged JSON output is read once and parsed into FioResults.
+
+The job options are built by run_fio's build_fio_args, hence the same
+arguments and IO profiles apply to RBD, CephFS and NVMe-oF targets.
+
+  Typical usage example:
+
+    results = run_fio_on_clients(
+        targets=[
+            {"client_node": client1, "device_name": "/dev/nvme0n1"},
+            {"client_node": client2, "device_name": "/dev/nvme0n1"},
+        ],
+        **IO_Profiles["FIO_WRITE_BS_4k_IODepth8_LIBAIO"],
+    )
+    results.write_summary(f"{test_dir}/run_summary.csv")
+"""
+
+import json
+
+from ceph.parallel import parallel
+from utility.io.fio_results import FioResults
+from utility.log import Log
+from utility.utils import build_fio_args
+
+log = Log(__name__)
+
+FIO_SERVER_PORT = 8765
+FIO_SERVER_PID = "/var/run/fio-server.pid"
+JOB_DIR = "/tmp"
+
+# Options handled by the controller instead of the job file
+CONTROLLER_OPTIONS = ("output", "output-format")
+
+
+def fio_job_file(name, cmd_args):
+    """
+    Return the fio job file having the given options.
+
+    Args:
+        name: job section name
+        cmd_args: fio options built by build_fio_args
+    """
+    lines = [f"[{name}]"]
+    for key, value in cmd_args.items():
+        if key in CONTROLLER_OPTIONS or key == "name" or value is False:
+            continue
+
+        lines.append(key if value is True else f"{key}={value}")
+
+    return "\n".join(lines) + "\n"
+
+
+def start_fio_server(node, port=FIO_SERVER_PORT):
+    """Start the fio server on the node, replacing a running one."""
+    stop_fio_server(node)
+    node.exec_command(
+        sudo=True,
+        cmd=f"firewall-cmd --zone=public --add-port={port}/tcp",
+        check_ec=False,
+    )
+    node.exec_command(
+        sudo=True, cmd=f"fio --server=,{port} --daemonize={FIO_SERVER_PID}"
+    )
+
+
+def stop_fio_server(node):
+    """Stop the fio server of the node, if any."""
+    node.exec_command(
+        sudo=True,
+        cmd=f"test -f {FIO_SERVER_PID} && kill $(cat {FIO_SERVER_PID}); "
+        f"rm -f {FIO_SERVER_PID}",
+        check_ec=False,
+    )
+
+
+def run_fio_on_clients(
+    targets,
+    controller=None,
+    port=FIO_SERVER_PORT,
+    results=None,
+    tags=None,
+    **fio_args,
+):
+    """
+    Run the fio workload on all the targets simultaneously.
+
+    Args:
+        targets: list of dictionaries having the client_node and the target
+                 arguments of run_fio (device_name, filename or image_name
+                 and pool_name), overriding the common fio_args
+        controller: node driving the run, defaults to the first client
+        port: fio server port
+        results: FioResults to add the records to, a new one by default
+        tags: extra columns of the records, like iteration or protocol
+        fio_args: common run_fio arguments like the IO profile
+
+    Returns:
+        FioResults having the records of every client
+
+    Prerequisite: fio package must have been installed on the client nodes.
+    """
+    clients = [target["client_node"] for target in targets]
+    controller = controller or clients[0]
+    results = results if results is not None else FioResults()
+    name = fio_args.get("test_name") or "test-1"
+
+    with parallel() as p:
+        for client in clients:
+            p.spawn(start_fio_server, client, port)
+
+    try:
+        # Local options must precede the --client options
+        output = f"{JOB_DIR}/{name}-clients.json"
+        cmd = ["fio", "--output-format=json", f"--output={output}"]
+        for target in targets:
+            client = target["client_node"]
+            job_args = build_fio_args(**dict(fio_args, **target))
+            job_file = f"{JOB_DIR}/{name}-{client.hostname}.fio"
+
+            _file = controller.remote_file(sudo=True, file_name=job_file, file_mode="w")
+            _file.write(fio_job_file(f"{name}-{client.hostname}", job_args))
+            _file.flush()
+            _file.close()
+            cmd += [f"--client={client.ip_address},{port}", job_file]
+
+        log.info(f"Starting {name} on {len(clients)} clients together")
+        controller.exec_command(
+            sudo=True,
+            cmd=" ".join(cmd),
+            long_running=True,
+            check_ec=True,
+            timeout=fio_args.get("cmd_timeout", 3600),
+        )
+
+        _file = controller.remote_file(sudo=True, file_name=output, file_mode="r")
+        data = _file.read()
+        _file.close()
+
+        # fio prefixes the JSON document with the client connection messages
+        results.add(json.loads(data[data.index("{") :]), **(tags or {}))
+    finally:
+        with parallel() as p:
+            for client in clients:
+                p.spawn(stop_fio_server, client)
+
+    return results
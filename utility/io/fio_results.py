@@ -0,0 +1,295 @@
+"""FIO result model shared by the IO performance tests.
+
+The JSON (and json+) output of FIO is parsed into flat records, one per job and
+IO direction, tagged with details like the client and iteration. The records
+of a run are aggregated across the clients and iterations and written to a
+single columnar results file, so runs of different builds can be compared
+without bespoke parsers.
+
+  Typical usage example:
+
+    fio_results = FioResults()
+    fio_results.load(client, run_fio(**io_args), iteration=1, protocol="nvmeof")
+    ...
+    fio_results.write(f"{test_dir}/run.csv")
+    fio_results.write_summary(f"{test_dir}/run_summary.csv")
+"""
+
+import csv
+import json
+
+import numpy as np
+
+from utility.log import Log
+
+log = Log(__name__)
+
+DIRECTIONS = ("read", "write", "trim")
+PERCENTILES = ("50", "90", "95", "99", "99.9", "99.99")
+
+# Job options reported as record columns
+JOB_OPTIONS = ("rw", "bs", "iodepth", "numjobs", "ioengine")
+
+# bw_kib is the bandwidth of the whole job, bw_mean_kib the mean of the
+# bandwidth samples, which the earlier IO performance reports published
+METRIC_COLUMNS = [
+    "iops",
+    "bw_kib",
+    "bw_mean_kib",
+    "io_bytes",
+    "runtime_ms",
+    "slat_mean_ns",
+    "clat_mean_ns",
+    "lat_mean_ns",
+    "lat_max_ns",
+] + [f"clat_p{p}_ns" for p in PERCENTILES]
+
+
+def _percentile_key(percentile):
+    """Return the key FIO uses for the percentile, e.g. 99.900000."""
+    return f"{float(percentile):f}"
+
+
+def parse_fio_output(data, **tags):
+    """
+    Parse the FIO JSON output into records.
+
+    Args:
+        data: FIO JSON output, either the string or the loaded dictionary
+        tags: extra columns of the records, like client or iteration
+
+    Returns:
+        list of records, one per job and IO direction having IOs
+    """
+    if isinstance(data, str):
+        data = json.loads(data)
+
+    global_options = data.get("global options", {})
+    records = []
+
+    # fio --client runs report the jobs of every server under client_stats
+    # along with an "All clients" entry, which is left to aggregate.
+    jobs = data.get("jobs") or [
+        job for job in data.get("client_stats", []) if job["jobname"] != "All clients"
+    ]
+    for job in jobs:
+        options = dict(global_options, **job.get("job options", {}))
+        for direction in DIRECTIONS:
+            stats = job.get(direction)
+            if not stats or not stats.get("io_bytes"):
+                continue
+
+            clat = stats.get("clat_ns", {})
+            percentiles = clat.get("percentile", {})
+            record = dict(tags)
+            if job.get("hostname"):
+                record["client"] = job["hostname"]
+            record.update(
+                {
+                    "jobname": job["jobname"],
+                    "direction": direction,
+                    "iops": stats["iops"],
+                    "bw_kib": stats["bw"],
+                    "bw_mean_kib": stats.get("bw_mean"),
+                    "io_bytes": stats["io_bytes"],
+                    "runtime_ms": stats["runtime"],
+                    "slat_mean_ns": stats.get("slat_ns", {}).get("mean"),
+                    "clat_mean_ns": clat.get("mean"),
+                    "lat_mean_ns": stats.get("lat_ns", {}).get("mean"),
+                    "lat_max_ns": stats.get("lat_ns", {}).get("max"),
+                    # Latency histogram, available with --output-format=json+
+                    "clat_bins": clat.get("bins"),
+                    "options": options,
+                }
+            )
+            record.update({opt: options.get(opt) for opt in JOB_OPTIONS})
+            for p in PERCENTILES:
+                record[f"clat_p{p}_ns"] = percentiles.get(_percentile_key(p))
+
+            records.append(record)
+
+    return records
+
+
+def histogram_percentiles(bins_list, percentiles=PERCENTILES):
+    """
+    Compute the percentiles of the merged latency histograms.
+
+    Args:
+        bins_list: FIO clat_ns bins, {"<latency ns>": count}, of every job
+        percentiles: percentiles to compute
+
+    Returns:
+        dictionary of the latency in ns keyed by percentile
+    """
+    merged = {}
+    for bins in bins_list:
+        for latency, count in bins.items():
+            merged[int(latency)] = merged.get(int(latency), 0) + count
+
+    latencies = np.array(sorted(merged), dtype=np.int64)
+    counts = np.array([merged[lat] for lat in latencies], dtype=np.float64)
+    cdf = np.cumsum(counts) / counts.sum()
+    return {
+        p: int(latencies[min(np.searchsorted(cdf, float(p) / 100), len(cdf) - 1)])
+        for p in percentiles
+    }
+
+
+class FioResults:
+    """Collection of FIO records of a run."""
+
+    def __init__(self):
+        self.records = []
+
+    def add(self, data, **tags):
+        """
+        Add the records of the FIO output.
+
+        Args:
+            data: FIO JSON output, either the string or the loaded dictionary
+            tags: extra columns of the records, like client or iteration
+        """
+        records = parse_fio_output(data, **tags)
+        self.records.extend(records)
+        return records
+
+    def load(self, node, path, **tags):
+        """
+        Read the FIO output file from the node and add its records.
+
+        Args:
+            node: node on which FIO was executed
+            path: FIO output file path on the node
+            tags: extra columns of the records, the client defaults to the node
+        """
+        tags.setdefault("client", node.hostname)
+        _file = node.remote_file(file_name=path, file_mode="r")
+        try:
+            return self.add(_file.read(), **tags)
+        finally:
+            _file.close()
+
+    @property
+    def columns(self):
+        """Return the record columns, tags first."""
+        known = ["jobname", "direction"] + list(JOB_OPTIONS) + METRIC_COLUMNS
+        tags = []
+        for record in self.records:
+            for key in record:
+                if key not in known + ["clat_bins", "options"] and key not in tags:
+                    tags.append(key)
+
+        return tags + known
+
+    def aggregate(self, group_by=("rw", "direction", "bs", "iodepth", "numjobs")):
+        """
+        Aggregate the records across the clients and iterations.
+
+        The IOPS and bandwidth of the clients are summed per iteration and the
+        mean latencies are weighted by the client IOPS. The clat percentiles
+        are computed from the merged histograms when every record has one,
+        otherwise the worst client percentile is reported.
+
+        Args:
+            group_by: record columns identifying a workload
+
+        Returns:
+            list of summary rows having the mean, std, min and max of the
+            iteration totals along with the latency metrics
+        """
+        groups = {}
+        for record in self.records:
+            key = tuple(record.get(col) for col in group_by)
+            groups.setdefault(key, []).append(record)
+
+        summary = []
+        for key, records in groups.items():
+            iterations = {}
+            for record in records:
+                iterations.setdefault(record.get("iteration"), []).append(record)
+
+            iops = np.array(
+                [sum(r["iops"] for r in recs) for recs in iterations.values()]
+            )
+            bw = np.array(
+                [sum(r["bw_kib"] for r in recs) for recs in iterations.values()]
+            )
+            weights = np.array([r["iops"] for r in records], dtype=np.float64)
+            if not weights.sum():
+                weights = None
+
+            row = dict(zip(group_by, key))
+            row.update({"clients": len({r.get("client") for r in records})})
+            row.update({"iterations": len(iterations)})
+            for name, values in (("iops", iops), ("bw_kib", bw)):
+                row.update(
+                    {
+                        f"{name}_mean": float(np.mean(values)),
+                        f"{name}_std": float(np.std(values)),
+                        f"{name}_min": float(np.min(values)),
+                        f"{name}_max": float(np.max(values)),
+                    }
+                )
+
+            for metric in ("slat_mean_ns", "clat_mean_ns", "lat_mean_ns"):
+                values = np.array(
+                    [r[metric] if r[metric] is not None else np.nan for r in records]
+                )
+                row[metric] = (
+                    None
+                    if np.isnan(values).all()
+                    else float(
+                        np.ma.average(np.ma.masked_invalid(values), weights=weights)
+                    )
+                )
+
+            if all(r["clat_bins"] for r in records):
+                merged = histogram_percentiles([r["clat_bins"] for r in records])
+                row.update({f"clat_p{p}_ns": merged[p] for p in PERCENTILES})
+            else:
+                for p in PERCENTILES:
+                    values = [r[f"clat_p{p}_ns"] for r in records if r[f"clat_p{p}_ns"]]
+                    row[f"clat_p{p}_ns"] = max(values) if values else None
+
+            summary.append(row)
+
+        return summary
+
+    @staticmethod
+    def _write_rows(path, rows, columns):
+        if path.endswith(".parquet"):
+            # Parquet output is optional, pyarrow is not a cephci dependency
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+
+            table = pa.table({col: [row.get(col) for row in rows] for col in columns})
+            pq.write_table(table, path)
+        else:
+            with open(path, "w", newline="") as fh:
+                writer = csv.DictWriter(fh, fieldnames=columns, extrasaction="ignore")
+                writer.writeheader()
+                writer.writerows(rows)
+
+        log.info(f"FIO results located here: {path}")
+        return path
+
+    def write(self, path):
+        """
+        Write the records to a CSV file, or Parquet when the path ends with .parquet.
+
+        Args:
+            path: results file path
+        """
+        return self._write_rows(path, self.records, self.columns)
+
+    def write_summary(self, path, **kwargs):
+        """
+        Write the aggregated records, see aggregate for the supported arguments.
+
+        Args:
+            path: summary file path, CSV or Parquet like write
+        """
+        rows = self.aggregate(**kwargs)
+        columns = list(rows[0]) if rows else []
+        return self._write_rows(path, rows, columns)
@@ -0,0 +1,47 @@
+"""Deferred import of the heavy optional dependencies.
+
+Cloud SDKs and reporting clients take hundreds of milliseconds to import and
+most runs use only a few of them, hence they are imported on first use.
+
+  Typical usage example:
+
+    ibm_vpc = lazy_import("ibm_vpc")
+    ...
+    service = ibm_vpc.VpcV1(authenticator=authenticator)
+"""
+
+from importlib import import_module
+
+
+class LazyModule:
+    """Proxy of a module imported on the first attribute access."""
+
+    def __init__(self, name):
+        self._name = name
+        self._module = None
+
+    def _load(self):
+        if self._module is None:
+            self._module = import_module(self._name)
+
+        return self._module
+
+    def __getattr__(self, attr):
+        return getattr(self._load(), attr)
+
+    def __dir__(self):
+        return dir(self._load())
+
+    def __repr__(self):
+        state = "loaded" if self._module else "not loaded"
+        return f"<lazy module '{self._name}' ({state})>"
+
+
+def lazy_import(name):
+    """
+    Return the module, imported when one of its attributes is accessed.
+
+    Args:
+        name: absolute module name like ibm_vpc or distutils.version
+    """
+    return LazyModule(name)
@@ -18,11 +18,14 @@ Along with the above, it provides support for pushing events to
 Initial Log format will be 'datetime - level - message'
 later updating log format with 'datetime - level -filename:line_number - message'
 """
+
 import inspect
 import logging
 import logging.handlers
 import os
+from contextlib import contextmanager
 from copy import deepcopy
+from threading import local
 from typing import Any, Dict
 
 from .config import TestMetaData
@@ -32,6 +35,37 @@ magna_server = "http://magna002.ceph.redhat.com"
 magna_url = f"{magna_server}/cephci-jenkins/"
 
 
+# Name of the test being executed by the current greenlet or thread
+_context = local()
+
+
+def current_test():
+    """Return the name of the test executed by the caller, if known."""
+    return getattr(_context, "test_name", None)
+
+
+@contextmanager
+def test_context(test_name):
+    """Attribute the records logged within the block to the given test."""
+    previous = current_test()
+    _context.test_name = test_name
+    try:
+        yield
+    finally:
+        _context.test_name = previous
+
+
+class TestLogFilter(logging.Filter):
+    """Pass the records of the given test and the ones not tied to any test."""
+
+    def __init__(self, test_name):
+        super().__init__()
+        self.test_name = test_name
+
+    def filter(self, record):
+        return current_test() in (None, self.test_name)
+
+
 class LoggerInitializationException:
     pass
 
@@ -215,6 +249,41 @@ class Log:
             )
             return None
         self.close_and_remove_filehandlers()
+        log_url, _ = self._add_file_handlers(test_name, run_dir, disable_console_log)
+        return log_url
+
+    def configure_test_logger(self, test_name, run_dir, disable_console_log):
+        """
+        Configures the FileHandlers of a test running along with other tests.
+
+        Unlike configure_logger, the handlers of the other tests are retained
+        and only the records logged within the test_context of the test and
+        the ones not tied to any test are written to its files.
+
+        Args:
+            test_name: name of the test being executed. used for naming the logfile
+            run_dir: directory where logs are being placed
+        Returns:
+            tuple of the log file URL, None if the run_dir does not exist, and
+            the handlers to be passed to remove_handlers at the end of the test
+        """
+        if not os.path.isdir(run_dir):
+            self._logger.error(
+                f"Run directory '{run_dir}' does not exist, logs will not output to file."
+            )
+            return None, []
+
+        return self._add_file_handlers(
+            test_name, run_dir, disable_console_log, TestLogFilter(test_name)
+        )
+
+    def remove_handlers(self, handlers):
+        """Close the given handlers and remove them from the logger."""
+        for handler in handlers:
+            handler.close()
+            self._logger.removeHandler(handler)
+
+    def _add_file_handlers(self, test_name, run_dir, disable_console_log, _filter=None):
         log_format = logging.Formatter(self.log_format)
         full_log_name = f"{test_name}.log"
         test_logfile = os.path.join(run_dir, full_log_name)
@@ -228,13 +297,16 @@ class Log:
             backupCount=20,  # Keep up to 20 old log files which will be 200 MB per test case
         )
         _handler.setFormatter(log_format)
-        self._logger.addHandler(_handler)
         # error file handler
         err_logfile = os.path.join(run_dir, f"{test_name}.err")
         _err_handler = logging.FileHandler(err_logfile)
         _err_handler.setFormatter(log_format)
         _err_handler.setLevel(logging.ERROR)
-        self._logger.addHandler(_err_handler)
+        handlers = [_handler, _err_handler]
+        for handler in handlers:
+            if _filter:
+                handler.addFilter(_filter)
+            self._logger.addHandler(handler)
 
         url_base = (
             magna_url + run_dir.split("/")[-1]
@@ -244,7 +316,7 @@ class Log:
         log_url = f"{url_base}/{full_log_name}"
         self.debug("Completed log configuration")
 
-        return log_url
+        return log_url, handlers
 
     def close_and_remove_filehandlers(self):
         """
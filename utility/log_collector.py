@@ -0,0 +1,212 @@
+"""Collect the sosreports and ceph logs of the cluster nodes concurrently.
+
+The artifacts are streamed back over the SSH connections of the nodes without
+staging them on the installer,
+
+1. sosreport archives are generated on all the nodes at once and read back.
+2. /var/log/ceph is streamed as a compressed tar and extracted on the fly, the
+   files having the same content across the nodes are hard linked instead of
+   being stored again.
+
+  Typical usage example:
+
+    collect_logs(ceph_cluster_dict, run_dir)
+"""
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import tarfile
+from tempfile import NamedTemporaryFile
+from time import time
+
+from ceph.parallel import parallel
+from utility.log import Log
+from utility.utils import setup_cluster_access
+
+log = Log(__name__)
+
+CEPH_LOG_DIR = "/var/log/ceph"
+SOSREPORT_CMD = "sos report -a --all-logs --batch"
+SOSREPORT_PATTERN = re.compile(r"/var/tmp/sosreport-\S+\.tar\.xz")
+
+# GNU tar exits with 1 when a file changed while being archived
+TAR_FILES_CHANGED = 1
+
+
+class Deduplicator:
+    """Content addressed registry of the collected files."""
+
+    def __init__(self):
+        self.files = dict()
+        self.saved_bytes = 0
+
+    def store(self, src, dst):
+        """
+        Write the file object to dst, hard linking a known copy when one exists.
+
+        Args:
+            src: readable file object
+            dst: destination path
+        """
+        digest = hashlib.sha256()
+        with NamedTemporaryFile(dir=os.path.dirname(dst), delete=False) as tmp:
+            for chunk in iter(lambda: src.read(1024 * 1024), b""):
+                digest.update(chunk)
+                tmp.write(chunk)
+
+        known = self.files.get(digest.hexdigest())
+        if known:
+            self.saved_bytes += os.path.getsize(tmp.name)
+            os.remove(tmp.name)
+            os.link(known, dst)
+            return
+
+        os.replace(tmp.name, dst)
+        self.files[digest.hexdigest()] = dst
+
+
+def collect_sosreport(node, directory):
+    """
+    Generate the sosreport on the node and stream it to the given directory.
+
+    Args:
+        node: CephNode object
+        directory: local directory to store the report
+
+    Returns:
+        local path of the report
+    """
+    node.exec_command(sudo=True, cmd="yum -y install sos", check_ec=False)
+    out, _ = node.exec_command(sudo=True, cmd=SOSREPORT_CMD, timeout=1800)
+    report = SOSREPORT_PATTERN.search(out)
+    if not report:
+        raise RuntimeError(f"Failed to generate sosreport on {node.hostname}")
+
+    report = report.group()
+    dst = os.path.join(directory, os.path.basename(report))
+    try:
+        with open(dst, "wb") as fh:
+            _, rc = node.stream_command(
+                f"cat {report}", lambda out: shutil.copyfileobj(out, fh), sudo=True
+            )
+    finally:
+        node.exec_command(sudo=True, cmd=f"rm -f {report}*", check_ec=False)
+
+    if rc:
+        raise RuntimeError(f"Failed to read {report} from {node.hostname}")
+
+    return dst
+
+
+def collect_ceph_logs(node, directory, dedup):
+    """
+    Stream /var/log/ceph of the node as a compressed tar and extract it locally.
+
+    Args:
+        node: CephNode object
+        directory: local directory to extract the logs into
+        dedup: Deduplicator shared by the nodes
+
+    Returns:
+        number of files collected
+    """
+
+    def extract(stream):
+        count = 0
+        with tarfile.open(fileobj=stream, mode="r|gz") as archive:
+            for member in archive:
+                path = os.path.realpath(os.path.join(directory, member.name))
+                if not path.startswith(os.path.realpath(directory) + os.sep):
+                    continue
+
+                if member.isdir():
+                    os.makedirs(path, exist_ok=True)
+                elif member.isfile():
+                    os.makedirs(os.path.dirname(path), exist_ok=True)
+                    dedup.store(archive.extractfile(member), path)
+                    count += 1
+
+        return count
+
+    cmd = f"tar --warning=no-file-changed -czf - -C {CEPH_LOG_DIR} ."
+    count, rc = node.stream_command(cmd, extract, sudo=True)
+    if rc not in (0, TAR_FILES_CHANGED):
+        raise RuntimeError(f"Failed to archive {CEPH_LOG_DIR} on {node.hostname}")
+
+    return count
+
+
+def _collect_node(cluster, node, run_dir, sosreport, dedup):
+    """Collect the artifacts of a single node, returns the per step durations."""
+    report = {"cluster": cluster.name, "errors": []}
+    steps = [
+        ("setup", lambda: setup_cluster_access(cluster, node)),
+        (
+            "ceph_logs",
+            lambda: collect_ceph_logs(
+                node, os.path.join(run_dir, "ceph_logs", node.hostname), dedup
+            ),
+        ),
+    ]
+    if sosreport:
+        steps.insert(
+            1,
+            (
+                "sosreport",
+                lambda: collect_sosreport(node, os.path.join(run_dir, "sosreports")),
+            ),
+        )
+
+    for step, method in steps:
+        start = time()
+        try:
+            method()
+        except Exception as err:  # noqa
+            log.error(f"Failed to collect {step} from {node.hostname}: {err}")
+            report["errors"].append(f"{step}: {err}")
+        report[step] = round(time() - start, 3)
+
+    return node.hostname, report
+
+
+def collect_logs(ceph_cluster_dict, run_dir, sosreport=True, max_workers=None):
+    """
+    Collect the sosreports and ceph logs of all the cluster nodes concurrently.
+
+    The per node collection time is logged and written to log_collection.json
+    of the run directory.
+
+    Args:
+        ceph_cluster_dict: clusters participating in the run
+        run_dir: run directory to store the artifacts
+        sosreport: generate sosreports along with the ceph logs
+        max_workers: maximum number of nodes processed at once
+
+    Returns:
+        dictionary of the per node collection report
+    """
+    os.makedirs(os.path.join(run_dir, "sosreports"), exist_ok=True)
+    dedup = Deduplicator()
+    start = time()
+
+    with parallel(max_workers=max_workers) as p:
+        for cluster in ceph_cluster_dict.values():
+            for node in cluster.get_nodes():
+                p.spawn(_collect_node, cluster, node, run_dir, sosreport, dedup)
+
+        reports = dict(p)
+
+    for hostname, report in reports.items():
+        log.info(f"Log collection of {hostname}: {report}")
+
+    log.info(
+        f"Collected logs of {len(reports)} nodes in {round(time() - start, 3)} seconds, "
+        f"deduplication saved {dedup.saved_bytes} bytes"
+    )
+    with open(os.path.join(run_dir, "log_collection.json"), "w") as fh:
+        json.dump(reports, fh, indent=4)
+
+    return reports
@@ -0,0 +1,149 @@
+"""Resolve the test modules of the suites to their files.
+
+The suites refer to the test modules by their file name, e.g. test_cephadm.py,
+and the tests import their sibling modules by name. Instead of appending the
+test directories to sys.path, which is searched for every import made by the
+tests and their dependencies, the module files are indexed once and found
+using a meta path finder consulted after the regular ones.
+
+  Typical usage example:
+
+    resolver = ModuleResolver()
+    resolver.install()
+    test_mod = resolver.load("test_cephadm.py")
+"""
+
+import os
+import sys
+from importlib import import_module
+from importlib.abc import MetaPathFinder
+from importlib.machinery import ModuleSpec
+from importlib.util import spec_from_file_location
+
+# Directories of the test modules, in the order of precedence
+TEST_DIRS = [
+    "tests",
+    "tests/rados",
+    "tests/cephadm",
+    "tests/rbd",
+    "tests/rbd/rest",
+    "tests/rbd_mirror",
+    "tests/cephfs",
+    "tests/iscsi",
+    "tests/rgw",
+    "tests/ceph_ansible",
+    "tests/ceph_installer",
+    "tests/mgr",
+    "tests/dashboard",
+    "tests/misc_env",
+    "tests/parallel",
+    "tests/upgrades",
+    "tests/ceph_volume",
+    "tests/nvmeof",
+    "tests/nvmeof/rest",
+    "tests/nfs",
+    "tests/smb",
+]
+
+
+class ModuleResolver(MetaPathFinder):
+    """Index of the top level modules and packages of the test directories.
+
+    Directories without __init__.py are namespace packages, like they were
+    when the test directories were on sys.path, their portions in every test
+    directory are merged.
+    """
+
+    def __init__(self, test_dirs=None, base_dir=None):
+        base_dir = os.path.abspath(base_dir or os.getcwd())
+        self.modules = dict()
+        self.namespaces = dict()
+        for test_dir in test_dirs or TEST_DIRS:
+            test_dir = os.path.join(base_dir, test_dir)
+            if not os.path.isdir(test_dir):
+                continue
+
+            for entry in sorted(os.listdir(test_dir)):
+                path = os.path.join(test_dir, entry)
+                name, ext = os.path.splitext(entry)
+                if ext == ".py" and name != "__init__":
+                    self.modules.setdefault(name, path)
+                elif not os.path.isdir(path) or not entry.isidentifier():
+                    continue
+                elif os.path.isfile(os.path.join(path, "__init__.py")):
+                    self.modules.setdefault(entry, path)
+                else:
+                    self.namespaces.setdefault(entry, []).append(path)
+
+        # regular modules and packages take precedence over namespace packages
+        for name in self.modules:
+            self.namespaces.pop(name, None)
+
+    def install(self):
+        """Resolve the test modules imported by name after the regular finders."""
+        if self not in sys.meta_path:
+            sys.meta_path.append(self)
+
+    def uninstall(self):
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def resolve(self, module):
+        """
+        Return the file of the suite module.
+
+        Args:
+            module: module name or file name as given in the suite
+
+        Returns:
+            path of the module file or package directory, None when not found
+        """
+        top, *parts = os.path.splitext(module)[0].split(".")
+        if top in self.modules:
+            locations = [self.modules[top]]
+        else:
+            locations = self.namespaces.get(top, [])
+
+        for location in locations:
+            path = os.path.join(location, *parts)
+            if not parts or os.path.isdir(path):
+                return path
+            if os.path.isfile(f"{path}.py"):
+                return f"{path}.py"
+
+        return None
+
+    def find_spec(self, fullname, path, target=None):
+        if path is not None:
+            return None
+
+        if fullname in self.namespaces:
+            spec = ModuleSpec(fullname, None, is_package=True)
+            spec.submodule_search_locations = list(self.namespaces[fullname])
+            return spec
+
+        if fullname not in self.modules:
+            return None
+
+        location = self.modules[fullname]
+        if os.path.isdir(location):
+            return spec_from_file_location(
+                fullname,
+                os.path.join(location, "__init__.py"),
+                submodule_search_locations=[location],
+            )
+
+        return spec_from_file_location(fullname, location)
+
+    def load(self, module):
+        """
+        Import the suite module.
+
+        Args:
+            module: module name or file name as given in the suite
+
+        Returns:
+            the imported module
+        """
+        self.install()
+        return import_module(os.path.splitext(module)[0])
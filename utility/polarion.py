@@ -10,81 +10,133 @@ from utility.utils import get_cephci_config
 log = logging.getLogger(__name__)
 
 
-def post_to_polarion(tc):
+class PolarionPublishError(Exception):
+    pass
+
+
+def polarion_records(tc):
     """
-    Function to post test results polarion
-    It returns nothing and is essentially like noop
-    in case of no polarion details found in test object
+    Build the polarion importer records of the test case, one per polarion id.
+
+    The test case object is not modified and the records only hold the
+    strings required by the importer template.
 
     Args:
        tc: test case object with details
 
     Returns:
-      None
+      list of records, empty when the test case can't be posted
     """
-    current_dir = os.getcwd()
-    polarion_cred = get_cephci_config()["polarion"]
+    if tc["polarion-id"] is None:
+        return []
+
+    if tc["desc"] is None:
+        log.info("cannot update polarion with no description")
+        return []
 
-    if tc["polarion-id"] is not None:
-        # add polarion attributes
-        ids = tc["polarion-id"].split(",")
-        tc["space"] = "Smoke Suite"
-        tc["test_run_id"] = (
-            tc["ceph-version"]
-            + "_"
-            + tc["suite-name"].split("/")[-1].split(".")[0]
-            + "_"
-            + tc["distro"]
-            + "_Automated_Smoke_Runs"
+    test_run_id = (
+        tc["ceph-version"]
+        + "_"
+        + tc["suite-name"].split("/")[-1].split(".")[0]
+        + "_"
+        + tc["distro"]
+        + "_Automated_Smoke_Runs"
+    ).replace(".", "_")
+    ceph_build = "_".join(
+        [
+            _f
+            for _f in [tc["ceph-version"], tc["ceph-ansible-version"], tc["compose-id"]]
+            if _f
+        ]
+    )
+    docker_container = ""
+    if tc.get("docker-containers-list"):
+        docker_container = "\ncontainer: {container}".format(
+            container=",".join(list(set(tc.get("docker-containers-list"))))
         )
-        tc["test_run_id"] = tc["test_run_id"].replace(".", "_")
-        log.info("Updating test run: %s " % tc["test_run_id"])
-        tc["ceph-build"] = "_".join(
-            [
-                _f
-                for _f in [
-                    tc["ceph-version"],
-                    tc["ceph-ansible-version"],
-                    tc["compose-id"],
-                ]
-                if _f
-            ]
+
+    result = ""
+    if tc["status"] != "Pass":
+        result = '<failure message="test failed" type="failure"/>'
+
+    return [
+        {
+            "name": tc["name"],
+            "polarion-id": id,
+            "test_run_id": test_run_id,
+            "ceph-build": ceph_build,
+            "docker-container": docker_container,
+            "test_case_title": tc["desc"],
+            "result": result,
+        }
+        for id in tc["polarion-id"].split(",")
+    ]
+
+
+def submit_to_polarion(records):
+    """
+    Post the records to polarion, a single request is made per test run.
+
+    Args:
+       records: polarion records built using polarion_records
+
+    Raises:
+      PolarionPublishError: when the importer request fails
+    """
+    polarion_cred = get_cephci_config()["polarion"]
+    template_dir = os.path.join(os.getcwd(), "templates")
+    j2_env = Environment(loader=FileSystemLoader(template_dir), trim_blocks=True)
+
+    test_runs = dict()
+    for record in records:
+        key = (record["test_run_id"], record["ceph-build"], record["docker-container"])
+        test_runs.setdefault(key, []).append(record)
+
+    for tcs in test_runs.values():
+        log.info(
+            "Updating test run: %s with results of %s"
+            % (tcs[0]["test_run_id"], ",".join(tc["polarion-id"] for tc in tcs))
         )
-        if tc.get("docker-containers-list"):
-            tc["docker-container"] = "\ncontainer: {container}".format(
-                container=",".join(list(set(tc.get("docker-containers-list"))))
-            )
-        tc["test_case_title"] = tc["desc"]
-        if tc["desc"] is None:
-            log.info("cannot update polarion with no description")
-            return
-        if tc["status"] == "Pass":
-            tc["result"] = ""
-        else:
-            tc["result"] = '<failure message="test failed" type="failure"/>'
-        current_dir += "/templates/"
-        j2_env = Environment(loader=FileSystemLoader(current_dir), trim_blocks=True)
-        for id in ids:
-            tc["polarion-id"] = id
-            f = NamedTemporaryFile(delete=False)
-            test_results = j2_env.get_template("importer-template.xml").render(tc=tc)
-            log.info("updating results for %s " % id)
+        test_results = j2_env.get_template("importer-template.xml").render(tcs=tcs)
+        with NamedTemporaryFile(suffix=".xml") as f:
             f.write(test_results.encode())
-            f.close()
-            url = polarion_cred.get("url")
-            user = polarion_cred.get("username")
-            pwd = polarion_cred.get("password")
-            call(
+            f.flush()
+            rc = call(
                 [
                     "curl",
                     "-k",
+                    "--fail",
                     "-u",
-                    "{user}:{pwd}".format(user=user, pwd=pwd),
+                    "{user}:{pwd}".format(
+                        user=polarion_cred.get("username"),
+                        pwd=polarion_cred.get("password"),
+                    ),
                     "-X",
                     "POST",
                     "-F",
                     "file=@{name}".format(name=f.name),
-                    url,
+                    polarion_cred.get("url"),
                 ]
             )
-            os.unlink(f.name)
+
+        if rc:
+            raise PolarionPublishError(
+                "Polarion import of %s failed with %s" % (tcs[0]["test_run_id"], rc)
+            )
+
+
+def post_to_polarion(tc):
+    """
+    Function to post test results polarion
+    It returns nothing and is essentially like noop
+    in case of no polarion details found in test object
+
+    Args:
+       tc: test case object with details
+
+    Returns:
+      None
+    """
+    records = polarion_records(tc)
+    if records:
+        submit_to_polarion(records)
@@ -0,0 +1,161 @@
+"""Background publisher of the test results.
+
+Reporting services like Polarion are slow at times, hence the results are
+queued on disk and submitted by a background worker instead of blocking the
+test execution,
+
+1. Every published record is written to the queue directory of the run
+   first and removed once submitted, hence the log directory of the run
+   keeps the records not submitted, e.g. when the run is interrupted.
+2. Records queued while a submission is in progress are submitted together,
+   the handler of the record kind receives the whole batch.
+3. Failed submissions are retried with exponential backoff and kept on disk
+   when all the attempts fail.
+
+  Typical usage example:
+
+    publisher = ResultPublisher(os.path.join(run_dir, "publish_queue"))
+    publisher.publish("polarion", polarion_records(tc))
+    ...
+    publisher.close()
+"""
+
+import json
+import os
+import queue
+import threading
+from itertools import count
+from time import time
+
+from utility.log import Log
+from utility.polarion import submit_to_polarion
+from utility.retry import retry
+from utility.utils import email_results
+
+log = Log(__name__)
+
+
+def _send_emails(payloads):
+    for test_result in payloads:
+        email_results(test_result=test_result)
+
+
+def _post_to_polarion(payloads):
+    submit_to_polarion([record for records in payloads for record in records])
+
+
+DEFAULT_HANDLERS = {"email": _send_emails, "polarion": _post_to_polarion}
+
+
+class ResultPublisher:
+    """Persistent queue of test results submitted by a background thread."""
+
+    def __init__(
+        self, queue_dir, handlers=None, batch_size=25, tries=5, delay=5, backoff=2
+    ):
+        """
+        Initialize and start the publisher.
+
+        Args:
+            queue_dir: directory to persist the queued records
+            handlers: callables submitting a list of payloads, keyed by record kind
+            batch_size: maximum number of records submitted at once
+            tries: number of attempts made for a batch
+            delay: initial delay between the attempts in seconds
+            backoff: multiplier of the delay after every failed attempt
+        """
+        self.queue_dir = queue_dir
+        self.handlers = handlers or DEFAULT_HANDLERS
+        self.batch_size = batch_size
+        self.retry = retry(Exception, tries=tries, delay=delay, backoff=backoff)
+        self.stats = {"published": 0, "submitted": 0, "batches": 0, "failed": 0}
+
+        self._queue = queue.Queue()
+        self._seq = count()
+        self._stopping = False
+
+        os.makedirs(queue_dir, exist_ok=True)
+        self._thread = threading.Thread(target=self._worker, daemon=True)
+        self._thread.start()
+
+    def publish(self, kind, payload):
+        """
+        Queue the payload for submission, returns without waiting for it.
+
+        Args:
+            kind: record kind, one of the handler keys
+            payload: JSON serializable data passed to the handler
+        """
+        if kind not in self.handlers:
+            raise ValueError(f"No handler registered for {kind} results")
+
+        name = f"{time():.6f}-{next(self._seq):06d}-{kind}.json"
+        path = os.path.join(self.queue_dir, name)
+        with open(path, "w") as fh:
+            json.dump({"kind": kind, "payload": payload}, fh, default=str)
+
+        self.stats["published"] += 1
+        self._queue.put(path)
+
+    def _worker(self):
+        while True:
+            path = self._queue.get()
+            if path is None:
+                return
+
+            batch = [path]
+            while len(batch) < self.batch_size:
+                try:
+                    path = self._queue.get_nowait()
+                except queue.Empty:
+                    break
+
+                if path is None:
+                    self._queue.put(None)
+                    break
+                batch.append(path)
+
+            self._submit(batch)
+
+    def _submit(self, batch):
+        """Submit the queued records grouped by their kind."""
+        records = dict()
+        for path in batch:
+            with open(path) as fh:
+                record = json.load(fh)
+            records.setdefault(record["kind"], []).append((path, record["payload"]))
+
+        for kind, items in records.items():
+            paths, payloads = zip(*items)
+            try:
+                self.retry(self.handlers[kind])(list(payloads))
+            except Exception as err:  # noqa
+                log.error(
+                    f"Failed to submit {len(payloads)} {kind} results, "
+                    f"they are kept in {self.queue_dir}: {err}"
+                )
+                self.stats["failed"] += len(payloads)
+                continue
+
+            for path in paths:
+                os.remove(path)
+            self.stats["submitted"] += len(payloads)
+            self.stats["batches"] += 1
+
+    def close(self, timeout=None):
+        """
+        Wait for the queued records to be submitted and stop the worker.
+
+        Args:
+            timeout: maximum time to wait in seconds, waits till done when None
+        """
+        if self._stopping:
+            return
+
+        self._stopping = True
+        self._queue.put(None)
+        self._thread.join(timeout)
+        if self._thread.is_alive():
+            log.warning(f"Results are still pending submission in {self.queue_dir}")
+
+        log.info(f"Result publisher statistics: {self.stats}")
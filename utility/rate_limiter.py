@@ -0,0 +1,81 @@
+"""Token bucket rate limiter for throttling calls to external services."""
+
+import threading
+import time
+
+from utility.log import Log
+
+log = Log(__name__)
+
+
+class TokenBucket:
+    """
+    Allows a burst of calls followed by a sustained rate of calls.
+
+    The bucket holds at most ``burst`` tokens and is refilled at ``rate`` tokens
+    per second. Every call consumes a token and waits when the bucket is empty,
+    hence concurrent callers are spread over time instead of hitting the service
+    together.
+
+    Example::
+
+        limiter = TokenBucket(rate=0.5, burst=3)
+        with parallel() as p:
+            for node in nodes:
+                p.spawn(create_vm, node, rate_limiter=limiter)
+
+        def create_vm(node, rate_limiter):
+            rate_limiter.acquire()
+            ...
+    """
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        """
+        Initialize the bucket, it starts full.
+
+        Args:
+            rate: number of tokens added per second.
+            burst: maximum number of tokens held by the bucket.
+        """
+        if rate <= 0 or burst < 1:
+            raise ValueError("rate must be positive and burst at least 1")
+
+        self.rate = rate
+        self.burst = burst
+        self._tokens = float(burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def try_acquire(self) -> bool:
+        """Consume a token if available, returns False otherwise."""
+        with self._lock:
+            self._refill()
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+
+            return False
+
+    def acquire(self) -> float:
+        """
+        Consume a token, waiting till one is available.
+
+        Returns:
+            time spent waiting in seconds
+        """
+        start = time.monotonic()
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return time.monotonic() - start
+
+                wait = (1 - self._tokens) / self.rate
+
+            time.sleep(wait)
@@ -16,6 +16,8 @@ import sys
 import paramiko
 from docopt import docopt
 
+from ceph.parallel import parallel
+
 doc = """
 Standard script to collect all the logs from ceph cluster
 
@@ -65,9 +67,7 @@ def generate_sosreport_in_node(
         source_file = f"/var/tmp/{sosreport.group()}"
         ssh_d.exec_command(f"sudo chown {uname} {source_file}")
         directory_path = os.path.join(directory, "sosreports")
-        dir_exist = os.path.exists(directory_path)
-        if not dir_exist:
-            os.makedirs(directory_path)
+        os.makedirs(directory_path, exist_ok=True)
         ftp_client = ssh_d.open_sftp()
         ftp_client.get(f"{source_file}", f"{directory_path}/{sosreport.group()}")
         ftp_client.close()
@@ -83,8 +83,8 @@ def generate_sosreport_in_node(
 def run(installer_ip: str, uname: str, pword: str, directory: str) -> int:
     """Standard script to collect all the logs from ceph cluster
 
-    Through installer node get all other nodes in the cluster, generate sosreport for all the nodes obtained.
-    then upload all the collected logs to given directory
+    Through installer node get all other nodes in the cluster, generate sosreport for all the nodes obtained
+    concurrently, then upload all the collected logs to given directory
 
     Args:
        installer_ip   installer IP address
@@ -112,9 +112,13 @@ def run(installer_ip: str, uname: str, pword: str, directory: str) -> int:
     nodes = stdout.read().decode().split("\n")
 
     print(f"Host that are obtained from given host: {nodes}")
-    for nodeip in nodes:
-        if nodeip:
-            generate_sosreport_in_node(nodeip, uname, pword, directory, results)
+    # The script runs without gevent patching, hence threads are used
+    with parallel(backend="thread") as p:
+        for nodeip in nodes:
+            if nodeip:
+                p.spawn(
+                    generate_sosreport_in_node, nodeip, uname, pword, directory, results
+                )
     print(f"\n\nFailed to collect logs from nodes :{results}")
     return 1 if results else 0
 
@@ -0,0 +1,212 @@
+"""
+Plan the pipeline stages using the historical duration of the suites.
+
+The stage tags of the metadata files group the suites by hand, hence a stage
+lasts as long as its slowest suite and the number of VMs created at once has
+no relation to the cloud quota. The scheduler instead,
+
+1. estimates the duration of every suite from the run_summary.json and
+   xunit.xml files of the past runs, falling back to the execution_time of
+   the metadata and then to DEFAULT_DURATION.
+2. counts the VMs required by the suite from its global configuration file.
+3. packs the suites, longest first, into waves having at most the given
+   number of VMs and vCPUs. Waves run one after the other like the stages,
+   hence suites of similar duration are grouped to minimize the total time.
+
+Every stage of the pipeline fetches its suites separately, hence the waves
+are planned once and saved to a plan file read by the later stages, the
+history growing in between would otherwise move the suites across waves.
+
+  Typical usage example:
+
+    history = load_history(["/ceph/cephci-jenkins/results"])
+    waves = plan_waves(suites, history, max_nodes=40)
+    save_plan("stage_plan.json", waves)
+    waves = load_plan("stage_plan.json", suites)
+"""
+
+import json
+import os
+import re
+import xml.etree.ElementTree as ET
+from glob import iglob
+from statistics import median
+
+import yaml
+
+REPO_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+# Assumed duration of a suite having no history, in seconds
+DEFAULT_DURATION = 3600
+
+# vCPUs of a node not specifying the cpu count in its configuration
+DEFAULT_NODE_VCPUS = 4
+
+
+def parse_duration(value):
+    """Return the seconds of a duration like "1h 26m 32s" or a number."""
+    if isinstance(value, (int, float)):
+        return float(value)
+
+    units = {"h": 3600, "m": 60, "s": 1}
+    matches = re.findall(r"(\d+(?:\.\d+)?)\s*([hms])", str(value or ""))
+    return float(sum(float(num) * units[unit] for num, unit in matches)) or None
+
+
+def suite_key(suite):
+    """Return the key identifying the suite, its file name without extension."""
+    return os.path.splitext(os.path.basename(suite.split("::")[0].rstrip("/")))[0]
+
+
+def load_history(paths):
+    """
+    Collect the durations of the past suite runs.
+
+    Args:
+        paths: directories having the run_summary.json or xunit.xml files of
+               the past runs, searched recursively
+
+    Returns:
+        dictionary of the durations in seconds keyed by suite_key
+    """
+    history = dict()
+    for path in paths:
+        for summary in iglob(
+            os.path.join(path, "**", "run_summary.json"), recursive=True
+        ):
+            try:
+                with open(summary) as fh:
+                    data = json.load(fh)
+            except (OSError, ValueError):
+                continue
+
+            if data.get("suite") and data.get("duration"):
+                history.setdefault(suite_key(data["suite"]), []).append(
+                    float(data["duration"])
+                )
+
+        for xunit in iglob(os.path.join(path, "**", "xunit.xml"), recursive=True):
+            try:
+                root = ET.parse(xunit).getroot()
+            except (OSError, ET.ParseError):
+                continue
+
+            suites = [root] if root.tag == "testsuite" else root.iter("testsuite")
+            for suite in suites:
+                duration = sum(
+                    float(case.get("time") or 0) for case in suite.iter("testcase")
+                )
+                if suite.get("name") and duration:
+                    history.setdefault(suite.get("name"), []).append(duration)
+
+    return history
+
+
+def estimate_duration(suite, history):
+    """Return the expected duration of the pipeline suite in seconds."""
+    durations = history.get(suite_key(suite["suite"]))
+    if durations:
+        return median(durations)
+
+    return parse_duration(suite.get("execution_time")) or DEFAULT_DURATION
+
+
+def count_nodes(conf_file, node_vcpus=DEFAULT_NODE_VCPUS):
+    """
+    Return the number of VMs and vCPUs required by the global configuration.
+
+    Args:
+        conf_file: global configuration file, relative to the repository
+        node_vcpus: vCPUs of a node not having the cpu key
+
+    Returns:
+        tuple of the node and vCPU count, (1, node_vcpus) when not known
+    """
+    try:
+        with open(os.path.join(REPO_DIR, conf_file)) as fh:
+            conf = yaml.safe_load(fh) or {}
+    except (OSError, TypeError, yaml.YAMLError):
+        return 1, node_vcpus
+
+    nodes, vcpus = 0, 0
+    for cluster in conf.get("globals") or []:
+        for key, node in (cluster.get("ceph-cluster") or {}).items():
+            if not key.startswith("node") or not isinstance(node, dict):
+                continue
+
+            nodes += 1
+            vcpus += int(node.get("cpu") or node_vcpus)
+
+    return (nodes, vcpus) if nodes else (1, node_vcpus)
+
+
+def plan_waves(suites, history, max_nodes=None, max_vcpus=None, node_vcpus=None):
+    """
+    Pack the suites into waves fitting the quota.
+
+    The suites are placed longest first into the first wave having room for
+    them, a suite needing more than the quota is given a wave of its own.
+
+    Args:
+        suites: pipeline suites of the metadata file
+        history: durations returned by load_history
+        max_nodes: maximum number of VMs of a wave
+        max_vcpus: maximum number of vCPUs of a wave
+        node_vcpus: vCPUs of a node not having the cpu key
+
+    Returns:
+        list of waves, each a list of the suites
+    """
+    node_vcpus = node_vcpus or DEFAULT_NODE_VCPUS
+    jobs = []
+    for suite in suites:
+        nodes, vcpus = count_nodes(suite.get("global-conf"), node_vcpus)
+        jobs.append((estimate_duration(suite, history), nodes, vcpus, suite))
+
+    waves = []
+    for _, nodes, vcpus, suite in sorted(jobs, key=lambda job: job[0], reverse=True):
+        for wave in waves:
+            if (not max_nodes or wave["nodes"] + nodes <= max_nodes) and (
+                not max_vcpus or wave["vcpus"] + vcpus <= max_vcpus
+            ):
+                break
+        else:
+            wave = {"nodes": 0, "vcpus": 0, "suites": []}
+            waves.append(wave)
+
+        wave["nodes"] += nodes
+        wave["vcpus"] += vcpus
+        wave["suites"].append(suite)
+
+    return [wave["suites"] for wave in waves]
+
+
+def save_plan(path, waves):
+    """
+    Write the names of the suites of every wave to the plan file.
+
+    Args:
+        path: plan file shared by the stages of the pipeline
+        waves: waves returned by plan_waves
+    """
+    with open(path, "w") as fh:
+        json.dump([[suite["name"] for suite in wave] for wave in waves], fh, indent=2)
+
+
+def load_plan(path, suites):
+    """
+    Return the waves of the plan file.
+
+    Args:
+        path: plan file written by save_plan
+        suites: pipeline suites of the metadata file
+
+    Returns:
+        list of waves, each a list of the suites, the suites missing in the
+        metadata file are skipped
+    """
+    with open(path) as fh:
+        plan = json.load(fh)
+
+    by_name = {suite["name"]: suite for suite in suites}
+    return [[by_name[name] for name in wave if name in by_name] for wave in plan]
@@ -0,0 +1,248 @@
+"""Dependency aware execution of the suite tests.
+
+The tests of a suite run one after the other unless they declare what they
+depend on. A test having the depends-on key waits only for the listed tests,
+the ones without it depend on the test preceding them, hence the existing
+suites run unchanged. Tests also hold resources while running, two tests
+sharing a resource never run at the same time, e.g.
+
+    tests:
+      - test:
+          name: Create pools
+          id: pools
+          module: test_pools.py
+      - test:
+          name: RBD IO
+          module: test_rbd_io.py
+          depends-on: [pools]
+          resources: [pool:rbd]
+      - test:
+          name: RGW IO
+          module: test_rgw_io.py
+          depends-on: [pools]
+          resources: [pool:rgw]
+
+The abort-on-fail key of a failed test stops the tests depending on it,
+directly or indirectly, while the independent tests carry on.
+"""
+
+import gevent
+from gevent.queue import Queue
+
+from utility.log import Log
+
+log = Log(__name__)
+
+# Resource held by the tests that must run alone, like destroy-cluster
+EXCLUSIVE = "*"
+
+
+class SuiteTest:
+    """Node of the suite test graph."""
+
+    def __init__(
+        self, name, index, depends_on=None, resources=None, abort_on_fail=False
+    ):
+        """
+        Initialize the node.
+
+        Args:
+            name: unique name of the test, referred by depends-on
+            index: position of the test in the suite
+            depends_on: names of the tests to complete before this one
+            resources: names of the resources held while running
+            abort_on_fail: do not run the dependent tests when this one fails
+        """
+        self.name = name
+        self.index = index
+        self.depends_on = list(depends_on or [])
+        self.resources = set(resources or [EXCLUSIVE])
+        self.abort_on_fail = abort_on_fail
+        self.status = "pending"
+        self.rc = None
+
+    def __repr__(self):
+        return f"<SuiteTest {self.name} ({self.status})>"
+
+
+def build_graph(tests, names, default_resources=None):
+    """
+    Return the graph of the suite tests.
+
+    Args:
+        tests: test dictionaries of the suite
+        names: unique name of every test, used when the test has no id
+        default_resources: callable returning the resources of a test not
+                           declaring them, the test runs alone by default
+
+    Returns:
+        list of SuiteTest in the suite order
+    """
+    nodes, aliases = [], dict()
+    for index, (test, name) in enumerate(zip(tests, names)):
+        node_name = str(test.get("id", name))
+        if "depends-on" in test:
+            depends_on = test["depends-on"] or []
+            if isinstance(depends_on, str):
+                depends_on = [depends_on]
+        else:
+            depends_on = [nodes[-1].name] if nodes else []
+
+        resources = test.get("resources")
+        if test.get("destroy-cluster") or test.get("recreate-cluster"):
+            resources = [EXCLUSIVE]
+        elif resources is None and default_resources:
+            resources = default_resources(test)
+
+        nodes.append(
+            SuiteTest(
+                node_name,
+                index,
+                depends_on=depends_on,
+                resources=resources,
+                abort_on_fail=test.get("abort-on-fail", False),
+            )
+        )
+        aliases.setdefault(test.get("name"), node_name)
+
+    known = {node.name for node in nodes}
+    for node in nodes:
+        node.depends_on = [
+            dep if dep in known else aliases.get(dep, dep) for dep in node.depends_on
+        ]
+
+    return nodes
+
+
+class SuiteScheduler:
+    """Run the suite tests concurrently honouring their dependencies."""
+
+    def __init__(self, nodes, max_workers=1):
+        """
+        Initialize the scheduler.
+
+        Args:
+            nodes: SuiteTest objects returned by build_graph
+            max_workers: maximum number of tests running at a time
+
+        Raises:
+            ValueError: when a dependency is unknown or cyclic
+        """
+        self.nodes = nodes
+        self.by_name = {node.name: node for node in nodes}
+        self.max_workers = max(int(max_workers or 1), 1)
+        self._validate()
+
+    def _validate(self):
+        for node in self.nodes:
+            unknown = [dep for dep in node.depends_on if dep not in self.by_name]
+            if unknown:
+                raise ValueError(f"{node.name} depends on unknown tests {unknown}")
+
+        visiting, visited = set(), set()
+
+        def _visit(node, path):
+            if node.name in visited:
+                return
+            if node.name in visiting:
+                raise ValueError(f"Cyclic test dependency {' -> '.join(path)}")
+
+            visiting.add(node.name)
+            for dep in node.depends_on:
+                _visit(self.by_name[dep], path + [dep])
+            visiting.discard(node.name)
+            visited.add(node.name)
+
+        for node in self.nodes:
+            _visit(node, [node.name])
+
+    def _block_dependents(self):
+        """Mark the tests depending on an aborted or blocked test as blocked."""
+        changed = True
+        while changed:
+            changed = False
+            for node in self.nodes:
+                if node.status != "pending":
+                    continue
+
+                failed = [
+                    dep
+                    for dep in node.depends_on
+                    if self.by_name[dep].status in ("aborted", "blocked")
+                ]
+                if failed:
+                    log.info(f"Not running {node.name}, it depends on {failed}")
+                    node.status = "blocked"
+                    changed = True
+
+    def _ready(self):
+        """Return the pending tests whose dependencies are complete."""
+        return [
+            node
+            for node in self.nodes
+            if node.status == "pending"
+            and all(self.by_name[dep].status == "done" for dep in node.depends_on)
+        ]
+
+    @staticmethod
+    def _execute(execute, node, done):
+        try:
+            done.put((node, execute(node), None))
+        except BaseException as err:  # noqa
+            done.put((node, None, err))
+
+    def run(self, execute):
+        """
+        Run the tests.
+
+        Args:
+            execute: callable running the given SuiteTest and returning its
+                     return code, 0 on pass, -1 when skipped
+
+        Returns:
+            list of the SuiteTest objects having their status and rc
+
+        Raises:
+            the first exception raised by execute, after the running tests end
+        """
+        done = Queue()
+        running = dict()
+        held = set()
+        error = None
+
+        while True:
+            self._block_dependents()
+            for node in self._ready() if error is None else []:
+                if len(running) >= self.max_workers:
+                    break
+
+                if EXCLUSIVE in node.resources and running:
+                    # keep the suite order, later tests wait for this one
+                    break
+
+                if EXCLUSIVE in held or node.resources & held:
+                    continue
+
+                node.status = "running"
+                held |= node.resources
+                running[node.name] = gevent.spawn(self._execute, execute, node, done)
+
+            if not running:
+                break
+
+            node, rc, err = done.get()
+            running.pop(node.name)
+            held -= node.resources
+            node.rc = rc
+            node.status = "done"
+            if err is not None:
+                node.status = "aborted"
+                error = error or err
+            elif rc not in (0, -1) and node.abort_on_fail:
+                log.info(f"Aborting the tests depending on {node.name}")
+                node.status = "aborted"
+
+        if error is not None:
+            raise error
+
+        return self.nodes
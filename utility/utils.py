@@ -23,13 +23,16 @@ from cryptography.hazmat.primitives import hashes, serialization
 from cryptography.hazmat.primitives.asymmetric import rsa
 from cryptography.x509.oid import NameOID
 from jinja2 import Environment, FileSystemLoader, select_autoescape
-from jinja_markdown import MarkdownExtension
-from reportportal_client import ReportPortalService
 
+from utility.lazy_import import lazy_import
 from utility.log import Log
 
 log = Log(__name__)
 
+# Reporting dependencies are imported only when the results are reported
+jinja_markdown = lazy_import("jinja_markdown")
+reportportal_client = lazy_import("reportportal_client")
+
 # variables
 mounting_dir = "/mnt/cephfs/"
 clients = []
@@ -873,7 +876,7 @@ def create_report_portal_session():
     cfg = get_cephci_config()["report-portal"]
 
     try:
-        return ReportPortalService(
+        return reportportal_client.ReportPortalService(
             endpoint=cfg["endpoint"],
             project=cfg["project"],
             token=cfg["token"],
@@ -1079,7 +1082,7 @@ def email_results(test_result):
         results_list = test_result["result"]
     except KeyError as kerr:
         log.error(f"Key not found : {kerr}")
-        exit(1)
+        return
 
     run_name = "cephci-run-{id}".format(id=run_id)
     msg = MIMEMultipart("alternative")
@@ -1092,7 +1095,10 @@ def email_results(test_result):
     )
 
     test_result["run_name"] = run_name
-    html = create_html_file(test_result=test_result)
+    try:
+        html = create_html_file(test_result=test_result)
+    except KeyError:
+        return
     part1 = MIMEText(html, "html")
     msg.attach(part1)
 
@@ -1160,6 +1166,9 @@ def create_html_file(test_result) -> str:
         info (dict): General information about the test run
 
     Returns: HTML file
+
+    Raises:
+        KeyError: when a required key is missing in test_result
     """
     try:
         run_name = test_result["run_name"]
@@ -1171,7 +1180,7 @@ def create_html_file(test_result) -> str:
         prefix = test_result["prefix"]
     except KeyError as kerr:
         log.error(f"Key not found : {kerr}")
-        exit(1)
+        raise
 
     # Check for cluster info
     cluster_info = test_result.get("cluster_info", None)
@@ -1186,7 +1195,7 @@ def create_html_file(test_result) -> str:
     template_dir = os.path.join(project_dir, "templates")
 
     jinja_env = Environment(
-        extensions=[MarkdownExtension],
+        extensions=[jinja_markdown.MarkdownExtension],
         loader=FileSystemLoader(template_dir),
         autoescape=select_autoescape(["html", "xml"]),
     )
@@ -1548,7 +1557,7 @@ class ReportPortal:
 
         if access:
             try:
-                self.client = ReportPortalService(
+                self.client = reportportal_client.ReportPortalService(
                     endpoint=access["endpoint"],
                     project=access["project"],
                     token=access["token"],
@@ -2050,6 +2059,34 @@ def run_fio(**fio_args):
     One of device_name, filename, (rbdname,pool) is required.
     """
     log.debug(f"Config Received for fio: {fio_args}")
+    cmd_args = build_fio_args(**fio_args)
+
+    # Execute FIO
+    exec_args = {
+        "cmd": f"fio {config_dict_to_string(cmd_args)}",
+        "long_running": fio_args.get("long_running", False),
+        "sudo": True,
+    }
+
+    if fio_args.get("get_time_taken"):
+        exec_args["cmd"] = f"time {exec_args['cmd']}"
+    if fio_args.get("cmd_timeout"):
+        exec_args.update({"timeout": fio_args["cmd_timeout"]})
+
+    out = fio_args["client_node"].exec_command(**exec_args)
+    if fio_args.get("output_format"):
+        return cmd_args["output"]
+    return out
+
+
+def build_fio_args(**fio_args):
+    """Build the fio options from the run_fio arguments.
+
+    Args:
+        fio_args: arguments supported by run_fio
+    Returns:
+        dictionary of fio options
+    """
     cmd_args = {}
     if fio_args.get("filename"):
         file_name = fio_args["filename"]
@@ -2114,22 +2151,7 @@ def run_fio(**fio_args):
             fio_file = f"{fio_args['output_dir']}/{fio_file}"
         cmd_args.update({"output-format": output_fmt, "output": fio_file})
 
-    # Execute FIO
-    exec_args = {
-        "cmd": f"fio {config_dict_to_string(cmd_args)}",
-        "long_running": fio_args.get("long_running", False),
-        "sudo": True,
-    }
-
-    if fio_args.get("get_time_taken"):
-        exec_args["cmd"] = f"time {exec_args['cmd']}"
-    if fio_args.get("cmd_timeout"):
-        exec_args.update({"timeout": fio_args["cmd_timeout"]})
-
-    out = fio_args["client_node"].exec_command(**exec_args)
-    if output_fmt:
-        return cmd_args["output"]
-    return out
+    return cmd_args
 
 
 def fetch_image_tag(rhbuild):